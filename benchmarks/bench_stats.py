@@ -0,0 +1,281 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+import warnings
+
+import numpy as np
+import scipy
+
+from stats.tools.t_test.normality import check_normality_batch
+from stats.tools.t_test.ttest_batch import run_paired_ttest_batch
+from stats.tools.t_test.ttest_logic import (
+    check_normality, run_independent_ttest, run_one_sample_ttest, run_paired_ttest
+)
+
+# ----------------------------------------------------------------
+# 통계 엔진 벤치마크
+# - 표본 크기 n (5 ~ 10^7)과 배치 폭 (1 ~ 10^4)을 바꿔가며 실행 시간과 메모리 측정
+#   · time_s: 여러 번 실행한 시간 중 가장 빠른 값 (잡음에 덜 민감, 큰 입력은 반복 횟수 자동 축소)
+#   · peak_bytes: 실행 중 최대 추가 메모리 (tracemalloc, NumPy 배열 포함)
+#   · retained_bytes: 실행 후에도 남아 있는 메모리 (캐시 등)
+#   · retained_blocks: 실행 후에도 남아 있는 메모리 블록 수 (tracemalloc 스냅숏 비교)
+#     tracemalloc은 실행 중에 할당했다가 해제한 횟수를 세지 않음 → 총 할당 횟수 대신 남은 블록 수를 기록
+# - 결과를 baseline.json과 비교해서 느려지거나 메모리가 늘어난 항목을 표시
+# - 결과 캐시는 끄고(cache=False) 매번 실제 계산을 측정
+#
+# 사용법 (저장소 최상위에서):
+#   python -m benchmarks.bench_stats                 전체 실행 후 기준값과 비교
+#   python -m benchmarks.bench_stats --quick         n ≤ 10^5, 폭 ≤ 10^3만 실행
+#   python -m benchmarks.bench_stats --only paired   이름에 "paired"가 들어간 항목만
+#   python -m benchmarks.bench_stats --save          현재 결과를 기준값으로 저장
+#   python -m benchmarks.bench_stats --check         회귀가 있으면 종료 코드 1
+# ----------------------------------------------------------------
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+SIZES = (5, 50, 500, 5_000, 50_000, 500_000, 5_000_000, 10_000_000)
+WIDTHS = (1, 10, 100, 1_000, 10_000)
+BATCH_N = 50  # 배치 폭 측정 시 변수당 표본 크기
+QUICK_MAX_N = 100_000
+QUICK_MAX_WIDTH = 1_000
+
+TIME_TOLERANCE = 0.50    # 기준보다 50% 넘게 느리면 회귀
+MEMORY_TOLERANCE = 0.10  # 기준보다 10% 넘게 메모리를 더 쓰면 회귀
+MIN_TIME_S = 1e-4        # 이보다 짧은 측정은 잡음이 커서 시간 비교 제외
+
+# ----------------------------
+# 1. 측정 대상
+# ----------------------------
+
+# 각 항목: 이름 → (매개변수 이름, 매개변수 목록, 준비 함수)
+# 준비 함수는 입력 데이터를 만들고 측정할 호출(인자 없는 함수)을 반환 (데이터 생성은 측정에서 제외)
+
+def _normality(n, rng):
+    data = rng.normal(size=n)
+    return lambda: check_normality(data, cache=False)
+
+def _paired(n, rng):
+    before = rng.normal(size=n)
+    after = before + rng.normal(0.1, 1, size=n)
+    return lambda: run_paired_ttest(before, after, return_dict=True, cache=False)
+
+def _independent_student(n, rng):
+    group1 = rng.normal(0, 1, size=n)
+    group2 = rng.normal(0.2, 1, size=n)
+    return lambda: run_independent_ttest(group1, group2, cache=False)
+
+def _independent_welch(n, rng):
+    group1 = rng.normal(0, 1, size=n)
+    group2 = rng.normal(0.2, 3, size=n + 1)
+    return lambda: run_independent_ttest(group1, group2, cache=False)
+
+def _one_sample(n, rng):
+    sample = rng.normal(0.1, 1, size=n)
+    return lambda: run_one_sample_ttest(sample, 0, cache=False)
+
+def _normality_batch(width, rng):
+    groups = rng.normal(size=(width, BATCH_N))
+    return lambda: check_normality_batch(groups)
+
+def _paired_batch(width, rng):
+    before = rng.normal(size=(BATCH_N, width))
+    after = before + rng.normal(0.1, 1, size=(BATCH_N, width))
+    return lambda: run_paired_ttest_batch(before, after)
+
+
+CASES = {
+    "check_normality": ("n", SIZES, _normality),
+    "run_paired_ttest": ("n", SIZES, _paired),
+    "run_independent_ttest[student]": ("n", SIZES, _independent_student),
+    "run_independent_ttest[welch]": ("n", SIZES, _independent_welch),
+    "run_one_sample_ttest": ("n", SIZES, _one_sample),
+    "check_normality_batch": ("width", WIDTHS, _normality_batch),
+    "run_paired_ttest_batch": ("width", WIDTHS, _paired_batch)
+}
+
+# ----------------------------
+# 2. 측정
+# ----------------------------
+
+# 반복 횟수: 첫 실행 시간에 맞춰 총 0.5초 안팎이 되도록 (1 ~ 50회)
+def _repeats(first_time):
+    if first_time <= 0:
+        return 50
+    return int(min(50, max(1, 0.5 / first_time)))
+
+
+# tracemalloc 자체가 만든 블록은 제외
+def _snapshot():
+    return tracemalloc.take_snapshot().filter_traces((tracemalloc.Filter(False, tracemalloc.__file__),))
+
+
+def measure(call):
+    # 워밍업 겸 첫 측정 (임포트, 계수 캐시 등 1회성 비용 제외)
+    start = time.perf_counter()
+    call()
+    first_time = time.perf_counter() - start
+
+    times = []
+    for _ in range(_repeats(first_time)):
+        start = time.perf_counter()
+        call()
+        times.append(time.perf_counter() - start)
+
+    # 메모리는 별도 1회 실행으로 측정 (tracemalloc 오버헤드가 시간 측정에 섞이지 않도록)
+    tracemalloc.start()
+    _snapshot().compare_to(_snapshot(), "filename")  # 스냅숏 비교의 1회성 캐시가 결과에 섞이지 않도록 먼저 실행
+    before_snapshot = _snapshot()
+    before_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    call()
+    after_bytes, peak_bytes = tracemalloc.get_traced_memory()
+    after_snapshot = _snapshot()
+    tracemalloc.stop()
+    retained_blocks = sum(stat.count_diff for stat in after_snapshot.compare_to(before_snapshot, "filename"))
+
+    return {
+        "time_s": float(min(times)),
+        "repeats": len(times),
+        "peak_bytes": int(peak_bytes - before_bytes),
+        "retained_bytes": int(after_bytes - before_bytes),
+        "retained_blocks": int(retained_blocks)
+    }
+
+
+def run_benchmarks(quick=False, only=None, seed=0, log=print):
+    results = {}
+    for name, (param, values, setup) in CASES.items():
+        if only and only not in name:
+            continue
+        limit = QUICK_MAX_N if param == "n" else QUICK_MAX_WIDTH
+        results[name] = {}
+        for value in values:
+            if quick and value > limit:
+                continue
+            call = setup(value, np.random.default_rng(seed))
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                result = measure(call)
+            results[name][str(value)] = result
+            log(f"{name:<34} {param}={value:<10} {_format_time(result['time_s']):>10} "
+                f"peak {_format_bytes(result['peak_bytes']):>10} retained {result['retained_blocks']:>6} blocks")
+    return results
+
+# ----------------------------
+# 3. 기준값 비교 / 저장
+# ----------------------------
+
+def environment():
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "scipy": scipy.__version__,
+        "machine": platform.machine(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count()
+    }
+
+
+def load_baseline(path=BASELINE_PATH):
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_baseline(results, path=BASELINE_PATH):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"environment": environment(), "results": results}, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+# 반환값: 회귀 항목 리스트 [(이름, 매개변수 값, 지표, 기준값, 현재값), ...]
+def compare(results, baseline, time_tolerance=TIME_TOLERANCE, memory_tolerance=MEMORY_TOLERANCE):
+    regressions = []
+    for name, by_value in results.items():
+        base_by_value = baseline["results"].get(name, {})
+        for value, current in by_value.items():
+            base = base_by_value.get(value)
+            if base is None:
+                continue
+            if max(base["time_s"], current["time_s"]) >= MIN_TIME_S and \
+                    current["time_s"] > base["time_s"] * (1 + time_tolerance):
+                regressions.append((name, value, "time_s", base["time_s"], current["time_s"]))
+            if current["peak_bytes"] > base["peak_bytes"] * (1 + memory_tolerance) + 4096:
+                regressions.append((name, value, "peak_bytes", base["peak_bytes"], current["peak_bytes"]))
+    return regressions
+
+
+def _format_time(seconds):
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f} µs"
+    if seconds < 1:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds:.2f} s"
+
+
+def _format_bytes(nbytes):
+    for unit in ("B", "KB", "MB"):
+        if abs(nbytes) < 1024:
+            return f"{nbytes:.0f} {unit}"
+        nbytes /= 1024
+    return f"{nbytes:.1f} GB"
+
+
+def _format_value(metric, value):
+    return _format_time(value) if metric == "time_s" else _format_bytes(value)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the t-test engine and compare with stored baselines.")
+    parser.add_argument("--quick", action="store_true", help=f"only n ≤ {QUICK_MAX_N} and width ≤ {QUICK_MAX_WIDTH}")
+    parser.add_argument("--only", help="run only cases whose name contains this text")
+    parser.add_argument("--save", action="store_true", help="store the results as the new baseline")
+    parser.add_argument("--check", action="store_true", help="exit with status 1 if any regression is found")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline JSON path")
+    parser.add_argument("--output", help="also write the results to this JSON file")
+    parser.add_argument("--time-tolerance", type=float, default=TIME_TOLERANCE,
+                        help="allowed relative slowdown before flagging (default: %(default)s)")
+    parser.add_argument("--memory-tolerance", type=float, default=MEMORY_TOLERANCE,
+                        help="allowed relative peak-memory growth before flagging (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(quick=args.quick, only=args.only)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"environment": environment(), "results": results}, f, indent=2, sort_keys=True)
+
+    if args.save:
+        baseline = load_baseline(args.baseline) or {"results": {}}
+        merged = baseline["results"]
+        for name, by_value in results.items():
+            merged.setdefault(name, {}).update(by_value)
+        save_baseline(merged, args.baseline)
+        print(f"\nBaseline saved to {args.baseline}")
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    if baseline is None:
+        print(f"\nNo baseline at {args.baseline} (run with --save to create one).")
+        return 0
+    if baseline.get("environment") != environment():
+        print("\n⚠️ Baseline was recorded on a different environment; timings may not be comparable.")
+
+    regressions = compare(results, baseline, args.time_tolerance, args.memory_tolerance)
+    if not regressions:
+        print("\nNo regressions against baseline.")
+        return 0
+
+    print(f"\n{len(regressions)} regression(s) against baseline:")
+    for name, value, metric, base, current in regressions:
+        print(f"- {name} [{value}] {metric}: {_format_value(metric, base)} → {_format_value(metric, current)} "
+              f"({current / base:.2f}x)")
+    return 1 if args.check else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,21 +1,68 @@
+import importlib
+import multiprocessing
+import threading
+from time import perf_counter
+
 import flet as ft
 
-# 홈 페이지
+# 홈 페이지 (가벼운 모듈이라 첫 화면용으로 바로 불러옴)
 from home import home_view
 
-# 통계 메뉴 페이지
-from stats.statistics import statistics_view
+# 통계 도구 단계별 시간 기록 (표준 라이브러리만 사용하는 가벼운 모듈)
+from stats.tools.t_test.instrumentation import registry
+
+# 경로별 화면 캐시 (한 번 만든 View를 재사용해서 입력값/편집 상태 유지, 세션마다 하나)
+from view_cache import ViewCache
+
+# ----------------------------------------------------------------
+# 경로별 화면 모듈은 처음 이동할 때 불러옴 (lazy import)
+# - SciPy / NumPy / python-docx 같은 무거운 의존성이 홈 화면 표시를 늦추지 않도록 함
+# - 경로별 첫 import 시간은 ROUTE_IMPORT_TIMES와 registry("routes")에 기록
+#   (Paired t-test 화면의 진단 패널이나 registry.to_json()으로 확인)
+# ----------------------------------------------------------------
+
+# 경로 → (모듈 경로, 뷰 함수 이름)
+ROUTES = {
+    "/statistics": ("stats.statistics", "statistics_view"),             # 통계 메뉴 페이지
+    "/paired_two": ("stats.tools.t_test.paired_two", "paired_view"),    # t-test 분석 도구 (Paired t-test)
+    "/table": ("table.views.editor_view", "table_editor_view")          # 테이블 편집기 (APA 기본 템플릿)
+}
+
+ROUTE_IMPORT_TIMES = {}  # 경로 → 첫 import에 걸린 시간(초)
+_view_functions = {"/": home_view}
 
-# t-test 분석 도구 (Paired t-test)
-from stats.tools.t_test.paired_two import paired_view
 
-# 테이블 편집기 (APA 기본 템플릿)
-from table.views.editor_view import table_editor_view
+# 경로에 해당하는 뷰 함수 반환 (처음 요청 시 모듈을 불러오고 시간 기록)
+def load_view(route):
+    view_function = _view_functions.get(route)
+    if view_function is None and route in ROUTES:
+        module_name, function_name = ROUTES[route]
+        start = perf_counter()
+        module = importlib.import_module(module_name)
+        seconds = perf_counter() - start
+        view_function = _view_functions[route] = getattr(module, function_name)
+        ROUTE_IMPORT_TIMES[route] = seconds
+        registry.record("routes", {f"import {route}": {"seconds": seconds, "calls": 1, "size": None}})
+    return view_function
+
+# 첫 화면 표시 후 백그라운드에서 통계 엔진 미리 준비 (SciPy 초기화, 정규성 검정 계수 등)
+# 실패해도 앱 동작에는 영향 없음 (첫 Run 클릭 때 그냥 그 자리에서 초기화됨)
+def warm_up():
+    try:
+        start = perf_counter()
+        importlib.import_module("stats.tools.t_test.ttest_logic").warm_up()
+        registry.record("routes", {"warm_up": {"seconds": perf_counter() - start, "calls": 1, "size": None}})
+    except Exception as e:
+        print(f"⚠️ Warm-up skipped: {e}")
+
 
 def main(page: ft.Page):
     # 페이지 제목 설정 (브라우저 탭이나 앱 상단에 표시됨)
     page.title = "StatStas"
 
+    # 이 세션(page)에서 만든 화면만 보관하는 캐시
+    view_cache = ViewCache()
+
     # 경로(route)가 바뀔 때 실행되는 콜백 함수 정의
     def route_change(e):
         # e가 route 속성을 가지고 있으면 route 값을 꺼내고,
@@ -25,15 +72,11 @@ def main(page: ft.Page):
         # 현재 페이지 뷰를 모두 초기화
         page.views.clear()
 
-        # 경로에 따라 각 뷰 함수 호출
-        if route == "/":
-            page.views.append(home_view(page))          # 홈 화면
-        elif route == "/statistics":
-            page.views.append(statistics_view(page))    # 통계 도구 검색 화면
-        elif route == "/paired_two":
-            page.views.append(paired_view(page))        # Paired t-test 실행 화면
-        elif route == "/table":
-            page.views.append(table_editor_view(page))   # 테이블 편집기 화면 (APA 템플릿 고정)
+        # 경로에 따라 뷰 함수 호출 (등록되지 않은 경로는 빈 화면)
+        # 이미 만든 화면은 캐시에서 꺼내 재사용 (view_cache.invalidate(route)로 다시 만들도록 지정 가능)
+        view_function = load_view(route)
+        if view_function is not None:
+            page.views.append(view_cache.get_or_build(route, lambda: view_function(page)))
 
     # 페이지에 라우트 변경 이벤트 핸들러 연결
     page.on_route_change = route_change
@@ -44,5 +87,10 @@ def main(page: ft.Page):
     # 실제 라우팅을 시작 (첫 화면으로 진입)
     page.go(page.route)
 
+    # 첫 화면이 그려진 뒤 통계 엔진 워밍업 시작
+    threading.Thread(target=warm_up, name="stats-warm-up", daemon=True).start()
+
 # Flet 앱 실행: main 함수가 entry point 역할
-ft.app(target=main)
+if __name__ == "__main__":
+    multiprocessing.freeze_support()  # 실행 파일로 묶었을 때 재표집 워커 프로세스가 앱을 다시 띄우지 않도록
+    ft.app(target=main)
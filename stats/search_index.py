@@ -0,0 +1,103 @@
+import re
+from collections import Counter, defaultdict
+
+# ----------------------------------------------------------------
+# 통계 도구 검색 인덱스
+# - 도구 목록(stat_tests)을 한 번만 색인하고, 검색할 때는 인덱스만 조회
+#   · 접두어(prefix) 사전: "pai" → "paired"가 들어 있는 도구
+#   · 3-gram 사전: 오타/순서 바뀜 허용 ("pairde" → "paired")
+# - 검색 대상 필드와 가중치: label > aliases > description
+# - 점수: 검색어 단어마다 도구별 최고 점수를 더해서 높은 순 정렬
+#   · 정확히 일치 1.0, 접두어 일치 0.6 ~ 1.0 (길게 일치할수록 높음), 3-gram 유사도 × 0.8
+#   · 여러 단어 중 하나도 맞지 않는 단어가 있으면 점수를 깎음 (모두 맞는 도구가 위로)
+# ----------------------------------------------------------------
+
+FIELD_WEIGHTS = {"label": 3.0, "aliases": 2.0, "description": 1.0}
+MIN_SIMILARITY = 0.3   # 이보다 낮은 3-gram 유사도(Jaccard)는 일치로 보지 않음
+FUZZY_FACTOR = 0.8     # 3-gram 일치는 접두어 일치보다 약간 낮게
+MISSING_PENALTY = 0.5  # 맞지 않는 검색어 단어가 있으면 점수에 곱함 (단어마다)
+
+_TOKEN_PATTERN = re.compile(r"[^\W_]+")
+
+
+def tokenize(text):
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def trigrams(token):
+    padded = f"  {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class SearchIndex:
+    # entries: {"label", "route", 선택: "aliases"(리스트), "description"} 딕셔너리 리스트
+    def __init__(self, entries):
+        self.entries = list(entries)
+        self._terms = []                   # 단어 번호 → (단어, 도구 번호, 가중치)
+        self._term_trigrams = []           # 단어 번호 → 3-gram 집합
+        self._prefixes = defaultdict(set)  # 접두어 → 단어 번호 집합
+        self._trigrams = defaultdict(list) # 3-gram → 단어 번호 리스트
+
+        for entry_id, entry in enumerate(self.entries):
+            # 같은 도구 안에서 같은 단어가 여러 필드에 있으면 가장 높은 가중치만 사용
+            weights = {}
+            for field, weight in FIELD_WEIGHTS.items():
+                value = entry.get(field) or ""
+                texts = value if isinstance(value, (list, tuple)) else [value]
+                for text in texts:
+                    for token in tokenize(text):
+                        weights[token] = max(weights.get(token, 0.0), weight)
+
+            for token, weight in weights.items():
+                term_id = len(self._terms)
+                self._terms.append((token, entry_id, weight))
+                grams = trigrams(token)
+                self._term_trigrams.append(grams)
+                for gram in grams:
+                    self._trigrams[gram].append(term_id)
+                for end in range(1, len(token) + 1):
+                    self._prefixes[token[:end]].add(term_id)
+
+    # 검색어 단어 하나에 대한 도구별 최고 점수
+    def _token_scores(self, token):
+        scores = {}
+
+        def add(term_id, score):
+            _, entry_id, weight = self._terms[term_id]
+            score *= weight
+            if score > scores.get(entry_id, 0.0):
+                scores[entry_id] = score
+
+        for term_id in self._prefixes.get(token, ()):
+            term = self._terms[term_id][0]
+            add(term_id, 0.6 + 0.4 * len(token) / len(term))
+
+        query_grams = trigrams(token)
+        shared = Counter(term_id for gram in query_grams for term_id in self._trigrams.get(gram, ()))
+        for term_id, count in shared.items():
+            similarity = count / (len(query_grams) + len(self._term_trigrams[term_id]) - count)
+            if similarity >= MIN_SIMILARITY:
+                add(term_id, FUZZY_FACTOR * similarity)
+        return scores
+
+    # 반환값: 점수 높은 순 도구 딕셔너리 리스트 (최대 limit개)
+    def search(self, query, limit=5):
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+
+        totals = defaultdict(float)
+        matched = defaultdict(int)
+        for token in tokens:
+            for entry_id, score in self._token_scores(token).items():
+                totals[entry_id] += score
+                matched[entry_id] += 1
+
+        ranked = sorted(
+            totals,
+            key=lambda entry_id: (
+                -totals[entry_id] * MISSING_PENALTY ** (len(tokens) - matched[entry_id]),
+                self.entries[entry_id]["label"]
+            )
+        )
+        return [self.entries[entry_id] for entry_id in ranked[:limit]]
@@ -1,5 +1,18 @@
-# statistics 페이지 검색 결과에 뜨는 통계툴 리스트 
+# statistics 페이지 검색 결과에 뜨는 통계툴 리스트
+# label: 검색 결과 버튼에 표시되는 이름, route: 이동할 경로
+# aliases / description (선택): 검색에만 쓰이는 다른 이름과 설명 (stats.search_index에서 색인)
 stat_tests = [
-    {"label": "Paired t-test (Two-tailed)", "route": "/paired_two"},
+    {
+        "label": "Paired t-test (Two-tailed)",
+        "route": "/paired_two",
+        "aliases": [
+            "Dependent t-test",
+            "Dependent samples t-test",
+            "Repeated measures t-test",
+            "Matched pairs t-test",
+            "Within-subjects t-test"
+        ],
+        "description": "Compare the means of two related measurements (before / after, pre / post)."
+    },
     # 향후 더 추가 가능
-]
\ No newline at end of file
+]
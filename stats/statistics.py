@@ -1,48 +1,67 @@
+import threading
+
 import flet as ft
-import difflib
+from stats.search_index import SearchIndex
 from stats.stat_tests import stat_tests  # 통계 테스트 정의된 리스트 불러오기
 
+MAX_SUGGESTIONS = 5     # 검색 결과로 보여줄 최대 버튼 수
+SEARCH_DEBOUNCE_S = 0.15  # 마지막 입력 후 이 시간 동안 입력이 없을 때 검색
+
+# 검색 인덱스는 모듈을 처음 불러올 때 한 번만 생성 (라벨 / 별칭 / 설명 색인)
+search_index = SearchIndex(stat_tests)
+
 # 통계 도구 선택 화면 View 정의 함수
 def statistics_view(page: ft.Page):
-    # 🔷 검색 결과로 보여줄 버튼 리스트 담을 컬럼
-    suggestions = ft.Column()
+    # 🔷 라우트 이동 핸들러 (버튼의 data에 담긴 경로로 이동)
+    def go_to_route(e):
+        page.go(e.control.data)
 
-    # 🔷 라우트 이동용 핸들러 생성 함수
-    def go_to_route(route):
-        def handler(e):
-            page.go(route)
-        return handler
+    # 🔷 검색 결과 버튼은 미리 만들어 두고 글자/경로/표시 여부만 바꿔서 재사용
+    suggestion_buttons = [
+        ft.TextButton(
+            style=ft.ButtonStyle(
+                color=ft.colors.BLUE_700,
+                padding=10,
+            ),
+            on_click=go_to_route,
+            visible=False
+        )
+        for _ in range(MAX_SUGGESTIONS)
+    ]
+    suggestions = ft.Column(controls=suggestion_buttons)
+
+    # 🔷 검색 결과 표시 (인덱스 조회 후 버튼 내용만 갱신)
+    def show_suggestions(query):
+        matches = search_index.search(query, limit=MAX_SUGGESTIONS) if query else []
+        for button, test in zip(suggestion_buttons, matches):
+            button.text = test["label"]
+            button.data = test["route"]
+            button.visible = True
+        for button in suggestion_buttons[len(matches):]:
+            button.visible = False
+        page.update()
 
     # 🔷 검색창 입력 시 호출되는 핸들러 함수
+    # 키를 누를 때마다 검색하지 않고, 입력이 SEARCH_DEBOUNCE_S 동안 멈추면 마지막 값으로 한 번만 검색
+    debounce = {"timer": None}
+    debounce_lock = threading.Lock()
+
+    def run_search():
+        query = search_input.value.strip()
+        show_suggestions(query)
+
     def search_handler(e):
-        query = e.control.value.strip().lower()
-        suggestions.controls.clear()  # 기존 검색 결과 초기화
-
-        if query == "":
-            page.update()
-            return
-
-        labels = [t["label"] for t in stat_tests]  # 전체 검색 가능한 라벨 리스트
-        matches = difflib.get_close_matches(query, labels, n=5, cutoff=0.2)
-
-        if not matches:
-            matches = [label for label in labels if query in label.lower()]
-
-        # 검색 결과에 맞는 버튼 동적으로 생성
-        for match in matches:
-            test = next((t for t in stat_tests if t["label"] == match), None)
-            if test:
-                suggestions.controls.append(
-                    ft.TextButton(
-                        text=test["label"],
-                        style=ft.ButtonStyle(
-                            color=ft.colors.BLUE_700,
-                            padding=10,
-                        ),
-                        on_click=go_to_route(test["route"])
-                    )
-                )
-        page.update()
+        with debounce_lock:
+            if debounce["timer"] is not None:
+                debounce["timer"].cancel()
+            # 입력을 모두 지웠으면 바로 결과 비우기
+            if not e.control.value.strip():
+                debounce["timer"] = None
+                show_suggestions("")
+                return
+            debounce["timer"] = threading.Timer(SEARCH_DEBOUNCE_S, run_search)
+            debounce["timer"].daemon = True
+            debounce["timer"].start()
 
     # 🔶 시그마 로고 (검색창 왼쪽에 배치)
     sigma_logo = ft.Text(
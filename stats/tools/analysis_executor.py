@@ -0,0 +1,103 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# ----------------------------------------------------------------
+# 백그라운드 분석 실행기 (통계 도구 뷰 공용)
+# - 분석 작업을 스레드 풀에서 실행 → Flet 클릭 핸들러/이벤트 루프를 막지 않음
+#   (NumPy/SciPy 연산은 대부분 GIL을 놓으므로 스레드로 충분하고, 결과를 바로 화면에 반영 가능)
+# - 작업은 단계(parsing → normality → test → resampling → report)마다 job.report(phase)로 진행 상황 전달
+# - 취소는 협조적: cancel() 후 다음 단계 보고 시점, 또는 오래 걸리는 단계 안에서 job.check를 부르는
+#   청크 경계(대용량 정규성 검정, 재표집, 정확 검정)에서 AnalysisCancelled 발생
+# - asyncio 코드에서는 `await job`으로 결과 대기 가능
+# ----------------------------------------------------------------
+
+PHASES = ("parsing", "normality", "test", "resampling", "report")
+MAX_WORKERS = 2
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+class AnalysisCancelled(Exception):
+    pass
+
+
+def _get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="analysis")
+        return _executor
+
+# ----------------------------
+# 1. 작업 핸들
+# ----------------------------
+
+class AnalysisJob:
+    def __init__(self, on_progress=None):
+        self.on_progress = on_progress
+        self.phase = None
+        self.future = None
+        self._cancel_event = threading.Event()
+
+    # 취소 요청 (시작 전이면 시작하자마자, 실행 중이면 다음 단계 보고 시점에 중단)
+    def cancel(self):
+        self._cancel_event.set()
+
+    @property
+    def cancelled(self):
+        return self._cancel_event.is_set()
+
+    @property
+    def running(self):
+        return self.future is not None and not self.future.done()
+
+    # 취소되었으면 AnalysisCancelled 발생 (러너의 cancel 인자로 그대로 넘길 수 있음)
+    def check(self):
+        if self._cancel_event.is_set():
+            raise AnalysisCancelled()
+
+    # 단계 진행 보고: on_progress(phase, fraction) 호출 (fraction: 0~1, 단계 시작 기준)
+    # ttest_logic 러너의 progress 인자로 그대로 넘길 수 있음
+    def report(self, phase):
+        self.check()
+        self.phase = phase
+        if self.on_progress is not None:
+            self.on_progress(phase, PHASES.index(phase) / len(PHASES))
+
+    def result(self, timeout=None):
+        return self.future.result(timeout)
+
+    def __await__(self):
+        return asyncio.wrap_future(self.future).__await__()
+
+# ----------------------------
+# 2. 작업 제출
+# ----------------------------
+
+# task(job, *args)를 백그라운드에서 실행
+# on_done(result) / on_error(err) / on_cancel()은 작업 스레드에서 호출됨 (Flet page.update()는 스레드에서 호출 가능)
+def submit(task, *args, on_progress=None, on_done=None, on_error=None, on_cancel=None):
+    job = AnalysisJob(on_progress)
+
+    def run():
+        try:
+            job.check()
+            result = task(job, *args)
+            job.check()
+        except AnalysisCancelled:
+            if on_cancel is not None:
+                on_cancel()
+            return None
+        except Exception as err:
+            if on_error is None:
+                raise
+            on_error(err)
+            return None
+        if on_done is not None:
+            on_done(result)
+        return result
+
+    job.future = _get_executor().submit(run)
+    return job
@@ -0,0 +1,95 @@
+import os
+
+import numpy as np
+
+# ----------------------------------------------------------------
+# 대용량 데이터 파일 불러오기 (통계 도구 뷰 공용)
+# - 지원 형식: CSV, TSV, Parquet, .npy
+# - 선택한 열만 읽고, .npy는 메모리 매핑(mmap)으로 열어 필요한 부분만 페이지 단위로 읽음
+# - 결과는 float64 NumPy 배열로 반환 → 파이썬 리스트 변환 없이 ttest_logic 러너에 바로 전달
+# ----------------------------------------------------------------
+
+SUPPORTED_EXTENSIONS = ("csv", "tsv", "txt", "parquet", "npy")
+
+
+def _extension(path):
+    return os.path.splitext(path)[1].lower().lstrip(".")
+
+# 구분자 추정: .tsv / .txt는 탭, 그 외는 쉼표
+def _separator(path):
+    return "\t" if _extension(path) in ("tsv", "txt") else ","
+
+
+def _open_npy(path):
+    return np.load(path, mmap_mode="r", allow_pickle=False)
+
+# .npy 배열의 열 이름 (구조화 배열이면 필드 이름, 2차원이면 열 번호, 1차원이면 하나)
+def _npy_columns(array):
+    if array.dtype.names:
+        return list(array.dtype.names)
+    if array.ndim == 1:
+        return ["0"]
+    if array.ndim == 2:
+        return [str(j) for j in range(array.shape[1])]
+    raise ValueError(f"Unsupported .npy shape {array.shape}: expected a 1-D or 2-D array.")
+
+# ----------------------------
+# 1. 열 목록 조회 (열 선택 드롭다운용)
+# ----------------------------
+
+def list_columns(path):
+    ext = _extension(path)
+    if ext not in SUPPORTED_EXTENSIONS:
+        raise ValueError(f"Unsupported file type: .{ext}")
+
+    if ext == "npy":
+        return _npy_columns(_open_npy(path))
+
+    if ext == "parquet":
+        # Parquet는 선택적 의존성 (pyarrow) — 스키마만 읽음
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Reading Parquet files requires 'pyarrow' (pip install pyarrow).")
+        return list(pq.ParquetFile(path).schema_arrow.names)
+
+    import pandas as pd
+    header = pd.read_csv(path, sep=_separator(path), nrows=0)
+    return [str(name) for name in header.columns]
+
+# ----------------------------
+# 2. 선택한 열만 불러오기
+# ----------------------------
+
+# columns: 불러올 열 이름 리스트 (list_columns가 돌려준 이름)
+# 반환값: {열 이름: float64 1차원 배열}
+def load_columns(path, columns):
+    ext = _extension(path)
+    columns = list(columns)
+    if ext not in SUPPORTED_EXTENSIONS:
+        raise ValueError(f"Unsupported file type: .{ext}")
+
+    if ext == "npy":
+        array = _open_npy(path)
+        if array.dtype.names:
+            return {name: np.asarray(array[name], dtype=np.float64) for name in columns}
+        if array.ndim == 1:
+            return {name: np.asarray(array, dtype=np.float64) for name in columns}
+        # 2차원: 열 번호로 조회 (float64 배열이면 메모리 매핑된 뷰 그대로 사용)
+        return {name: np.asarray(array[:, int(name)], dtype=np.float64) for name in columns}
+
+    import pandas as pd
+    if ext == "parquet":
+        try:
+            frame = pd.read_parquet(path, columns=columns)
+        except ImportError:
+            raise ImportError("Reading Parquet files requires 'pyarrow' (pip install pyarrow).")
+    else:
+        frame = pd.read_csv(
+            path,
+            sep=_separator(path),
+            usecols=columns,
+            dtype={name: np.float64 for name in columns},
+            engine="c"
+        )
+    return {name: frame[name].to_numpy(dtype=np.float64, copy=False) for name in columns}
@@ -0,0 +1,115 @@
+import re
+
+import numpy as np
+
+# ----------------------------------------------------------------
+# 붙여넣은 텍스트 → float64 배열 파서 (통계 도구 뷰 공용)
+# - 구분자: 쉼표, 공백, 탭(스프레드시트 붙여넣기), 줄바꿈, 세미콜론
+# - 소수점 쉼표(예: 1,5 / 2,25) 지원: decimal="comma" 지정 또는 "auto" 추정
+# - 토큰 분리는 str.split, 숫자 변환은 NumPy가 한 번에 수행 → 파이썬 float 리스트를 만들지 않음
+# - 변환 실패 시에만 토큰을 다시 훑어 잘못된 값의 위치(순번, 줄, 열)를 보고
+#   (앞으로 한 번만 훑으면서 줄 번호를 누적, 위치는 보고할 MAX_REPORTED_TOKENS개까지만 계산하고 나머지는 개수만 셈)
+# ----------------------------------------------------------------
+
+MAX_REPORTED_TOKENS = 5
+GUESS_SAMPLE_CHARS = 1 << 16
+
+# 소수점 쉼표 추정용 패턴
+_DIGIT_COMMA_DIGIT = re.compile(r"\d,\d")
+_LOOSE_COMMA = re.compile(r"(?<!\d),|,(?!\d)|,\d*,")
+_TOKEN_SEPARATOR = re.compile(r"\S[\s;]+\S")
+_TOKEN = re.compile(r"[^\s]+")
+
+
+class ParseError(ValueError):
+    # bad_tokens: [(순번, 줄, 열, 토큰), ...] (모두 1부터 시작, 앞에서부터 최대 MAX_REPORTED_TOKENS개)
+    # bad_count: 잘못된 값 전체 개수
+    def __init__(self, message, bad_tokens=(), bad_count=None):
+        super().__init__(message)
+        self.bad_tokens = list(bad_tokens)
+        self.bad_count = len(self.bad_tokens) if bad_count is None else bad_count
+
+# ----------------------------
+# 1. 소수점 형식 추정
+# ----------------------------
+
+# "comma": 점(.)이 없고, 모든 쉼표가 숫자 사이에 하나씩만 있고,
+#          값들이 공백/탭/줄바꿈/세미콜론으로 구분된 경우 (예: "1,5\t2,25\n3,0")
+# "dot":   그 외 ("1, 2, 3" / "1,2,3" 처럼 쉼표가 구분자인 기존 입력 형식 포함)
+# 대용량 입력은 앞부분(GUESS_SAMPLE_CHARS 글자, 마지막 공백까지)만 보고 추정
+def guess_decimal(text):
+    if len(text) > GUESS_SAMPLE_CHARS:
+        sample = text[:GUESS_SAMPLE_CHARS]
+        cut = max(sample.rfind(" "), sample.rfind("\t"), sample.rfind("\n"), sample.rfind(";"))
+        text = sample[:cut] if cut > 0 else sample
+    if "." in text or not _DIGIT_COMMA_DIGIT.search(text):
+        return "dot"
+    if _LOOSE_COMMA.search(text) or not _TOKEN_SEPARATOR.search(text):
+        return "dot"
+    return "comma"
+
+# ----------------------------
+# 2. 숫자 배열 파싱
+# ----------------------------
+
+# decimal: "auto"(추정), "dot"(1.5, 쉼표는 구분자), "comma"(1,5, 쉼표는 소수점)
+# name: 오류 메시지에 표시할 입력 이름 (예: "Before")
+def parse_numbers(text, decimal="auto", name="Input"):
+    if decimal == "auto":
+        decimal = guess_decimal(text)
+
+    # 글자 수를 유지하는 치환만 사용 → 치환 후 위치가 원문 위치와 같음
+    if decimal == "comma":
+        normalized = text.replace(";", " ").replace(",", ".")
+    elif decimal == "dot":
+        normalized = text.replace(",", " ").replace(";", " ")
+    else:
+        raise ValueError(f"decimal must be 'auto', 'dot' or 'comma', got {decimal!r}")
+
+    tokens = normalized.split()
+    if not tokens:
+        raise ParseError(f"{name}: no numbers found.")
+
+    try:
+        return np.array(tokens, dtype=np.float64)
+    except ValueError:
+        bad_tokens, bad_count = _find_bad_tokens(text, normalized)
+        raise ParseError(_bad_token_message(name, bad_tokens, bad_count), bad_tokens, bad_count) from None
+
+
+# 변환에 실패한 토큰의 순번, 줄, 열 찾기 (오류 경로에서만 실행)
+# 줄 번호는 직전 위치 이후의 줄바꿈만 세어 누적 → 전체 O(텍스트 길이)
+# 반환값: (앞에서부터 limit개의 (순번, 줄, 열, 토큰), 잘못된 토큰 전체 개수)
+def _find_bad_tokens(text, normalized, limit=MAX_REPORTED_TOKENS):
+    bad_tokens = []
+    bad_count = 0
+    last_pos = 0
+    line = 1
+    line_start = 0
+    for index, match in enumerate(_TOKEN.finditer(normalized), start=1):
+        try:
+            float(match.group())
+        except ValueError:
+            bad_count += 1
+            if len(bad_tokens) >= limit:
+                continue
+            start = match.start()
+            newlines = text.count("\n", last_pos, start)
+            if newlines:
+                line += newlines
+                line_start = text.rfind("\n", last_pos, start) + 1
+            last_pos = start
+            bad_tokens.append((index, line, start - line_start + 1, text[start:match.end()]))
+    return bad_tokens, bad_count
+
+
+def _bad_token_message(name, bad_tokens, bad_count):
+    shown = [
+        f"'{token}' (value #{index}, line {line}, column {column})"
+        for index, line, column, token in bad_tokens[:MAX_REPORTED_TOKENS]
+    ]
+    more = bad_count - len(shown)
+    message = f"{name}: {bad_count} invalid value(s): " + ", ".join(shown)
+    if more > 0:
+        message += f", and {more} more"
+    return message
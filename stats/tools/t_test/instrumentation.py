@@ -0,0 +1,204 @@
+import contextvars
+import copy
+import functools
+import json
+import os
+import threading
+from contextlib import nullcontext
+from time import perf_counter
+
+# ----------------------------------------------------------------
+# 단계별 실행 시간 계측 (선택 기능)
+# - 러너 호출 하나를 PhaseTimer 하나가 담당하고, 단계(phase)마다 걸린 시간과 배열 크기를 기록
+#   · 러너 단계: cache_lookup / normality / ttest / p_value / permutation / resampling / report
+#   · 정규성 엔진 내부: normality.sort / normality.shapiro / normality.ks / normality.anderson
+# - 결과 객체의 timings 필드에 붙고, 프로세스 전역 registry에 누적 (JSON으로 내보내기 가능)
+# - 꺼져 있으면 phase()가 아무 일도 하지 않는 컨텍스트를 돌려주므로 계산 경로 부담이 거의 없음
+# - 켜는 방법: set_enabled(True), 환경 변수 STATS_TIMINGS=1, 또는 러너에 instrument=True
+# ----------------------------------------------------------------
+
+_enabled = os.environ.get("STATS_TIMINGS", "") not in ("", "0")
+_current_timer = contextvars.ContextVar("stats_phase_timer", default=None)
+_NULL_PHASE = nullcontext()
+
+
+def set_enabled(flag):
+    global _enabled
+    _enabled = bool(flag)
+
+
+def is_enabled():
+    return _enabled
+
+# ----------------------------
+# 1. 호출 단위 타이머
+# ----------------------------
+
+# timings 딕셔너리에 단계 시간 누적
+def _add_timing(timings, name, seconds, size=None):
+    entry = timings.get(name)
+    if entry is None:
+        entry = timings[name] = {"seconds": 0.0, "calls": 0, "size": None}
+    entry["seconds"] += seconds
+    entry["calls"] += 1
+    if size is not None:
+        entry["size"] = int(size)
+
+
+class _Phase:
+    __slots__ = ("timer", "name", "size", "start")
+
+    def __init__(self, timer, name, size):
+        self.timer = timer
+        self.name = name
+        self.size = size
+
+    def __enter__(self):
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.timer.add(self.name, perf_counter() - self.start, self.size)
+        return False
+
+
+class PhaseTimer:
+    __slots__ = ("test", "timings")
+
+    def __init__(self, test):
+        self.test = test
+        self.timings = {}  # 단계 이름 → {"seconds", "calls", "size"}
+
+    def phase(self, name, size=None):
+        return _Phase(self, name, size)
+
+    def add(self, name, seconds, size=None):
+        _add_timing(self.timings, name, seconds, size)
+
+
+# 현재 계측 중인 러너 호출의 단계 기록 (계측 중이 아니면 아무것도 하지 않음)
+# 사용: with phase("normality.shapiro", size=n): ...
+def phase(name, size=None):
+    timer = _current_timer.get()
+    if timer is None:
+        return _NULL_PHASE
+    return timer.phase(name, size)
+
+# ----------------------------
+# 2. 러너 데코레이터
+# ----------------------------
+
+# 러너에 instrument 인자를 추가 (None이면 전역 설정을 따름)
+# 계측 시 결과 객체(timings 속성이 있으면)의 복사본에 timings를 붙이고 registry에 누적
+def instrumented(test):
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, instrument=None, **kwargs):
+            if not (_enabled if instrument is None else instrument):
+                return func(*args, **kwargs)
+
+            timer = PhaseTimer(test)
+            token = _current_timer.set(timer)
+            start = perf_counter()
+            try:
+                result = func(*args, **kwargs)
+            finally:
+                _current_timer.reset(token)
+            timer.add("total", perf_counter() - start)
+
+            # 캐시에서 꺼낸 결과 객체는 여러 호출이 공유하므로 얕은 복사본에 timings를 붙임
+            if hasattr(result, "timings"):
+                result = copy.copy(result)
+                result.timings = timer.timings
+            registry.record(test, timer.timings)
+            return result
+        return wrapper
+    return decorator
+
+# 러너 밖에서 진행한 단계(예: 뷰의 보고서 조립)를 결과의 timings와 registry에 추가
+def record_phase(result, name, seconds, size=None):
+    timings = getattr(result, "timings", None)
+    if timings is None:
+        return
+    _add_timing(timings, name, seconds, size)
+    single = {name: {"seconds": seconds, "calls": 1, "size": None if size is None else int(size)}}
+    registry.record(result.test, single, count_call=False)
+
+# ----------------------------
+# 3. 프로세스 전역 누적 기록
+# ----------------------------
+
+class TimingRegistry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._tests = {}
+
+    # count_call=False: 이미 기록된 호출에 단계만 추가하는 경우 (호출 수는 그대로)
+    def record(self, test, timings, count_call=True):
+        with self._lock:
+            entry = self._tests.setdefault(test, {"calls": 0, "phases": {}})
+            if count_call:
+                entry["calls"] += 1
+            for name, timing in timings.items():
+                summary = entry["phases"].setdefault(
+                    name, {"calls": 0, "total_s": 0.0, "max_s": 0.0, "max_size": None}
+                )
+                summary["calls"] += timing["calls"]
+                summary["total_s"] += timing["seconds"]
+                summary["max_s"] = max(summary["max_s"], timing["seconds"])
+                if timing["size"] is not None:
+                    summary["max_size"] = max(summary["max_size"] or 0, timing["size"])
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                test: {
+                    "calls": entry["calls"],
+                    "phases": {name: dict(summary) for name, summary in entry["phases"].items()}
+                }
+                for test, entry in self._tests.items()
+            }
+
+    def reset(self):
+        with self._lock:
+            self._tests.clear()
+
+    def to_json(self, indent=2):
+        return json.dumps(self.snapshot(), indent=indent, sort_keys=True)
+
+    def dump(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.to_json())
+            f.write("\n")
+
+
+registry = TimingRegistry()
+
+# ----------------------------
+# 4. 표시용 문자열 (진단 패널)
+# ----------------------------
+
+# 단계별 시간 표 (시간이 긴 순서)
+def format_timings(timings):
+    if not timings:
+        return "No timings recorded."
+    rows = sorted(timings.items(), key=lambda item: item[1]["seconds"], reverse=True)
+    lines = [f"{'Phase':<22} {'Time (ms)':>10} {'Calls':>6} {'Size':>12}"]
+    for name, timing in rows:
+        size = "" if timing["size"] is None else f"{timing['size']:,}"
+        lines.append(f"{name:<22} {timing['seconds'] * 1e3:>10.3f} {timing['calls']:>6} {size:>12}")
+    return "\n".join(lines)
+
+# registry 요약 (검정별 호출 수와 단계별 평균 시간)
+def format_registry(snapshot=None):
+    snapshot = registry.snapshot() if snapshot is None else snapshot
+    if not snapshot:
+        return "No calls recorded."
+    lines = []
+    for test, entry in sorted(snapshot.items()):
+        lines.append(f"{test} ({entry['calls']} calls)")
+        phases = sorted(entry["phases"].items(), key=lambda item: item[1]["total_s"], reverse=True)
+        for name, summary in phases:
+            mean_ms = summary["total_s"] / summary["calls"] * 1e3
+            lines.append(f"  {name:<20} mean {mean_ms:>9.3f} ms   max {summary['max_s'] * 1e3:>9.3f} ms")
+    return "\n".join(lines)
@@ -0,0 +1,83 @@
+import numpy as np
+
+# ----------------------------------------------------------------
+# 다중 비교 보정 (배치 t-검정 결과용, 벡터화)
+# - FWER: Bonferroni, Holm (step-down)
+# - FDR: Benjamini-Hochberg, Benjamini-Yekutieli (step-up)
+# - 정렬 한 번 + 누적 최대/최소(accumulate) → O(m log m), 수만 개 비교도 수 밀리초
+# - NaN p-값(정규성 미충족 등으로 계산되지 않은 검정)은 비교 개수 m에서 빼고 결과도 NaN 유지
+# ----------------------------------------------------------------
+
+METHODS = {
+    "bonferroni": "Bonferroni",
+    "holm": "Holm",
+    "bh": "Benjamini-Hochberg",
+    "by": "Benjamini-Yekutieli"
+}
+
+
+# 보정된 p-값 계산 (입력과 같은 모양의 배열 반환)
+def adjust_p_values(p_values, method="bh"):
+    if method not in METHODS:
+        raise ValueError(f"Unknown correction method: {method!r} (choose from {', '.join(METHODS)})")
+
+    p_values = np.asarray(p_values, dtype=np.float64)
+    flat = p_values.ravel()
+    adjusted = np.full(flat.shape, np.nan)
+    finite = ~np.isnan(flat)
+    p = flat[finite]
+    m = p.size
+    if m == 0:
+        return adjusted.reshape(p_values.shape)
+
+    if method == "bonferroni":
+        adjusted[finite] = np.minimum(p * m, 1.0)
+        return adjusted.reshape(p_values.shape)
+
+    order = np.argsort(p, kind="stable")
+    ranked = p[order]
+    rank = np.arange(1, m + 1)
+
+    if method == "holm":
+        # 작은 p부터 (m - i + 1)배, 앞쪽 값보다 작아지지 않도록 누적 최대
+        ranked_adjusted = np.maximum.accumulate((m - rank + 1) * ranked)
+    else:
+        # 큰 p부터 m / i 배, 뒤쪽 값보다 커지지 않도록 누적 최소
+        scale = m / rank
+        if method == "by":
+            scale = scale * np.sum(1.0 / rank)
+        ranked_adjusted = np.minimum.accumulate((scale * ranked)[::-1])[::-1]
+
+    result = np.empty(m)
+    result[order] = np.minimum(ranked_adjusted, 1.0)
+    adjusted[finite] = result
+    return adjusted.reshape(p_values.shape)
+
+# 보정 p-값과 기각 여부
+# 반환값: (reject: bool 배열, p_adjusted: 배열) — NaN p-값은 기각하지 않음
+def multiple_comparisons(p_values, alpha=0.05, method="bh"):
+    p_adjusted = adjust_p_values(p_values, method)
+    with np.errstate(invalid="ignore"):
+        reject = p_adjusted < alpha
+    return reject, p_adjusted
+
+# ----------------------------------------------------------------
+# 배치 결과에 보정 적용
+# ----------------------------------------------------------------
+
+# batch_result: run_paired_ttest_batch 반환 딕셔너리
+# 보정은 유효한 검정(valid: 정규성 통과 + NaN 없음)끼리만 수행
+# 반환값: 원본 키 + "p_adjusted", "correction", 보정된 유의성으로 바꾼 "sig"가 들어 있는 새 딕셔너리
+def apply_correction(batch_result, method="bh", alpha=None):
+    alpha = batch_result["alpha"] if alpha is None else alpha
+    valid = batch_result["valid"]
+    p = np.where(valid, batch_result["p"], np.nan)
+
+    reject, p_adjusted = multiple_comparisons(p, alpha, method)
+
+    corrected = dict(batch_result)
+    corrected["p_adjusted"] = p_adjusted
+    corrected["sig"] = valid & reject
+    corrected["alpha"] = alpha
+    corrected["correction"] = METHODS[method]
+    return corrected
@@ -0,0 +1,340 @@
+import math
+from functools import lru_cache
+
+import numpy as np
+import scipy.stats as stats
+from stats.tools.t_test.instrumentation import phase
+
+# ----------------------------------------------------------------
+# 배치 정규성 검정 엔진
+# - 그룹마다 정렬과 표준화를 딱 한 번만 수행하고
+#   Shapiro-Wilk / Kolmogorov-Smirnov / Anderson-Darling 세 검정이 그 결과를 공유
+# - 같은 길이의 그룹끼리 묶어서 2차원 배열 연산 한 번으로 처리
+# - cancel: 취소 확인 콜백 (예: AnalysisJob.check) — 대용량 그룹의 청크마다 호출, 취소되었으면 예외 발생
+# ----------------------------------------------------------------
+
+# Anderson-Darling 정규분포 기준값 (SciPy _Avals_norm, 유의수준 15/10/5/2.5/1%)
+_AD_AVALS_NORM = np.array([0.576, 0.656, 0.787, 0.918, 1.092])
+
+# ----------------------------------------------------------------
+# 0. Shapiro-Wilk 보조 함수 (SciPy swilk, Royston 1995 AS R94 이식)
+# ----------------------------------------------------------------
+
+_SW_C1 = (0., 0.221157, -0.147981, -0.207119e1, 0.4434685e1, -0.2706056e1)
+_SW_C2 = (0., 0.42981e-1, -0.293762, -0.1752461e1, 0.5682633e1, -0.3582633e1)
+_SW_C3 = (0.5440, -0.39978, 0.25054e-1, -0.6714e-3)
+_SW_C4 = (0.13822e1, -0.77857, 0.62767e-1, -0.20322e-2)
+_SW_C5 = (-0.15861e1, -0.31082, -0.83751e-1, 0.38915e-2)
+_SW_C6 = (-0.4803, -0.82676e-1, 0.30302e-2)
+_SW_G = (-0.2273e1, 0.459)
+_SW_SMALL = 1e-19
+
+
+# 계수가 [c0, cn, cn-1, ..., c1] 순서로 저장된 다항식 계산 (swilk 원본과 같은 연산 순서)
+def _poly(c, nord, x):
+    res = c[0]
+    if nord == 1:
+        return res
+    p = x * c[nord - 1]
+    if nord == 2:
+        return res + p
+    for ind in range(nord - 2, 0, -1):
+        p = (p + c[ind]) * x
+    return res + p
+
+
+# 표준정규 분위수 근사 (AS 111, swilk 계수 계산용, 벡터화)
+def _ppnd(p):
+    q = p - 0.5
+    r = q * q
+    central = q * (((-25.44106049637 * r + 41.39119773534) * r + -18.61500062529) * r + 2.50662823884)
+    central = central / ((((3.13082909833 * r + -21.06224101826) * r + 23.08336743743) * r + -8.47351093090) * r + 1.)
+
+    r = np.sqrt(-np.log(np.where(q > 0, 1 - p, p)))
+    temp = ((2.32121276858 * r + 4.85014127135) * r + -2.29796479134) * r + -2.78718931138
+    temp /= (1.63706781897 * r + 3.54388924762) * r + 1.
+    return np.where(np.abs(q) <= 0.42, central, np.where(q < 0, -temp, temp))
+
+
+# 표준정규 상단 꼬리 확률 (AS 66, 벡터화)
+def _alnorm_upper(x):
+    upper = x > 0
+    z = np.where(upper, x, -x)
+    y = 0.5 * z * z
+    with np.errstate(over="ignore", invalid="ignore", divide="ignore"):
+        near = 0.5 - z * (0.398942280444 - 0.399903438504 * y / (
+            y + 5.75885480458 - 29.8213557808 / (y + 2.62433121679 + 48.6959930692 / (y + 5.92885724438))))
+        far = 0.398942280385 * np.exp(-y) / (z - 3.8052e-8 + 1.00000615302 / (
+            z + 3.98064794e-4 + 1.98615381364 / (z - 0.151679116635 + 5.29330324926 / (
+                z + 4.8385912808 - 15.1508972451 / (z + 0.742380924027 + 30.789933034 / (z + 3.99019417011))))))
+    temp = np.where(z <= 1.28, near, far)
+    out = np.where(upper, temp, 1 - temp)
+    in_range = (z <= 7.) | (upper & (z <= 38.))
+    return np.where(in_range, out, np.where(upper, 0., 1.))
+
+
+# 표본 크기 n에 대한 Shapiro-Wilk 계수
+# 반환값: (부호가 반영된 전체 계수 벡터 - SA, 그 제곱합 SSA)
+# swilk의 순차 누적 합은 np.cumsum(...)[-1]로 같은 순서를 유지
+def _compute_shapiro_coefficients(n):
+    nn2 = n // 2
+    if n == 3:
+        a = np.array([math.sqrt(2) / 2])
+    else:
+        a = _ppnd((np.arange(1, nn2 + 1) - 0.375) / (n + 0.25))
+        summ2 = np.cumsum(a * a)[-1] * 2.
+        ssumm2 = math.sqrt(summ2)
+        rsn = 1 / math.sqrt(n)
+        a1 = _poly(_SW_C1, 6, rsn) - (a[0] / ssumm2)
+        if n > 5:
+            i1 = 2
+            a2 = -a[1] / ssumm2 + _poly(_SW_C2, 6, rsn)
+            fac = math.sqrt((summ2 - (2 * a[0] ** 2) - 2 * a[1] ** 2) / (1 - (2 * a1 ** 2) - 2 * a2 ** 2))
+            a[1] = a2
+        else:
+            i1 = 1
+            fac = math.sqrt((summ2 - 2 * a[0] ** 2) / (1 - 2 * a1 ** 2))
+        a[0] = a1
+        a[i1:] *= -1. / fac
+
+    # 정렬된 i번째 값에 곱해지는 계수 (앞쪽 절반은 -a, 뒤쪽 절반은 +a, 가운데는 0)
+    coef = np.zeros(n)
+    coef[:nn2] = -a
+    coef[n - nn2:] = a[::-1]
+
+    sa = np.cumsum(coef)[-1] / n
+    asa = coef - sa
+    ssa = np.cumsum(asa * asa)[-1]
+    asa.setflags(write=False)
+    return asa, ssa
+
+
+# 자주 쓰는 표본 크기는 캐시 (큰 n은 계수 벡터 자체가 커서 캐시하지 않음)
+_cached_shapiro_coefficients = lru_cache(maxsize=256)(_compute_shapiro_coefficients)
+
+
+def _shapiro_coefficients(n):
+    if n <= 5000:
+        return _cached_shapiro_coefficients(n)
+    return _compute_shapiro_coefficients(n)
+
+
+# Shapiro-Wilk 누적합(SSX, SAX)과 범위로부터 p-값 계산
+def _shapiro_p_from_sums(n, ssa, ssx, sax, value_range):
+    zero_range = value_range < _SW_SMALL
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ssassx = np.sqrt(ssa * ssx)
+        w1 = (ssassx - sax) * (ssassx + sax) / (ssa * ssx)
+        w = 1 - w1
+
+        if n == 3:
+            pw = np.where(w < 0.75, 0., 1. - 6 / np.pi * np.arccos(np.sqrt(w)))
+        else:
+            y = np.log(w1)
+            if n <= 11:
+                gamma = _poly(_SW_G, 2, n)
+                too_large = y >= gamma
+                y = -np.log(gamma - y)
+                m = _poly(_SW_C3, 4, n)
+                s = math.exp(_poly(_SW_C4, 4, n))
+                pw = np.where(too_large, _SW_SMALL, _alnorm_upper((y - m) / s))
+            else:
+                log_n = math.log(n)
+                m = _poly(_SW_C5, 4, log_n)
+                s = math.exp(_poly(_SW_C6, 3, log_n))
+                pw = _alnorm_upper((y - m) / s)
+
+    # 범위가 0인 그룹(모든 값이 같음)은 SciPy와 같이 p = 1, NaN이 섞인 그룹은 NaN
+    # (정렬 시 NaN이 맨 뒤로 가므로 범위가 NaN이 됨)
+    pw = np.where(zero_range, 1., pw)
+    return np.where(np.isnan(value_range), np.nan, pw)
+
+
+# 정렬된 그룹들(같은 길이)의 Shapiro-Wilk p-값
+def _shapiro_p(sorted_rows, shift):
+    n = sorted_rows.shape[1]
+    asa, ssa = _shapiro_coefficients(n)
+    x = sorted_rows - shift[:, None]  # 중앙 근처 값을 빼서 반올림 오차 감소 (SciPy gh-15777)
+
+    value_range = x[:, -1] - x[:, 0]
+    xi = x / np.where(value_range < _SW_SMALL, 1., value_range)[:, None]
+    sx = np.cumsum(xi, axis=1)[:, -1] / n
+    xsx = xi - sx[:, None]
+    ssx = np.cumsum(xsx * xsx, axis=1)[:, -1]
+    sax = np.cumsum(asa * xsx, axis=1)[:, -1]
+    return _shapiro_p_from_sums(n, ssa, ssx, sax, value_range)
+
+
+# 표준화된 정렬 데이터(z)의 Kolmogorov-Smirnov p-값 (정확 분포, SciPy 'auto'와 동일)
+def _ks_p(z):
+    n = z.shape[1]
+    cdfvals = stats.norm.cdf(z)
+    d_plus = (np.arange(1.0, n + 1) / n - cdfvals).max(axis=1)
+    d_minus = (cdfvals - np.arange(0.0, n) / n).max(axis=1)
+    d = np.where(d_plus > d_minus, d_plus, d_minus)
+    return np.clip(stats.kstwo.sf(d, n), 0, 1)
+
+
+# 표준화된 정렬 데이터(z)의 Anderson-Darling 통계량과 5% 기준값
+def _anderson(z):
+    n = z.shape[1]
+    logcdf = stats.norm.logcdf(z)
+    logsf = stats.norm.logsf(z)
+    i = np.arange(1, n + 1)
+    ad_stat = -n - np.sum((2 * i - 1.0) / n * (logcdf + logsf[:, ::-1]), axis=1)
+    ad_crit = np.around(_AD_AVALS_NORM / (1.0 + 4.0 / n - 25.0 / n / n), 3)[2]
+    return ad_stat, ad_crit
+
+
+# 같은 길이 그룹 묶음 (n_groups, n)에 대한 세 검정 통계량
+def _normality_stats_equal_length(rows, cancel=None):
+    n = rows.shape[1]
+    if n == 0:
+        raise ValueError("At least one observation is required.")
+    if n > LARGE_GROUP_N:
+        with phase("normality.chunked", rows.size):
+            stats_per_row = [_normality_stats_large(row, cancel) for row in rows]
+        return tuple(np.array(values) for values in zip(*stats_per_row))
+
+    # 정렬과 표준화는 그룹마다 한 번만
+    with phase("normality.sort", rows.size):
+        sorted_rows = np.sort(rows, axis=1)
+        mean = np.mean(rows, axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sd = np.std(rows, ddof=1, axis=1) if n > 1 else np.full(len(rows), np.nan)
+            z = (sorted_rows - mean[:, None]) / sd[:, None]
+
+    # n < 3: Shapiro-Wilk는 SciPy와 같이 NaN (KS / AD는 그대로 계산 → 판정은 두 검정으로)
+    with phase("normality.shapiro", rows.size):
+        shapiro_p = _shapiro_p(sorted_rows, rows[:, n // 2]) if n >= 3 else np.full(len(rows), np.nan)
+    with phase("normality.ks", rows.size):
+        ks_p = _ks_p(z)
+    with phase("normality.anderson", rows.size):
+        ad_stat, ad_crit = _anderson(z)
+    return shapiro_p, ks_p, ad_stat, np.full(len(rows), ad_crit)
+
+# ----------------------------------------------------------------
+# 0-1. 대용량 그룹 (수백만 개 이상)
+# - 정렬된 배열 하나만 전체 크기로 두고 나머지 계산은 청크 단위로 수행
+#   → 표준화 값, CDF, 로그 CDF 등 전체 크기 임시 배열을 만들지 않음
+# - Shapiro-Wilk 순차 합은 이전 청크의 누적값을 이어 붙여 같은 순서로 계산
+# ----------------------------------------------------------------
+
+LARGE_GROUP_N = 1 << 20
+_LARGE_CHUNK = 1 << 18
+
+
+def _continue_sum(carry, values):
+    return np.cumsum(np.concatenate(([carry], values)))[-1]
+
+
+def _normality_stats_large(row, cancel=None):
+    check = cancel or (lambda: None)
+    n = len(row)
+    sorted_row = np.sort(row)
+    mean = np.mean(row)
+    sd = np.std(row, ddof=1)
+    chunks = [(lo, min(lo + _LARGE_CHUNK, n)) for lo in range(0, n, _LARGE_CHUNK)]
+
+    # Shapiro-Wilk
+    asa, ssa = _shapiro_coefficients(n)
+    shift = row[n // 2]
+    value_range = (sorted_row[-1] - shift) - (sorted_row[0] - shift)
+    scale = 1. if value_range < _SW_SMALL else value_range
+    sx = 0.
+    for lo, hi in chunks:
+        check()
+        sx = _continue_sum(sx, (sorted_row[lo:hi] - shift) / scale)
+    sx /= n
+    ssx = sax = 0.
+    for lo, hi in chunks:
+        check()
+        xsx = (sorted_row[lo:hi] - shift) / scale - sx
+        ssx = _continue_sum(ssx, xsx * xsx)
+        sax = _continue_sum(sax, asa[lo:hi] * xsx)
+    shapiro_p = _shapiro_p_from_sums(n, ssa, ssx, sax, np.float64(value_range))[()]
+
+    # Kolmogorov-Smirnov / Anderson-Darling (표준화 값도 청크마다 계산)
+    d_plus = d_minus = -np.inf
+    ad_sum = 0.
+    for lo, hi in chunks:
+        check()
+        z = (sorted_row[lo:hi] - mean) / sd
+        cdfvals = stats.norm.cdf(z)
+        d_plus = max(d_plus, (np.arange(lo + 1.0, hi + 1) / n - cdfvals).max())
+        d_minus = max(d_minus, (cdfvals - np.arange(lo + 0.0, hi) / n).max())
+
+        # i번째 logcdf는 (n-1-i)번째 logsf와 짝을 이룸
+        mirrored = (sorted_row[n - hi:n - lo] - mean) / sd
+        weights = (2 * np.arange(lo + 1, hi + 1) - 1.0) / n
+        ad_sum += np.sum(weights * (stats.norm.logcdf(z) + stats.norm.logsf(mirrored)[::-1]))
+
+    d = d_plus if d_plus > d_minus else d_minus
+    ks_p = np.clip(stats.kstwo.sf(d, n), 0, 1)
+    ad_stat = -n - ad_sum
+    ad_crit = np.around(_AD_AVALS_NORM / (1.0 + 4.0 / n - 25.0 / n / n), 3)[2]
+    return shapiro_p, ks_p, ad_stat, ad_crit
+
+
+# ----------------------------------------------------------------
+# 1. 배치 정규성 검정
+# ----------------------------------------------------------------
+
+# groups: 2차원 배열 (각 행이 하나의 그룹) 또는 길이가 다른 1차원 배열들의 리스트
+# 반환값: 유의수준과 무관한 검정 통계량 딕셔너리 (shapiro_p, ks_p, ad_stat, ad_crit; 값은 그룹별 배열)
+# → 결과 캐시가 이 값을 보관하고, alpha만 바뀌면 apply_normality_alpha로 판정만 다시 함
+def normality_statistics(groups, cancel=None):
+    if isinstance(groups, np.ndarray) and groups.ndim == 2:
+        buckets = {groups.shape[1]: (np.arange(len(groups)), np.ascontiguousarray(groups, dtype=np.float64))}
+        n_groups = len(groups)
+    else:
+        groups = [np.ravel(np.asarray(group, dtype=np.float64)) for group in groups]
+        n_groups = len(groups)
+        by_length = {}
+        for idx, group in enumerate(groups):
+            by_length.setdefault(len(group), []).append(idx)
+        buckets = {
+            n: (np.array(idxs), np.stack([groups[i] for i in idxs]))
+            for n, idxs in by_length.items()
+        }
+
+    shapiro_p = np.empty(n_groups)
+    ks_p = np.empty(n_groups)
+    ad_stat = np.empty(n_groups)
+    ad_crit = np.empty(n_groups)
+    for idxs, rows in buckets.values():
+        if cancel is not None:
+            cancel()
+        shapiro_p[idxs], ks_p[idxs], ad_stat[idxs], ad_crit[idxs] = _normality_stats_equal_length(rows, cancel)
+
+    return {"shapiro_p": shapiro_p, "ks_p": ks_p, "ad_stat": ad_stat, "ad_crit": ad_crit}
+
+# 통계량에 유의수준 적용 → check_normality_batch 반환 형식
+def apply_normality_alpha(statistics, alpha=0.05):
+    shapiro_p = statistics["shapiro_p"]
+    ks_p = statistics["ks_p"]
+    ad_stat = statistics["ad_stat"]
+    ad_crit = statistics["ad_crit"]
+
+    # 셋 중 하나라도 통과하면 정규성 만족으로 판정
+    shapiro_pass = shapiro_p > alpha
+    ks_pass = ks_p > alpha
+    ad_pass = ad_stat < ad_crit
+    passed = shapiro_pass | ks_pass | ad_pass
+
+    return {
+        "passed": passed,
+        "shapiro_p": shapiro_p,
+        "shapiro_pass": shapiro_pass,
+        "ks_p": ks_p,
+        "ks_pass": ks_pass,
+        "ad_stat": ad_stat,
+        "ad_crit": ad_crit,
+        "ad_pass": ad_pass
+    }
+
+# groups: 2차원 배열 (각 행이 하나의 그룹) 또는 길이가 다른 1차원 배열들의 리스트
+# alpha: 유의수준, 기본값 0.05
+# 반환값: check_normality와 같은 키를 가진 딕셔너리 (값은 그룹별 배열)
+def check_normality_batch(groups, alpha=0.05):
+    return apply_normality_alpha(normality_statistics(groups), alpha)
@@ -1,13 +1,26 @@
+import os
+from time import perf_counter
+
 import flet as ft
 import numpy as np
+from stats.tools.analysis_executor import submit
+from stats.tools.data_import import SUPPORTED_EXTENSIONS, list_columns, load_columns
+from stats.tools.data_parser import parse_numbers
+from stats.tools.t_test.instrumentation import format_registry, format_timings, record_phase, registry
 from stats.tools.t_test.ttest_logic import run_paired_ttest, compute_sd
+from stats.tools.t_test.ttest_resample import RESAMPLE_BUDGET, RESAMPLE_MAX_N, format_resampling
 from stats.references import get_references_for_test
 
+# 재표집(permutation / bootstrap)에 쓸 프로세스 수 (-1: CPU 코어 수만큼, 계산량이 작으면 엔진이 현재 프로세스에서 실행)
+# 화면에서는 큰 파일 열도 기다릴 만한 시간에 끝나도록 부분 표본(RESAMPLE_MAX_N) / 계산량 상한(RESAMPLE_BUDGET)을 지정
+# (적용되면 결과 텍스트에 부분 표본 크기와 줄인 재표집 수가 표시됨)
+RESAMPLE_JOBS = -1
+
 # Paired t-test 결과 화면 View 정의 함수
 def paired_view(page: ft.Page):
     # 🔷 사용자 입력 필드 정의
-    before_input = ft.TextField(label="Before (comma-separated)", hint_text="e.g., 100, 102, 98")
-    after_input = ft.TextField(label="After (comma-separated)", hint_text="e.g., 105, 100, 99")
+    before_input = ft.TextField(label="Before (comma, space or tab-separated)", hint_text="e.g., 100, 102, 98")
+    after_input = ft.TextField(label="After (comma, space or tab-separated)", hint_text="e.g., 105, 100, 99")
     alpha_input = ft.TextField(label="Alpha", value="0.05")
 
     # 🔷 입력 필드들을 수직으로 배치
@@ -16,6 +29,42 @@ def paired_view(page: ft.Page):
         spacing=16
     )
 
+    # 🔷 파일 불러오기 (CSV / TSV / Parquet / .npy) + 열 선택
+    # 파일이 선택되어 있으면 텍스트 입력 대신 선택한 두 열을 NumPy 배열로 바로 읽어서 사용
+    imported = {"path": None}
+    file_label = ft.Text("", size=12, color=ft.colors.GREY_600)
+    before_column = ft.Dropdown(label="Before column", width=290, visible=False)
+    after_column = ft.Dropdown(label="After column", width=290, visible=False)
+
+    def on_file_picked(e):
+        if not e.files:
+            return
+        path = e.files[0].path
+        try:
+            columns = list_columns(path)
+        except Exception as err:
+            file_label.value = f"❌ {err}"
+            page.update()
+            return
+
+        imported["path"] = path
+        before_column.options = [ft.dropdown.Option(name) for name in columns]
+        after_column.options = [ft.dropdown.Option(name) for name in columns]
+        before_column.value = columns[0] if columns else None
+        after_column.value = columns[1] if len(columns) > 1 else None
+        before_column.visible = after_column.visible = True
+        file_label.value = f"📄 {os.path.basename(path)} ({len(columns)} columns)"
+        page.update()
+
+    def clear_file(e):
+        imported["path"] = None
+        before_column.visible = after_column.visible = False
+        file_label.value = ""
+        page.update()
+
+    file_picker = ft.FilePicker(on_result=on_file_picked)
+    page.overlay.append(file_picker)
+
     # 🔷 결과 출력용 텍스트 정의
     result_text = ft.Text("", no_wrap=False, selectable=True)
 
@@ -52,54 +101,150 @@ def paired_view(page: ft.Page):
         visible=False
     )
 
-    # 🔷 실행 버튼 클릭 시 통계 분석 실행 함수
-    def run_test(e):
-        try:
-            # 입력값 파싱
-            before = list(map(float, before_input.value.split(",")))
-            after = list(map(float, after_input.value.split(",")))
-            alpha = float(alpha_input.value)
-
-            # t-test 실행
-            result = run_paired_ttest(before, after, alpha, return_dict=True)
-            sd_before = compute_sd(before)
-            sd_after = compute_sd(after)
-
-            text = ""
-
-            # 🔸 에러 발생 시 출력 처리
-            if result["error"]:
-                text = result["error"] + "\n"
-                if "normality" in result:
-                    norm = result["normality"]
-                    text += (
-                        "\nNormality Test on Differences (after - before):\n"
-                        "-----------------------------------------------------------------------------\n"
-                        f"Shapiro-Wilk:        {'passed' if norm['shapiro_pass'] else 'failed'} (p = {norm['shapiro_p']:.4f})\n"
-                        f"Kolmogorov-Smirnov:  {'passed' if norm['ks_pass'] else 'failed'} (p = {norm['ks_p']:.4f})\n"
-                        f"Anderson-Darling:    {'passed' if norm['ad_pass'] else 'failed'} (stat = {norm['ad_stat']:.4f}, crit = {norm['ad_crit']:.4f})\n"
-                        "-----------------------------------------------------------------------------"
-                    )
+    # 🔷 진행 상황 표시 (단계 이름 + 진행 막대 + 취소 버튼)
+    progress_label = ft.Text("", size=12, color=ft.colors.GREY_600)
+    progress_bar = ft.ProgressBar(width=400, value=0, color=ft.colors.CYAN_400)
+    running = {"job": None}
 
-                text += "\n\n" + get_references_for_test("paired")
-                result_card.border = ft.border.all(1, ft.colors.RED_ACCENT_400)
+    def cancel_test(e):
+        if running["job"] is not None:
+            running["job"].cancel()
+            progress_label.value = "Cancelling..."
+            page.update()
 
-            else:
-                # 🔸 정상 결과 출력 조립
-                test_result_label = (
-                    "significant" if result["sig"] == "Significant" else "not significant"
+    progress_row = ft.Row(
+        controls=[
+            progress_bar,
+            progress_label,
+            ft.TextButton("Cancel", icon=ft.icons.CANCEL, on_click=cancel_test)
+        ],
+        alignment=ft.MainAxisAlignment.CENTER,
+        visible=False
+    )
+
+    # 🔷 진단 패널 (숨김): 아이콘 버튼으로 열면 이후 실행부터 단계별 시간을 기록해서 표시
+    diagnostics_timings = ft.Text("", font_family="monospace", size=12, selectable=True)
+    diagnostics_registry = ft.Text("", font_family="monospace", size=12, selectable=True)
+
+    def refresh_diagnostics(timings=None):
+        if timings is not None:
+            diagnostics_timings.value = "Last run:\n" + format_timings(timings)
+        diagnostics_registry.value = "All runs (this session):\n" + format_registry()
+
+    def reset_diagnostics(e):
+        registry.reset()
+        diagnostics_timings.value = ""
+        refresh_diagnostics()
+        page.update()
+
+    diagnostics_panel = ft.Container(
+        content=ft.Column(
+            controls=[
+                ft.Text("Diagnostics", weight=ft.FontWeight.BOLD, color=ft.colors.BLUE_GREY_700),
+                diagnostics_timings,
+                diagnostics_registry,
+                ft.Row(
+                    controls=[
+                        ft.TextButton(
+                            "Copy JSON", icon=ft.icons.CONTENT_COPY,
+                            on_click=lambda e: page.set_clipboard(registry.to_json())
+                        ),
+                        ft.TextButton("Reset", icon=ft.icons.RESTART_ALT, on_click=reset_diagnostics)
+                    ]
+                )
+            ],
+            spacing=8
+        ),
+        width=600,
+        padding=20,
+        border_radius=8,
+        bgcolor=ft.colors.BLUE_GREY_50,
+        visible=False
+    )
+
+    def toggle_diagnostics(e):
+        diagnostics_panel.visible = not diagnostics_panel.visible
+        if diagnostics_panel.visible:
+            refresh_diagnostics()
+        page.update()
+
+    # 🔷 통계 분석 본체 (백그라운드 스레드에서 실행)
+    # 단계마다 job.report()로 진행 상황 전달
+    # 반환값: (출력 텍스트, 결과 카드 테두리 색, 단계별 시간 - 진단 패널이 닫혀 있으면 None)
+    def analyze(job, before_text, after_text, alpha_text, file_selection, instrument):
+        # 입력값 파싱 (파일이 선택되어 있으면 선택한 열을 배열로 읽기)
+        job.report("parsing")
+        parse_start = perf_counter()
+        if file_selection:
+            path, before_name, after_name = file_selection
+            columns = load_columns(path, [before_name, after_name])
+            before = columns[before_name]
+            after = columns[after_name]
+        else:
+            # 쉼표/공백/탭/줄바꿈 구분, 소수점 쉼표 자동 인식 → float64 배열 한 번만 생성
+            before = parse_numbers(before_text, name="Before")
+            after = parse_numbers(after_text, name="After")
+        alpha = float(alpha_text)
+
+        # t-test 실행 (같은 배열을 검정과 표준편차 계산에 그대로 재사용)
+        # 정규성 미충족 시 재표집(permutation / bootstrap) 결과도 함께 계산 (큰 표본은 부분 표본 + 재표집 수 축소, 결과에 표시)
+        # 소표본이면 정확(exact) 부호 뒤집기 p-값도 함께 계산
+        parse_seconds = perf_counter() - parse_start
+        result = run_paired_ttest(
+            before, after, alpha, return_dict=True, resample=True, permutation="auto", progress=job.report,
+            cancel=job.check, n_jobs=RESAMPLE_JOBS, resample_max_n=RESAMPLE_MAX_N, resample_budget=RESAMPLE_BUDGET,
+            instrument=instrument
+        )
+        record_phase(result, "parsing", parse_seconds, before.size + after.size)
+        job.report("report")
+        report_start = perf_counter()
+        sd_before = compute_sd(before)
+        sd_after = compute_sd(after)
+
+        text = ""
+
+        # 🔸 에러 발생 시 출력 처리
+        if result["error"]:
+            text = result["error"] + "\n"
+            if "normality" in result:
+                norm = result["normality"]
+                text += (
+                    "\nNormality Test on Differences (after - before):\n"
+                    "-----------------------------------------------------------------------------\n"
+                    f"Shapiro-Wilk:        {'passed' if norm['shapiro_pass'] else 'failed'} (p = {norm['shapiro_p']:.4f})\n"
+                    f"Kolmogorov-Smirnov:  {'passed' if norm['ks_pass'] else 'failed'} (p = {norm['ks_p']:.4f})\n"
+                    f"Anderson-Darling:    {'passed' if norm['ad_pass'] else 'failed'} (stat = {norm['ad_stat']:.4f}, crit = {norm['ad_crit']:.4f})\n"
+                    "-----------------------------------------------------------------------------"
                 )
 
-                # 🔸 판정 이유 설명 (항상 출력)
-                reason = (
-                    f"Reason: The t-statistic ({result['t_stat']:.3f}) "
-                    f"{'exceeds' if result['sig'] == 'Significant' else 'does not exceed'} "
-                    f"the critical value (±{result['crit']:.3f}).\n"
-                    f"        The p-value ({result['p']:.4f}) is "
-                    f"{'less' if result['sig'] == 'Significant' else 'greater'} than the alpha level (α = {result['alpha']})."
+            # 🔸 재표집 대안 결과 (정규성 미충족 시)
+            if "resampling" in result:
+                text += (
+                    "\n\nDistribution-free alternative:\n"
+                    "-----------------------------------------------------------------------------\n"
+                    + format_resampling(result["resampling"]) + "\n"
+                    "-----------------------------------------------------------------------------"
                 )
 
-                text = f"""Paired t-test ({result['tail']}-tailed) result:
+            text += "\n\n" + get_references_for_test("paired")
+            border_color = ft.colors.RED_ACCENT_400
+
+        else:
+            # 🔸 정상 결과 출력 조립
+            test_result_label = (
+                "significant" if result["sig"] == "Significant" else "not significant"
+            )
+
+            # 🔸 판정 이유 설명 (항상 출력)
+            reason = (
+                f"Reason: The t-statistic ({result['t_stat']:.3f}) "
+                f"{'exceeds' if result['sig'] == 'Significant' else 'does not exceed'} "
+                f"the critical value (±{result['crit']:.3f}).\n"
+                f"        The p-value ({result['p']:.4f}) is "
+                f"{'less' if result['sig'] == 'Significant' else 'greater'} than the alpha level (α = {result['alpha']})."
+            )
+
+            text = f"""Paired t-test ({result['tail']}-tailed) result:
 ==========================================================
 
 Normality Test on Differences (after - before):
@@ -122,38 +267,100 @@ SD(before) = {sd_before}
 SD(after) = {sd_after}
 -----------------------------------------------------------------------------"""
 
-                if result["df"] <= 1:
-                    text += (
-                        "\n⚠️ Note: Sample size is extremely small (df ≤ 1). "
-                        "Interpretation of p-value and t-statistic may not be reliable.\n"
-                        "-----------------------------------------------------------------------------"
-                    )
+            # 🔸 소표본: 정확 permutation p-값 (t-분포 근사에 의존하지 않음)
+            if result.get("permutation", {}).get("exact"):
+                perm = result["permutation"]
+                text += (
+                    f"\nExact sign-flip permutation p-value = {perm['p']:.4f} "
+                    f"(all {perm['n_resamples']} sign flips, {perm['tail']}-tailed)\n"
+                    "-----------------------------------------------------------------------------"
+                )
 
-                if np.isinf(result["t_stat"]) or np.isinf(result["cohen_d"]):
-                    text += (
-                        "\n⚠️ Note: All differences were identical. "
-                        "Standard deviation is zero, so t and Cohen's d are undefined (∞). "
-                        "Interpretation requires caution.\n"
-                        "-----------------------------------------------------------------------------"
-                    )
+            if result["df"] <= 1:
+                text += (
+                    "\n⚠️ Note: Sample size is extremely small (df ≤ 1). "
+                    "Interpretation of p-value and t-statistic may not be reliable.\n"
+                    "-----------------------------------------------------------------------------"
+                )
 
-                text += "\n\n" + get_references_for_test("paired")
+            if np.isinf(result["t_stat"]) or np.isinf(result["cohen_d"]):
+                text += (
+                    "\n⚠️ Note: All differences were identical. "
+                    "Standard deviation is zero, so t and Cohen's d are undefined (∞). "
+                    "Interpretation requires caution.\n"
+                    "-----------------------------------------------------------------------------"
+                )
 
-                if result["sig"] == "Not Significant":
-                    result_card.border = ft.border.all(1, ft.colors.RED_ACCENT_400)
-                else:
-                    result_card.border = ft.border.all(1, ft.colors.GREEN_ACCENT_400)
+            # 🔸 재표집 대안 결과 (정규성 미충족 시)
+            if "resampling" in result:
+                text += (
+                    "\n\nDistribution-free alternative:\n"
+                    "-----------------------------------------------------------------------------\n"
+                    + format_resampling(result["resampling"]) + "\n"
+                    "-----------------------------------------------------------------------------"
+                )
 
-            result_text.value = text
-            result_card.visible = True
+            text += "\n\n" + get_references_for_test("paired")
 
-        except Exception as err:
-            result_text.value = f"❌ Error: {err}"
-            result_card.visible = True
-            result_card.border = ft.border.all(1, ft.colors.RED_ACCENT_400)
+            if result["sig"] == "Not Significant":
+                border_color = ft.colors.RED_ACCENT_400
+            else:
+                border_color = ft.colors.GREEN_ACCENT_400
+
+        record_phase(result, "report", perf_counter() - report_start, len(text))
+        return text, border_color, result.timings
 
+    # 🔷 결과 카드 갱신 / 실행 상태 정리
+    def show_result(text, border_color):
+        result_text.value = text
+        result_card.visible = True
+        result_card.border = ft.border.all(1, border_color)
+
+    def finish():
+        running["job"] = None
+        progress_row.visible = False
+        run_button.disabled = False
         page.update()
 
+    def on_progress(phase, fraction):
+        progress_label.value = f"{phase.capitalize()}..."
+        progress_bar.value = fraction
+        page.update()
+
+    def on_done(output):
+        text, border_color, timings = output
+        show_result(text, border_color)
+        if diagnostics_panel.visible:
+            refresh_diagnostics(timings)
+        finish()
+
+    def on_error(err):
+        show_result(f"❌ Error: {err}", ft.colors.RED_ACCENT_400)
+        finish()
+
+    def on_cancel():
+        show_result("Analysis cancelled.", ft.colors.GREY_400)
+        finish()
+
+    # 🔷 실행 버튼 클릭 시 통계 분석을 백그라운드로 시작 (화면은 계속 응답)
+    def run_test(e):
+        if running["job"] is not None:
+            return
+        file_selection = (
+            (imported["path"], before_column.value, after_column.value) if imported["path"] else None
+        )
+        progress_bar.value = 0
+        progress_label.value = ""
+        progress_row.visible = True
+        run_button.disabled = True
+        page.update()
+
+        running["job"] = submit(
+            analyze, before_input.value, after_input.value, alpha_input.value, file_selection,
+            diagnostics_panel.visible,
+            on_progress=on_progress, on_done=on_done, on_error=on_error, on_cancel=on_cancel
+        )
+
     # 🔷 공통 버튼 생성 함수
     def home_style_button(text, icon, on_click):
         return ft.ElevatedButton(
@@ -168,6 +375,8 @@ SD(after) = {sd_after}
             on_click=on_click
         )
 
+    run_button = home_style_button("Run", ft.icons.PLAY_ARROW, run_test)
+
     # 🔷 최종 View 반환
     return ft.View(
         route="/paired_two",
@@ -182,16 +391,42 @@ SD(after) = {sd_after}
             ft.Container(padding=ft.padding.only(bottom=40)),
             input_fields,
             ft.Row(
-                controls=[home_style_button("Run", ft.icons.PLAY_ARROW, run_test)],
+                controls=[
+                    home_style_button(
+                        "Import file",
+                        ft.icons.UPLOAD_FILE,
+                        lambda e: file_picker.pick_files(allowed_extensions=list(SUPPORTED_EXTENSIONS))
+                    ),
+                    home_style_button("Clear file", ft.icons.CLEAR, clear_file),
+                    file_label
+                ],
+                spacing=12
+            ),
+            ft.Row(controls=[before_column, after_column], spacing=20),
+            ft.Row(
+                controls=[run_button],
                 alignment=ft.MainAxisAlignment.CENTER
             ),
+            progress_row,
             ft.Row(
                 controls=[result_card],
                 alignment=ft.MainAxisAlignment.CENTER
             ),
             ft.Row(
-                controls=[home_style_button("Back", ft.icons.ARROW_BACK, lambda e: page.go("/statistics"))],
-                alignment=ft.MainAxisAlignment.START
+                controls=[diagnostics_panel],
+                alignment=ft.MainAxisAlignment.CENTER
+            ),
+            ft.Row(
+                controls=[
+                    home_style_button("Back", ft.icons.ARROW_BACK, lambda e: page.go("/statistics")),
+                    ft.IconButton(
+                        icon=ft.icons.SPEED,
+                        tooltip="Diagnostics",
+                        icon_color=ft.colors.BLUE_GREY_200,
+                        on_click=toggle_diagnostics
+                    )
+                ],
+                alignment=ft.MainAxisAlignment.SPACE_BETWEEN
             )
         ]
     )
@@ -0,0 +1,40 @@
+from functools import lru_cache
+
+import numpy as np
+import scipy.stats as stats
+
+# ----------------------------------------------------------------
+# t-분포 공용 커널
+# - 임계값: (alpha, df, tail) 조합별로 LRU 캐시 → 같은 조합은 stats.t.ppf를 한 번만 호출
+# - p-값: 1 - cdf 대신 생존함수(sf)를 직접 사용 → 극단적인 t에서도 꼬리 정밀도 유지
+# - tail: "two"(양측) 또는 그 외(단측, t의 부호 방향으로 해석)
+# ----------------------------------------------------------------
+
+# 임계값 1개 계산 (캐시)
+@lru_cache(maxsize=4096)
+def _critical_value(alpha, df, two_tailed):
+    return stats.t.ppf(1 - alpha / 2 if two_tailed else 1 - alpha, df)
+
+# 단일 임계값 조회
+def critical_value(alpha, df, tail="two"):
+    return _critical_value(float(alpha), float(df), tail == "two")
+
+# 자유도 배열에 대한 임계값 (고유한 df마다 캐시 조회 후 다시 펼침)
+def critical_values(alpha, df, tail="two"):
+    df = np.asarray(df, dtype=np.float64)
+    unique_df, inverse = np.unique(df, return_inverse=True)
+    table = np.array([critical_value(alpha, value, tail) for value in unique_df])
+    return table[inverse].reshape(df.shape)
+
+# p-값 계산 (스칼라/배열 모두 가능)
+# 양측: 2 * sf(|t|), 단측: sf(|t|)
+def p_values(t_stat, df, tail="two"):
+    sf = stats.t.sf(np.abs(t_stat), df)
+    return 2 * sf if tail == "two" else sf
+
+# 캐시 상태 확인 / 초기화
+def critical_cache_info():
+    return _critical_value.cache_info()
+
+def clear_critical_cache():
+    _critical_value.cache_clear()
@@ -0,0 +1,117 @@
+import numpy as np
+import scipy.stats as stats
+from stats.tools.t_test.multitest import apply_correction
+from stats.tools.t_test.normality import check_normality_batch
+from stats.tools.t_test.t_dist import critical_value, p_values
+
+# ----------------------------------------------------------
+# 0. 공통 유틸 함수
+# ----------------------------------------------------------
+
+# (n_subjects, n_variables) 입력을 (n_variables, n_subjects) 연속 배열로 변환
+# 변수별 데이터가 메모리상 한 줄로 놓여야 행 방향 합산 순서가
+# 1차원 배열(단일 호출 경로)과 똑같아져서 결과값이 비트 단위로 일치함
+def _as_variable_rows(data):
+    data = np.asarray(data, dtype=np.float64)
+    if data.ndim == 1:
+        data = data.reshape(-1, 1)
+    if data.ndim != 2:
+        raise ValueError("Input must be a 1-D or 2-D array of shape (n_subjects, n_variables).")
+    return np.ascontiguousarray(data.T)
+
+# --------------------------------------------------------------
+# 1. Batch paired t-test (열 단위 대응표본 t-검정, 벡터화 버전)
+# --------------------------------------------------------------
+
+# before / after: (n_subjects, n_variables) 행렬, 각 열이 하나의 변수
+# dedupe=True면 (before, after) 값이 완전히 같은 열은 한 번만 계산하고 결과를 복사
+# correction: 다중 비교 보정 ("bonferroni", "holm", "bh", "by", None이면 보정 안 함)
+#   → "p_adjusted", "correction" 키가 추가되고 sig는 보정된 p-값 기준
+# 반환값: run_paired_ttest(return_dict=True)와 같은 키를 가진 딕셔너리
+#         (단, 값은 변수별 NumPy 배열, sig는 bool 배열)
+def run_paired_ttest_batch(before, after, alpha=0.05, tail="two", dedupe=True, correction=None):
+    before = _as_variable_rows(before)
+    after = _as_variable_rows(after)
+    if before.shape != after.shape:
+        raise ValueError("before and after must have the same shape.")
+
+    result = None
+    if dedupe:
+        first, inverse = _unique_rows(before, after)
+        if len(first) < len(before):
+            result = _expand_result(_paired_batch_rows(before[first], after[first], alpha, tail), inverse)
+    if result is None:
+        result = _paired_batch_rows(before, after, alpha, tail)
+
+    if correction is not None:
+        result = apply_correction(result, correction)
+    return result
+
+
+# 같은 (before, after) 행 찾기: 행 내용(바이트)으로 사전 조회
+# 반환값: (고유 행의 첫 위치 배열, 각 행 → 고유 행 번호 배열)
+def _unique_rows(before, after):
+    seen = {}
+    first = []
+    inverse = np.empty(len(before), dtype=np.intp)
+    for idx in range(len(before)):
+        key = (before[idx].tobytes(), after[idx].tobytes())
+        slot = seen.get(key)
+        if slot is None:
+            slot = seen[key] = len(first)
+            first.append(idx)
+        inverse[idx] = slot
+    return np.array(first, dtype=np.intp), inverse
+
+# 고유 행 결과를 원래 변수 순서로 펼치기
+def _expand_result(result, inverse):
+    expanded = {}
+    for key, value in result.items():
+        if isinstance(value, dict):
+            expanded[key] = _expand_result(value, inverse)
+        elif isinstance(value, np.ndarray):
+            expanded[key] = value[inverse]
+        else:
+            expanded[key] = value
+    return expanded
+
+# 변수 행(n_variables, n_subjects) 단위 계산 본체
+def _paired_batch_rows(before, after, alpha, tail):
+    n_vars, n = before.shape
+    diff = after - before
+
+    # 정규성 검정 (모든 변수를 한 번에)
+    normality = check_normality_batch(diff, alpha)
+
+    # t-검정 실행 (모든 변수를 한 번에)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t_stat = np.atleast_1d(stats.ttest_rel(after, before, axis=1).statistic)
+        d = np.mean(diff, axis=1) / np.std(diff, ddof=1, axis=1)
+    df = n - 1
+
+    # p-값과 임계값은 공용 t-분포 커널 사용
+    p = p_values(t_stat, df, tail)
+    crit = critical_value(alpha, df, tail)
+
+    # 방향성 설정
+    if tail == "two":
+        direction = None
+    else:
+        direction = np.where(t_stat > 0, "after > before", "after < before")
+
+    # 정규성 통과 + NaN 없음 → 단일 호출 경로에서 error가 None인 변수
+    valid = normality["passed"] & ~(np.isnan(t_stat) | np.isnan(p) | np.isnan(d))
+
+    return {
+        "t_stat": t_stat,
+        "p": p,
+        "df": np.full(n_vars, df),
+        "crit": np.full(n_vars, crit),
+        "direction": direction,
+        "cohen_d": np.round(d, 3),
+        "sig": valid & (p < alpha),
+        "tail": tail,
+        "alpha": alpha,
+        "normality": normality,
+        "valid": valid
+    }
@@ -0,0 +1,141 @@
+import copy
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+# ----------------------------------------------------------------
+# 내용 기반(content-addressed) 결과 캐시
+# - 키: 입력 배열 내용의 해시 + 검정 종류/매개변수 (같은 값이면 다른 리스트/배열 객체여도 같은 키)
+#   큰 입력(CACHE_MAX_N 초과)은 키를 만들지 않고 캐시를 건너뜀
+# - 두 단계로 보관
+#   1) 최종 결과 (검정, 데이터, alpha, tail, 옵션) → 같은 조건으로 다시 실행하면 그대로 반환
+#   2) alpha와 무관한 중간 값 (정규성 통계량, 평균/분산, t, 효과 크기)
+#      → alpha만 바뀌면 판정과 p-값/임계값만 다시 계산
+# - LRU 방식으로 항목 수와 메모리(바이트) 상한을 넘으면 오래된 항목부터 제거
+# - 분석 실행기(스레드)에서도 쓰이므로 잠금(lock)으로 보호
+# - 저장할 때와 꺼낼 때 모두 깊은 복사 → 호출한 쪽이 결과(TTestResult, 딕셔너리, 배열)를 고쳐도
+#   캐시에 보관된 값과 다음 조회 결과는 바뀌지 않음 (결과는 작은 객체라 복사 비용은 수십 µs)
+# ----------------------------------------------------------------
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_MAX_BYTES = 64 << 20
+
+# 키를 만드는 비용은 입력 크기에 비례하므로 큰 입력은 캐시하지 않음 (미스가 캐시 없을 때보다 느려지지 않도록)
+# - CACHE_MAX_N: 배열 하나의 최대 원소 수 (연속 float64 배열은 복사 없이 버퍼를 그대로 해시)
+# - COPY_MAX_N: 연속 float64가 아닌 입력(리스트, 정수, 열 슬라이스 등)을 float64로 복사해서 해시하는 최대 원소 수
+CACHE_MAX_N = 1 << 20
+COPY_MAX_N = 1 << 16
+
+
+# 배열 내용 해시 (float64 기준 → [1, 2]와 np.array([1., 2.])는 같은 키)
+# 반환값: 키 문자열, 입력이 너무 커서 캐시하지 않으면 None
+def array_key(*arrays):
+    digest = hashlib.blake2b(digest_size=16)
+    for array in arrays:
+        array = np.asarray(array)
+        if array.size > CACHE_MAX_N:
+            return None
+        if array.dtype != np.float64 or not array.flags.c_contiguous:
+            if array.size > COPY_MAX_N:
+                return None
+            array = np.ascontiguousarray(array, dtype=np.float64)
+        digest.update(str(array.shape).encode())
+        digest.update(array.data)
+    return digest.hexdigest()
+
+# 캐시 항목의 대략적인 메모리 크기 (배열은 nbytes, 나머지는 항목당 고정 크기로 추정)
+def _approx_nbytes(value):
+    if isinstance(value, np.ndarray):
+        return value.nbytes + 112
+    if isinstance(value, dict):
+        return 64 + sum(_approx_nbytes(item) for item in value.values()) + 32 * len(value)
+    if isinstance(value, (list, tuple)):
+        return 56 + sum(_approx_nbytes(item) for item in value)
+    if hasattr(value, "__slots__"):
+        return 48 + sum(_approx_nbytes(getattr(value, name, None)) for name in value.__slots__)
+    return 32
+
+
+class ResultCache:
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.nbytes = 0
+        self._entries = OrderedDict()  # key → (value, nbytes)
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return copy.deepcopy(entry[0])
+
+    # 반환값: 넘겨받은 value 그대로 (캐시에는 복사본을 보관)
+    def put(self, key, value):
+        nbytes = _approx_nbytes(value)
+        stored = copy.deepcopy(value) if nbytes <= self.max_bytes else None
+        with self._lock:
+            if key in self._entries:
+                self.nbytes -= self._entries.pop(key)[1]
+            if stored is None:
+                return value
+            self._entries[key] = (stored, nbytes)
+            self.nbytes += nbytes
+            while len(self._entries) > self.max_entries or self.nbytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.nbytes -= evicted
+                self.evictions += 1
+        return value
+
+    # 캐시에 있으면 반환, 없으면 compute()로 계산해서 저장 (계산은 잠금 밖에서 수행)
+    def get_or_compute(self, key, compute):
+        value = self.get(key)
+        if value is None:
+            value = self.put(key, compute())
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def reset_stats(self):
+        with self._lock:
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "nbytes": self.nbytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes
+            }
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# 러너 공용 캐시 (ttest_logic의 cache=True 경로에서 사용)
+result_cache = ResultCache()
+
+
+def cache_info():
+    return result_cache.info()
+
+
+def clear_cache():
+    result_cache.clear()
+    result_cache.reset_stats()
@@ -1,5 +1,14 @@
 import numpy as np
 import scipy.stats as stats
+from stats.tools.analysis_executor import AnalysisCancelled
+from stats.tools.t_test.instrumentation import instrumented, phase
+from stats.tools.t_test.normality import apply_normality_alpha, normality_statistics
+from stats.tools.t_test.t_dist import critical_value, p_values
+from stats.tools.t_test.ttest_cache import array_key, result_cache
+from stats.tools.t_test.ttest_result import TTestResult, interpret_cohens_d
+from stats.tools.t_test.ttest_resample import (
+    EXACT_MAX_N, sign_flip_test, resample_paired, resample_independent
+)
 
 # ----------------------------
 # 0. 공통 유틸 함수
@@ -16,331 +25,343 @@ def compute_sd(data):
 # 셋 중 하나라도 통과하면 정규성을 만족한 것으로 간주
 # alpha: 유의수준, 기본값 0.05
 # 반환값: 각 검정의 결과 및 통과 여부 포함한 딕셔너리
-def check_normality(group, alpha=0.05):
-    group = np.array(group)
-
-    # Shapiro-Wilk 검정 수행
-    shapiro_p = stats.shapiro(group).pvalue
-    shapiro_pass = shapiro_p > alpha
-
-    # Kolmogorov-Smirnov 검정 수행 (평균과 표준편차 기준 정규분포 적합도)
-    ks_p = stats.kstest(group, 'norm', args=(np.mean(group), np.std(group, ddof=1))).pvalue
-    ks_pass = ks_p > alpha
-
-    # Anderson-Darling 검정 수행
-    ad_result = stats.anderson(group)
-    ad_stat = ad_result.statistic
-    ad_crit = ad_result.critical_values[2]  # 유의수준 5% 기준값
-    ad_pass = ad_stat < ad_crit
-
-    # 하나라도 통과하면 정규성 만족으로 판정
-    passed = sum([shapiro_pass, ks_pass, ad_pass]) >= 1
-
-    return {
-        "passed": passed,
-        "shapiro_p": shapiro_p,
-        "shapiro_pass": shapiro_pass,
-        "ks_p": ks_p,
-        "ks_pass": ks_pass,
-        "ad_stat": ad_stat,
-        "ad_crit": ad_crit,
-        "ad_pass": ad_pass
-    }
-
-# Cohen's d 해석 텍스트 반환 함수
-# 입력값 d의 절댓값 크기에 따라 효과 크기를 텍스트로 반환
-def interpret_cohens_d(d):
-    d = abs(d)
-    if d < 0.2:
-        return "negligible"
-    elif d < 0.5:
-        return "small"
-    elif d < 0.8:
-        return "medium"
-    else:
-        return "large"
+# (계산은 배치 엔진이 담당, 정렬/표준화를 세 검정이 공유)
+# cache=True면 alpha와 무관한 통계량을 데이터 해시로 캐시 → alpha만 바꾼 재실행은 판정만 다시 함
+# cancel: 취소 확인 콜백 (대용량 그룹의 청크마다 호출)
+def check_normality(group, alpha=0.05, cache=True, cancel=None):
+    result = apply_normality_alpha(_normality_statistics([group], cache, cancel), alpha)
+    return {key: value[0] for key, value in result.items()}
+
+# 정규성 통계량 (캐시 조회 후 없으면 계산)
+def _normality_statistics(groups, cache, cancel=None):
+    data_key = array_key(*groups) if cache else None
+    if data_key is None:
+        return normality_statistics(groups, cancel)
+    return result_cache.get_or_compute(("normality", data_key), lambda: normality_statistics(groups, cancel))
+
+# 캐시 키가 있으면 캐시 조회 후 없으면 compute()로 계산
+def _cached(key, compute):
+    if key is None:
+        return compute()
+    return result_cache.get_or_compute(key, compute)
+
+# 시드 없이 무작위 재표집(Monte Carlo / bootstrap)을 쓴 결과는 실행마다 달라지므로 결과 캐시에 넣지 않음
+def _reproducible(result, seed):
+    if seed is not None:
+        return True
+    if result.resampling is not None:
+        return False
+    permutation = result.permutation
+    return permutation is None or permutation.get("exact") or "n_resamples" not in permutation
+
+# Cohen's d 해석 텍스트 반환 함수 (결과 객체와 공유하므로 ttest_result에 정의)
+# interpret_cohens_d(d): 입력값 d의 절댓값 크기에 따라 효과 크기를 텍스트로 반환
+
+# 러너 공통 오류 메시지 (결과 객체에는 이 상수만 참조로 저장)
+PAIRED_NORMALITY_ERROR = "Normality assumption not met.\nConsider using Wilcoxon Signed-Rank test."
+INDEPENDENT_NORMALITY_ERROR = (
+    "❌ Normality assumption not met in one or both groups.\n"
+    "Consider using Mann-Whitney U test."
+)
+ONE_SAMPLE_NORMALITY_ERROR = "❌ Normality assumption not met.\nConsider using Wilcoxon signed-rank test."
+NAN_ERROR = "T-test failed: one or more test statistics could not be calculated (NaN encountered)."
 
 # ----------------------------------------------
 # 1. Paired t-test (두 집단 간 대응표본 t-검정)
 # ----------------------------------------------
 
-def run_paired_ttest(before, after, alpha=0.05, tail="two", return_dict=False):
+# 반환값: TTestResult (숫자만 보관, 보고서 문자열은 to_text()/to_apa()/to_markdown() 호출 시 생성)
+#   - 기존 딕셔너리처럼 result["p"], result.get("permutation") 등으로 조회 가능
+#   - return_dict는 이전 호출 코드와의 호환용 인자 (값과 관계없이 같은 객체 반환)
+# resample=True면 정규성 미충족 시 permutation p-값과 bootstrap 신뢰구간을 "resampling"에 함께 반환
+#   - resample_max_n / resample_budget: 재표집의 부분 표본 상한 / 계산량 상한 (기본값 None → 전체 표본,
+#     n_resamples 그대로). 지정해서 적용되면 resampling["subsample"] / ["reduced_resamples"]에 기록
+# permutation: 부호 뒤집기 permutation p-값을 "permutation"에 함께 반환
+#   - "auto": n ≤ EXACT_MAX_N이면 모든 부호 조합을 열거하는 정확 검정, 그보다 크면 t-분포(analytic) p-값
+#   - "exact" / "monte_carlo": 해당 방식 강제, None: 계산하지 않음
+# progress: 단계 시작마다 호출되는 콜백 progress(phase) (예: AnalysisJob.report)
+#   - "normality" / "test" / "resampling" 순서로 호출, 콜백이 AnalysisCancelled를 던지면 그대로 전파
+# cancel: 오래 걸리는 단계 안에서 청크마다 호출되는 취소 확인 콜백 cancel() (예: AnalysisJob.check)
+#   - 대용량 정규성 검정의 청크, 재표집 청크, 정확 검정의 Gray-code 청크마다 호출
+# cache: 같은 데이터/조건의 결과와 alpha와 무관한 중간 값(정규성 통계량, t, d)을 result_cache에서 재사용
+# instrument: True면 단계별 시간을 result.timings에 기록 (None이면 instrumentation 전역 설정을 따름)
+@instrumented("paired")
+def run_paired_ttest(before, after, alpha=0.05, tail="two", return_dict=False,
+                     resample=False, n_resamples=10000, seed=None, n_jobs=1, permutation=None,
+                     progress=None, cancel=None, cache=True, resample_max_n=None, resample_budget=None):
+    report = progress or (lambda name: None)
     try:
-        # 입력값 numpy 배열화
-        before = np.array(before)
-        after = np.array(after)
+        # 입력값 numpy 배열화 (이미 배열이면 복사 없이 그대로 사용)
+        before = np.asarray(before)
+        after = np.asarray(after)
+
+        # 같은 조건으로 이미 실행한 결과가 있으면 그대로 반환
+        with phase("cache_lookup", before.size + after.size):
+            data_key = array_key(before, after) if cache else None
+            result_key = data_key and (
+                "paired", data_key, alpha, tail, resample, n_resamples, seed, permutation,
+                resample_max_n, resample_budget
+            )
+            cached = result_cache.get(result_key) if result_key else None
+        if cached is not None:
+            return cached
+
         diff = after - before
 
         # 정규성 검정
-        norm = check_normality(diff.tolist(), alpha)
+        report("normality")
+        with phase("normality", diff.size):
+            norm = check_normality(diff, alpha, cache, cancel)
 
         # 정규성 미충족 시 종료
         if not norm["passed"]:
-            error_msg = {
-                "error": "Normality assumption not met.\nConsider using Wilcoxon Signed-Rank test.",
-                "normality": norm
-            }
-            return error_msg if return_dict else error_msg["error"]
+            resampling = None
+            if resample:
+                report("resampling")
+                with phase("resampling", diff.size):
+                    resampling = resample_paired(
+                        before, after, alpha, tail, n_resamples, seed, n_jobs,
+                        max_n=resample_max_n, budget=resample_budget, cancel=cancel
+                    )
+            result = TTestResult.failed(
+                "paired", PAIRED_NORMALITY_ERROR, tail=tail, alpha=alpha, normality=norm, resampling=resampling
+            )
+            if result_key and _reproducible(result, seed):
+                result_cache.put(result_key, result)
+            return result
 
-        # t-검정 실행
-        t_stat, p_two = stats.ttest_rel(after, before)
-        df = len(before) - 1  # 자유도 계산
+        # t-검정 실행 (p-값과 임계값은 공용 t-분포 커널 사용)
+        # t, 자유도, 효과 크기는 alpha/tail과 무관하므로 캐시
+        report("test")
+        with phase("ttest", diff.size):
+            t_stat, df, d = _cached(
+                data_key and ("paired_moments", data_key), lambda: _paired_moments(before, after, diff)
+            )
+        with phase("p_value"):
+            p = p_values(t_stat, df, tail)
+            crit = critical_value(alpha, df, tail)
 
         # 방향성 설정
         if tail == "two":
-            p = p_two
-            crit = stats.t.ppf(1 - alpha / 2, df)
             direction = None
         else:
-            p = p_two / 2
-            crit = stats.t.ppf(1 - alpha, df)
             direction = "after > before" if t_stat > 0 else "after < before"
 
-        # 효과 크기 계산
-        d = (np.mean(diff)) / np.std(diff, ddof=1)
-
         # NaN 발생 시 예외 반환
         if np.isnan(t_stat) or np.isnan(p) or np.isnan(d):
-            return {
-                "error": "T-test failed: one or more test statistics could not be calculated (NaN encountered).",
-                "normality": norm
-            } if return_dict else "T-test failed due to NaN in results."
-
-        d_val = round(d, 3)
-        d_interp = interpret_cohens_d(d)
-        sig = "Significant" if p < alpha else "Not Significant"
-
-        # 결과 딕셔너리 생성
-        result = {
-            "t_stat": t_stat,
-            "p": p,
-            "df": df,
-            "crit": crit,
-            "direction": direction,
-            "cohen_d": d_val,
-            "cohen_d_interp": d_interp,
-            "sig": sig,
-            "tail": tail,
-            "alpha": alpha,
-            "normality": norm,
-            "error": None
-        }
-
-        if return_dict:
-            return result
+            return TTestResult.failed("paired", NAN_ERROR, tail=tail, alpha=alpha, normality=norm)
+
+        result = TTestResult(
+            "paired", t_stat=t_stat, p=p, df=df, crit=crit, direction=direction, d=d,
+            tail=tail, alpha=alpha, normality=norm
+        )
 
+        # 부호 뒤집기 permutation p-값 (소표본은 정확 검정)
+        if permutation == "auto" and len(diff) > EXACT_MAX_N:
+            result.permutation = {"method": "Analytic t-distribution", "p": p, "tail": tail, "exact": False}
+        elif permutation is not None:
+            report("resampling")
+            with phase("permutation", diff.size):
+                result.permutation = sign_flip_test(
+                    before, after, tail, permutation, n_resamples, seed, n_jobs, cancel
+                )
+
+        if result_key and _reproducible(result, seed):
+            result_cache.put(result_key, result)
+        return result
+
+    except AnalysisCancelled:
+        raise
     except Exception as e:
-        err = f"❌ Error: {e}"
-        return {"error": err} if return_dict else err
+        return TTestResult.failed("paired", f"❌ Error: {e}", tail=tail, alpha=alpha)
+
+
+# 대응표본 t, 자유도, 효과 크기 (alpha와 무관)
+def _paired_moments(before, after, diff):
+    t_stat = stats.ttest_rel(after, before).statistic
+    df = len(before) - 1  # 자유도 계산
+    d = (np.mean(diff)) / np.std(diff, ddof=1)  # 효과 크기 계산
+    return t_stat, df, d
 
 # ----------------------------------------------
 # 2. Independent t-test (독립표본 t-검정)
 # ----------------------------------------------
 
-def run_independent_ttest(group1, group2, alpha=0.05, tail="two"):
+# 반환값: TTestResult (str(result)는 기존 보고서 문자열과 같음)
+# resample=True면 정규성 미충족 시 permutation p-값과 bootstrap 신뢰구간을 "resampling"에 함께 반환
+#   (resample_max_n / resample_budget은 run_paired_ttest와 같음)
+# cache: 같은 데이터/조건의 결과와 alpha와 무관한 중간 값(정규성 통계량, Levene p, 평균/분산)을 재사용
+# instrument: True면 단계별 시간을 result.timings에 기록
+@instrumented("independent")
+def run_independent_ttest(group1, group2, alpha=0.05, tail="two",
+                          resample=False, n_resamples=10000, seed=None, n_jobs=1, cache=True,
+                          resample_max_n=None, resample_budget=None):
     try:
-        group1 = np.array(group1)
-        group2 = np.array(group2)
+        group1 = np.asarray(group1)
+        group2 = np.asarray(group2)
 
-        # 정규성 검정
-        norm1 = check_normality(group1, alpha)
-        norm2 = check_normality(group2, alpha)
+        size = group1.size + group2.size
 
-        # 정규성 미충족 시 종료
-        if not (norm1["passed"] and norm2["passed"]):
-            return (
-                "❌ Normality assumption not met in one or both groups.\n"
-                "Consider using Mann-Whitney U test."
+        # 같은 조건으로 이미 실행한 결과가 있으면 그대로 반환
+        with phase("cache_lookup", size):
+            data_key = array_key(group1, group2) if cache else None
+            result_key = data_key and (
+                "independent", data_key, alpha, tail, resample, n_resamples, seed, resample_max_n, resample_budget
             )
+            cached = result_cache.get(result_key) if result_key else None
+        if cached is not None:
+            return cached
 
-        # 분산 동질성 검정
-        levene_stat, levene_p = stats.levene(group1, group2)
-        equal_var = levene_p > alpha
-
-        # 평균, 분산, 샘플 수 계산
-        m1, m2 = np.mean(group1), np.mean(group2)
-        s1, s2 = np.var(group1, ddof=1), np.var(group2, ddof=1)
-        n1, n2 = len(group1), len(group2)
-
-        # Student's t-test 또는 Welch's t-test 분기 처리
-        if equal_var:
-            test_used = "Student's t-test"
-            df = n1 + n2 - 2
-            t_stat, p_two = stats.ttest_ind(group1, group2, equal_var=True)
-            crit = stats.t.ppf(1 - alpha / 2 if tail == "two" else 1 - alpha, df)
-            pooled_sd = np.sqrt(((n1 - 1)*s1 + (n2 - 1)*s2) / df)
-            d = (m1 - m2) / pooled_sd
-        else:
-            test_used = "Welch's t-test"
-            se = np.sqrt(s1/n1 + s2/n2)
-            t_stat = (m1 - m2) / se
-            df = ((s1/n1 + s2/n2)**2) / (((s1/n1)**2)/(n1-1) + ((s2/n2)**2)/(n2-1))
-            p_two = 2 * (1 - stats.t.cdf(abs(t_stat), df))
-            crit = stats.t.ppf(1 - alpha / 2 if tail == "two" else 1 - alpha, df)
-            d = (m1 - m2) / ((np.std(group1, ddof=1) + np.std(group2, ddof=1)) / 2)
-
-        # p-값 및 방향 해석
-        p = p_two if tail == "two" else p_two / 2
-        direction = None if tail == "two" else ("group1 < group2" if t_stat > 0 else "group1 > group2")
-
-        d_val = round(d, 3)
-        d_interp = interpret_cohens_d(d)
-        sig = "✅ Significant" if p < alpha else "❌ Not Significant"
-
-        # 출력 문자열 구성 (뷰에서 추후 분리 예정)
-        sd1 = compute_sd(group1)
-        sd2 = compute_sd(group2)
-        output = "🔍 Independent T-test Result\n"
-        output += f"- Test Used: {test_used}\n"
-        output += f"- Variance Equality: {'Passed (Levene’s p = {:.4f})'.format(levene_p) if equal_var else 'Failed (Levene’s p = {:.4f})'.format(levene_p)}\n"
-        if direction:
-            output += f"- Direction: {direction}\n"
-        output += (
-            f"- t({df:.2f}) = {t_stat:.3f}\n"
-            f"- p = {p:.4f} ({tail}-tailed)\n"
-            f"- Critical value = {crit:.3f} (α = {alpha})\n"
-            f"- SD(Group 1) = {sd1}\n"
-            f"- SD(Group 2) = {sd2}\n"
-            f"- Cohen's d = {d_val} ({d_interp})\n"
-            f"- Result: {sig}\n"
-        )
-
-        # 참고문헌 추가
-        output += "\nReferences (APA 7th Edition):\n"
-        output += "Gosset, W. S. (1908). The probable error of a mean.\n"
-        output += "*Biometrika, 6*(1), 1-25. https://doi.org/10.1093/biomet/6.1.1\n"
-        output += "Welch, B. L. (1947). The generalization of Student's problem when several different\n"
-        output += "population variances are involved. *Biometrika, 34*(1-2), 28-35.\n"
-        output += "https://doi.org/10.1093/biomet/34.1-2.28\n"
-        output += "Virtanen, P., Gommers, R., Oliphant, T. E., et al. (2020). SciPy 1.0.\n"
-        output += "*Nature Methods, 17*(3), 261-272. https://doi.org/10.1038/s41592-019-0686-2"
+        # 정규성 검정 (두 그룹을 한 번에)
+        with phase("normality", size):
+            norm = apply_normality_alpha(_normality_statistics([group1, group2], cache), alpha)
 
-        return output
-
-    except Exception as e:
-        return f"❌ Error: {e}"
-
-# -----------------------------------------------
-# 3. One-sample t-test (단일 표본 t-검정)
-# -----------------------------------------------
-
-def run_one_sample_ttest(sample, mu, alpha=0.05, tail="two"):
-    try:
-        sample = np.array(sample)
-        n = len(sample)
-        df = n - 1
-
-        # 정규성 검정
-        norm = check_normality(sample.tolist(), alpha)
-        if not norm["passed"]:
-            return (
-                "❌ Normality assumption not met.\n"
-                "Consider using Wilcoxon signed-rank test."
+        # 정규성 미충족 시 종료
+        if not norm["passed"].all():
+            resampling = None
+            if resample:
+                with phase("resampling", size):
+                    resampling = resample_independent(
+                        group1, group2, alpha, tail, n_resamples, seed, n_jobs,
+                        max_n=resample_max_n, budget=resample_budget
+                    )
+            result = TTestResult.failed(
+                "independent", INDEPENDENT_NORMALITY_ERROR, tail=tail, alpha=alpha,
+                normality=norm, resampling=resampling
             )
-
-        sample_mean = np.mean(sample)
-        sample_std = np.std(sample, ddof=1)
-        se = sample_std / np.sqrt(n)
-        t_stat = (sample_mean - mu) / se
-
-        if tail == "two":
-            p = 2 * (1 - stats.t.cdf(abs(t_stat), df))
-            crit = stats.t.ppf(1 - alpha / 2, df)
-            direction = None
         else:
-            p = 1 - stats.t.cdf(t_stat, df) if t_stat > 0 else stats.t.cdf(t_stat, df)
-            crit = stats.t.ppf(1 - alpha, df)
-            direction = "μ < sample mean" if t_stat > 0 else "μ > sample mean"
+            # 분산 동질성 검정, 평균/분산 등은 alpha와 무관하므로 캐시
+            with phase("ttest", size):
+                moments = _cached(
+                    data_key and ("independent_moments", data_key), lambda: _independent_moments(group1, group2)
+                )
+            with phase("p_value"):
+                result = _independent_result(moments, alpha, tail, norm)
+
+        if result_key and _reproducible(result, seed):
+            result_cache.put(result_key, result)
+        return result
 
-        d = (sample_mean - mu) / sample_std
-        d_val = round(d, 3)
-        d_interp = interpret_cohens_d(d)
-        sig = "✅ Significant" if p < alpha else "❌ Not Significant"
-
-        output = "🔍 One-sample T-test Result\n"
-        if direction:
-            output += f"- Direction: {direction}\n"
-        output += (
-            f"- Population mean (μ) = {mu}\n"
-            f"- Sample mean = {sample_mean:.3f}\n"
-            f"- t({df}) = {t_stat:.3f}\n"
-            f"- p = {p:.4f} ({tail}-tailed)\n"
-            f"- Critical value = {crit:.3f} (α = {alpha})\n"
-            f"- Cohen’s d = {d_val} ({d_interp})\n"
-            f"- Result: {sig}\n"
-        )
+    except Exception as e:
+        return TTestResult.failed("independent", f"❌ Error: {e}", tail=tail, alpha=alpha)
 
-        # 참고문헌 추가
-        output += "\nReferences (APA 7th Edition):\n"
-        output += "Gosset, W. S. (1908). The probable error of a mean.\n"
-        output += "*Biometrika, 6*(1), 1–25. https://doi.org/10.1093/biomet/6.1.1\n"
-        output += "Virtanen, P., Gommers, R., Oliphant, T. E., et al. (2020). SciPy 1.0.\n"
-        output += "*Nature Methods, 17*(3), 261–272. https://doi.org/10.1038/s41592-019-0686-2"
 
-        return output
+# 독립표본 중간 값 (Levene p, 평균, 분산, 표본 수, Student's t) — alpha와 무관
+def _independent_moments(group1, group2):
+    levene_stat, levene_p = stats.levene(group1, group2)
+    return {
+        "levene_p": levene_p,
+        "m1": np.mean(group1), "m2": np.mean(group2),
+        "s1": np.var(group1, ddof=1), "s2": np.var(group2, ddof=1),
+        "sd1": np.std(group1, ddof=1), "sd2": np.std(group2, ddof=1),
+        "n1": len(group1), "n2": len(group2),
+        "t_student": stats.ttest_ind(group1, group2, equal_var=True).statistic
+    }
 
-    except Exception as e:
-        return f"❌ Error: {e}"
+# 중간 값 + alpha → 검정 결과 (등분산 여부에 따라 Student / Welch 선택)
+def _independent_result(moments, alpha, tail, norm):
+    levene_p = moments["levene_p"]
+    equal_var = levene_p > alpha
+    m1, m2 = moments["m1"], moments["m2"]
+    s1, s2 = moments["s1"], moments["s2"]
+    sd1, sd2 = moments["sd1"], moments["sd2"]
+    n1, n2 = moments["n1"], moments["n2"]
+
+    # Student's t-test 또는 Welch's t-test 분기 처리
+    if equal_var:
+        test_used = "Student's t-test"
+        df = n1 + n2 - 2
+        t_stat = moments["t_student"]
+        pooled_sd = np.sqrt(((n1 - 1)*s1 + (n2 - 1)*s2) / df)
+        d = (m1 - m2) / pooled_sd
+    else:
+        test_used = "Welch's t-test"
+        se = np.sqrt(s1/n1 + s2/n2)
+        t_stat = (m1 - m2) / se
+        df = ((s1/n1 + s2/n2)**2) / (((s1/n1)**2)/(n1-1) + ((s2/n2)**2)/(n2-1))
+        d = (m1 - m2) / ((sd1 + sd2) / 2)
+
+    # p-값, 임계값 및 방향 해석 (공용 t-분포 커널)
+    p = p_values(t_stat, df, tail)
+    crit = critical_value(alpha, df, tail)
+    direction = None if tail == "two" else ("group1 < group2" if t_stat > 0 else "group1 > group2")
+
+    return TTestResult(
+        "independent", t_stat=t_stat, p=p, df=df, crit=crit, direction=direction, d=d,
+        tail=tail, alpha=alpha, normality=norm, test_used=test_used, levene_p=levene_p,
+        sd1=sd1, sd2=sd2
+    )
 
 # -----------------------------------------------
 # 3. One-sample t-test (two-tailed & one-tailed)
 # -----------------------------------------------
 
-def run_one_sample_ttest(sample, mu, alpha=0.05, tail="two"):
+# 반환값: TTestResult (str(result)는 기존 보고서 문자열과 같음)
+# cache: 같은 데이터/조건의 결과와 정규성 통계량, 평균/표준편차를 재사용
+# instrument: True면 단계별 시간을 result.timings에 기록
+@instrumented("one_sample")
+def run_one_sample_ttest(sample, mu, alpha=0.05, tail="two", cache=True):
     try:
-        sample = np.array(sample)
+        sample = np.asarray(sample)
         n = len(sample)
         df = n - 1
 
+        with phase("cache_lookup", n):
+            data_key = array_key(sample) if cache else None
+            result_key = data_key and ("one_sample", data_key, mu, alpha, tail)
+            cached = result_cache.get(result_key) if result_key else None
+        if cached is not None:
+            return cached
+
         # 정규성 검정
-        norm = check_normality(sample.tolist(), alpha)
+        with phase("normality", n):
+            norm = check_normality(sample, alpha, cache)
         if not norm["passed"]:
-            return (
-                "❌ Normality assumption not met.\n"
-                "Consider using Wilcoxon signed-rank test."
+            result = TTestResult.failed(
+                "one_sample", ONE_SAMPLE_NORMALITY_ERROR, tail=tail, alpha=alpha, normality=norm
             )
+            if result_key:
+                result_cache.put(result_key, result)
+            return result
 
-        sample_mean = np.mean(sample)
-        sample_std = np.std(sample, ddof=1)
-        se = sample_std / np.sqrt(n)
-        t_stat = (sample_mean - mu) / se
+        with phase("ttest", n):
+            sample_mean, sample_std = _cached(
+                data_key and ("one_sample_moments", data_key), lambda: (np.mean(sample), np.std(sample, ddof=1))
+            )
+            se = sample_std / np.sqrt(n)
+            t_stat = (sample_mean - mu) / se
 
+        # p-값과 임계값은 공용 t-분포 커널 사용 (단측은 t의 부호 방향 꼬리)
+        with phase("p_value"):
+            p = p_values(t_stat, df, tail)
+            crit = critical_value(alpha, df, tail)
         if tail == "two":
-            p = 2 * (1 - stats.t.cdf(abs(t_stat), df))
-            crit = stats.t.ppf(1 - alpha / 2, df)
             direction = None
         else:
-            p = 1 - stats.t.cdf(t_stat, df) if t_stat > 0 else stats.t.cdf(t_stat, df)
-            crit = stats.t.ppf(1 - alpha, df)
             direction = "μ < sample mean" if t_stat > 0 else "μ > sample mean"
 
         d = (sample_mean - mu) / sample_std
-        d_val = round(d, 3)
-        d_interp = interpret_cohens_d(d)
-        sig = "✅ Significant" if p < alpha else "❌ Not Significant"
-
-        # ⚠️ 결과 문자열 조립 – 나중에 view(one_sample_two.py / one_sample_one.py)로 분리 예정
-        output = "🔍 One-sample T-test Result\n"
-        if direction:
-            output += f"- Direction: {direction}\n"
-        output += (
-            f"- Population mean (μ) = {mu}\n"
-            f"- Sample mean = {sample_mean:.3f}\n"
-            f"- t({df}) = {t_stat:.3f}\n"
-            f"- p = {p:.4f} ({tail}-tailed)\n"
-            f"- Critical value = {crit:.3f} (α = {alpha})\n"
-            f"- Cohen’s d = {d_val} ({d_interp})\n"
-            f"- Result: {sig}\n"
-        )
 
-        output += "\nReferences (APA 7th Edition):\n"
-        output += "Gosset, W. S. (1908). The probable error of a mean.\n"
-        output += "*Biometrika, 6*(1), 1–25. https://doi.org/10.1093/biomet/6.1.1\n"
-        output += "Virtanen, P., Gommers, R., Oliphant, T. E., et al. (2020). SciPy 1.0.\n"
-        output += "*Nature Methods, 17*(3), 261–272. https://doi.org/10.1038/s41592-019-0686-2"
-
-        return output
+        result = TTestResult(
+            "one_sample", t_stat=t_stat, p=p, df=df, crit=crit, direction=direction, d=d,
+            tail=tail, alpha=alpha, normality=norm, mu=mu, sample_mean=sample_mean
+        )
+        if result_key:
+            result_cache.put(result_key, result)
+        return result
 
     except Exception as e:
-        return f"❌ Error: {e}"
+        return TTestResult.failed("one_sample", f"❌ Error: {e}", tail=tail, alpha=alpha)
+
+# ----------------------------------------------
+# 4. 워밍업 (앱 첫 화면 표시 후 백그라운드에서 1회 호출)
+# ----------------------------------------------
 
+# SciPy t-분포/정규성 검정 초기화와 계수 캐시 채우기를 미리 끝내서 첫 Run 클릭이 느리지 않도록 함
+# 결과 캐시는 쓰지 않음 (cache=False) → 사용자 데이터용 캐시 공간을 차지하지 않음
+def warm_up():
+    rng = np.random.default_rng(0)
+    before = rng.normal(size=30)
+    after = before + rng.normal(0.5, 1, size=30)
+    run_paired_ttest(before, after, permutation="auto", cache=False, instrument=False)
+    run_independent_ttest(before, after, cache=False, instrument=False)
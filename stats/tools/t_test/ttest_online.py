@@ -0,0 +1,198 @@
+import numpy as np
+from stats.tools.t_test.t_dist import critical_value, p_values
+from stats.tools.t_test.ttest_result import TTestResult
+
+# ----------------------------------------------------------------
+# 온라인(스트리밍) t-검정 누산기
+# - 원자료를 보관하지 않고 개수(count), 평균(mean), 편차제곱합(M2)만 유지
+# - 배치 단위 update()와 누산기끼리의 merge()는 Welford/Chan 병합 공식 사용
+# - 원자료가 없으므로 정규성 검정과 Levene 검정은 수행하지 않음
+# ----------------------------------------------------------------
+
+# ----------------------------
+# 0. 공통 누산기
+# ----------------------------
+
+class OnlineMoments:
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    # 새 데이터 묶음 반영
+    # 묶음 내부는 NumPy 두 단계 계산(np.mean / np.var와 같은 방식), 기존 값과는 Chan 공식으로 병합
+    def update(self, batch):
+        batch = np.asarray(batch, dtype=np.float64).ravel()
+        if batch.size == 0:
+            return self
+        batch_mean = np.mean(batch)
+        centered = batch - batch_mean
+        batch_m2 = np.sum(centered * centered)
+        return self._combine(batch.size, batch_mean, batch_m2)
+
+    # 다른 누산기 병합 (예: 여러 스트림/프로세스에서 모은 결과 합치기)
+    def merge(self, other):
+        return self._combine(other.count, other.mean, other.m2)
+
+    def _combine(self, count, mean, m2):
+        if count == 0:
+            return self
+        if self.count == 0:
+            self.count, self.mean, self.m2 = count, float(mean), float(m2)
+            return self
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean = self.mean + delta * count / total
+        self.m2 = self.m2 + m2 + delta * delta * self.count * count / total
+        self.count = total
+        return self
+
+    # 표본 분산 (ddof=1)
+    @property
+    def variance(self):
+        return self.m2 / (self.count - 1) if self.count > 1 else np.nan
+
+    # 표본 표준편차 (ddof=1)
+    @property
+    def sd(self):
+        return np.sqrt(self.variance)
+
+
+# t-통계량, 자유도로부터 결과 객체 구성 (run_paired_ttest 반환값과 같은 TTestResult)
+def _build_result(test, t_stat, df, d, alpha, tail, direction_labels, n, **fields):
+    p = p_values(t_stat, df, tail)
+    crit = critical_value(alpha, df, tail)
+    if tail == "two":
+        direction = None
+    else:
+        direction = direction_labels[0] if t_stat > 0 else direction_labels[1]
+
+    if np.isnan(t_stat) or np.isnan(p) or np.isnan(d):
+        return TTestResult.failed(
+            test, "T-test failed: one or more test statistics could not be calculated (NaN encountered).",
+            tail=tail, alpha=alpha, n=n
+        )
+
+    return TTestResult(
+        test, t_stat=t_stat, p=p, df=df, crit=crit, direction=direction, d=d,
+        tail=tail, alpha=alpha, n=n, **fields
+    )
+
+
+def _not_enough_data(test, n, alpha, tail):
+    return TTestResult.failed(
+        test, "Not enough data: at least 2 observations are required per group.", tail=tail, alpha=alpha, n=n
+    )
+
+# -----------------------------------------------
+# 1. One-sample t-test 누산기
+# -----------------------------------------------
+
+class OnlineOneSampleTTest:
+    def __init__(self, mu):
+        self.mu = mu
+        self.moments = OnlineMoments()
+
+    def update(self, batch):
+        self.moments.update(batch)
+        return self
+
+    def merge(self, other):
+        self.moments.merge(other.moments)
+        return self
+
+    # run_one_sample_ttest와 같은 식으로 t, Cohen's d 계산
+    def result(self, alpha=0.05, tail="two"):
+        m = self.moments
+        if m.count < 2:
+            return _not_enough_data("one_sample", m.count, alpha, tail)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            se = m.sd / np.sqrt(m.count)
+            t_stat = (m.mean - self.mu) / se
+            d = (m.mean - self.mu) / m.sd
+        return _build_result(
+            "one_sample", t_stat, m.count - 1, d, alpha, tail, ("μ < sample mean", "μ > sample mean"), m.count,
+            mu=self.mu, sample_mean=m.mean
+        )
+
+# ----------------------------------------------
+# 2. Paired t-test 누산기 (차이값 after - before 누적)
+# ----------------------------------------------
+
+class OnlinePairedTTest:
+    def __init__(self):
+        self.moments = OnlineMoments()
+
+    def update(self, before, after):
+        before = np.asarray(before, dtype=np.float64)
+        after = np.asarray(after, dtype=np.float64)
+        if before.shape != after.shape:
+            raise ValueError("before and after batches must have the same length.")
+        self.moments.update(after - before)
+        return self
+
+    def merge(self, other):
+        self.moments.merge(other.moments)
+        return self
+
+    # stats.ttest_rel과 같은 식(평균 / sqrt(분산 / n))으로 t 계산
+    def result(self, alpha=0.05, tail="two"):
+        m = self.moments
+        if m.count < 2:
+            return _not_enough_data("paired", m.count, alpha, tail)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t_stat = m.mean / np.sqrt(m.variance / m.count)
+            d = m.mean / m.sd
+        return _build_result("paired", t_stat, m.count - 1, d, alpha, tail, ("after > before", "after < before"), m.count)
+
+# ----------------------------------------------
+# 3. Independent t-test 누산기
+# ----------------------------------------------
+
+# equal_var: True면 Student's t-test, False면 Welch's t-test
+# (Levene 검정은 원자료가 필요하므로 스트리밍에서는 호출자가 직접 지정)
+class OnlineIndependentTTest:
+    def __init__(self, equal_var=False):
+        self.equal_var = equal_var
+        self.group1 = OnlineMoments()
+        self.group2 = OnlineMoments()
+
+    def update(self, group1=None, group2=None):
+        if group1 is not None:
+            self.group1.update(group1)
+        if group2 is not None:
+            self.group2.update(group2)
+        return self
+
+    def merge(self, other):
+        self.group1.merge(other.group1)
+        self.group2.merge(other.group2)
+        return self
+
+    # run_independent_ttest의 Student / Welch 분기와 같은 식으로 계산
+    def result(self, alpha=0.05, tail="two"):
+        g1, g2 = self.group1, self.group2
+        n1, n2 = g1.count, g2.count
+        if n1 < 2 or n2 < 2:
+            return _not_enough_data("independent", min(n1, n2), alpha, tail)
+
+        m1, m2 = g1.mean, g2.mean
+        s1, s2 = g1.variance, g2.variance
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if self.equal_var:
+                df = n1 + n2 - 2
+                svar = ((n1 - 1) * s1 + (n2 - 1) * s2) / (n1 + n2 - 2.0)
+                t_stat = (m1 - m2) / np.sqrt(svar * (1.0 / n1 + 1.0 / n2))
+                pooled_sd = np.sqrt(((n1 - 1)*s1 + (n2 - 1)*s2) / df)
+                d = (m1 - m2) / pooled_sd
+            else:
+                se = np.sqrt(s1/n1 + s2/n2)
+                t_stat = (m1 - m2) / se
+                df = ((s1/n1 + s2/n2)**2) / (((s1/n1)**2)/(n1-1) + ((s2/n2)**2)/(n2-1))
+                d = (m1 - m2) / ((g1.sd + g2.sd) / 2)
+
+        test_used = "Student's t-test" if self.equal_var else "Welch's t-test"
+        return _build_result(
+            "independent", t_stat, df, d, alpha, tail, ("group1 < group2", "group1 > group2"), n1 + n2,
+            test_used=test_used, sd1=g1.sd, sd2=g2.sd
+        )
@@ -0,0 +1,502 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import FIRST_EXCEPTION, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+
+# ----------------------------------------------------------------
+# t-검정 계열 재표집(permutation / bootstrap) 엔진
+# - 정규성 가정이 깨졌을 때 사용하는 분포 가정 없는 대안
+# - 재표집은 블록 단위 벡터 연산으로 생성 (블록 하나 = 2차원 배열 한 번)
+# - 전체 재표집을 고정 크기 청크로 나누고 청크마다 SeedSequence.spawn 으로 독립 난수 스트림 부여
+#   → n_jobs 값과 관계없이 같은 seed면 항상 같은 결과
+# - 프로세스 풀은 처음 필요할 때 한 번 만들어 재사용 (spawn 방식 → 스레드가 도는 앱 프로세스를 fork하지 않음)
+#   계산량(재표집 수 × 표본 크기)이 POOL_MIN_WORK보다 작으면 n_jobs와 관계없이 현재 프로세스에서 실행
+# - cancel: 취소 확인 콜백 (예: AnalysisJob.check) — 블록마다 확인, 취소되었으면 예외 발생
+#   · 현재 프로세스: 블록마다 cancel()을 직접 호출
+#   · 프로세스 풀: 부모가 CANCEL_POLL_S마다 cancel()을 확인하고, 취소되면 공유 Event로 워커의 블록 루프를 멈춤
+# - 요청한 재표집 수와 전체 표본을 그대로 사용
+#   계산량 상한(budget)과 부분 표본(max_n)은 호출하는 쪽에서 지정할 때만 적용하고 결과에 기록
+# ----------------------------------------------------------------
+
+# 청크 하나에 들어가는 재표집 수 (난수 스트림 단위)
+CHUNK_SIZE = 8192
+
+# 블록 하나의 최대 원소 수 (행 수 × 표본 크기), 약 32MB(float64)
+BLOCK_ELEMENTS = 1 << 22
+
+# 정확(exact) 부호 뒤집기 검정을 자동 선택하는 최대 표본 크기 (2^24 ≈ 1,700만 가지)
+EXACT_MAX_N = 24
+
+# Gray-code 열거 시 한 번에 처리하는 단계 수
+GRAY_CHUNK = 1 << 16
+
+# 프로세스 풀로 보내는 최소 계산량 (재표집 수 × 표본 크기, 약 0.5초 분량)
+# 이보다 작으면 워커 시작/데이터 전송 비용이 더 커서 현재 프로세스에서 실행
+POOL_MIN_WORK = 1 << 26
+
+# 러너용 묶음 함수(resample_paired / resample_independent)에 지정할 수 있는 계산량 상한의 권장값
+# - max_n: 표본이 이보다 크면 그 수만큼 비복원 무작위 추출한 부분 표본으로 재표집
+# - budget: 재표집 수 × 표본 크기가 이 값을 넘지 않도록 재표집 수를 줄임 (최소 MIN_RESAMPLES)
+# 기본값은 둘 다 None (요청한 그대로 실행)
+RESAMPLE_MAX_N = 50_000
+RESAMPLE_BUDGET = 1 << 26
+MIN_RESAMPLES = 1000
+
+# 프로세스 풀 사용 시 부모가 취소 여부를 확인하는 간격 (초)
+CANCEL_POLL_S = 0.1
+
+
+class _ChunkStopped(Exception):
+    pass
+
+# 블록마다 호출: 취소되었으면 예외 발생
+def _check_stop(data):
+    stop = data.get("stop")
+    if stop is not None:
+        stop()
+
+
+def _block_rows(n):
+    return max(1, min(CHUNK_SIZE, BLOCK_ELEMENTS // max(n, 1)))
+
+# ----------------------------
+# 0. 블록 단위 재표집 함수 (청크 하나 처리)
+# ----------------------------
+
+# 대응표본 부호 뒤집기: 차이값 합계 (뒤집힌 값 = 전체 합 - 2 × 선택된 값의 합)
+def _sign_flip_sums(data, seed, size):
+    diff = data["diff"]
+    n = len(diff)
+    total = diff.sum()
+    rng = np.random.default_rng(seed)
+    out = np.empty(size)
+    rows = _block_rows(n)
+    for start in range(0, size, rows):
+        _check_stop(data)
+        stop = min(start + rows, size)
+        packed = rng.integers(0, 256, size=(stop - start, (n + 7) // 8), dtype=np.uint8)
+        flips = np.unpackbits(packed, axis=1, count=n)
+        out[start:stop] = total - 2 * (flips @ diff)
+    return out
+
+# 독립표본 라벨 섞기: 섞은 뒤 앞쪽 n1개를 group1로 보고 평균 차이 계산
+def _label_shuffle_diffs(data, seed, size):
+    pooled = data["pooled"]
+    n1 = data["n1"]
+    n2 = len(pooled) - n1
+    total = pooled.sum()
+    rng = np.random.default_rng(seed)
+    out = np.empty(size)
+    rows = _block_rows(len(pooled))
+    for start in range(0, size, rows):
+        _check_stop(data)
+        stop = min(start + rows, size)
+        shuffled = rng.permuted(np.tile(pooled, (stop - start, 1)), axis=1)
+        sum1 = shuffled[:, :n1].sum(axis=1)
+        out[start:stop] = sum1 / n1 - (total - sum1) / n2
+    return out
+
+# 대응표본 bootstrap: 차이값 복원추출 → (평균, Cohen's d)
+def _bootstrap_paired(data, seed, size):
+    diff = data["diff"]
+    n = len(diff)
+    rng = np.random.default_rng(seed)
+    out = np.empty((size, 2))
+    rows = _block_rows(n)
+    for start in range(0, size, rows):
+        _check_stop(data)
+        stop = min(start + rows, size)
+        sample = diff[rng.integers(0, n, size=(stop - start, n))]
+        mean = sample.mean(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            out[start:stop, 0] = mean
+            out[start:stop, 1] = mean / sample.std(axis=1, ddof=1)
+    return out
+
+# 독립표본 bootstrap: 그룹별 복원추출 → (평균 차이, 합동 표준편차 기준 Cohen's d)
+def _bootstrap_independent(data, seed, size):
+    group1 = data["group1"]
+    group2 = data["group2"]
+    n1, n2 = len(group1), len(group2)
+    rng = np.random.default_rng(seed)
+    out = np.empty((size, 2))
+    rows = _block_rows(n1 + n2)
+    for start in range(0, size, rows):
+        _check_stop(data)
+        stop = min(start + rows, size)
+        sample1 = group1[rng.integers(0, n1, size=(stop - start, n1))]
+        sample2 = group2[rng.integers(0, n2, size=(stop - start, n2))]
+        mean_diff = sample1.mean(axis=1) - sample2.mean(axis=1)
+        s1 = sample1.var(axis=1, ddof=1)
+        s2 = sample2.var(axis=1, ddof=1)
+        pooled_sd = np.sqrt(((n1 - 1)*s1 + (n2 - 1)*s2) / (n1 + n2 - 2))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            out[start:stop, 0] = mean_diff
+            out[start:stop, 1] = mean_diff / pooled_sd
+    return out
+
+# seed는 정수, None 또는 SeedSequence 모두 허용
+def _seed_sequence(seed):
+    return seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+
+# ----------------------------
+# 0-1. 프로세스 풀 (처음 필요할 때 만들고 재사용)
+# ----------------------------
+
+# 풀은 한 번에 한 호출만 사용 (취소용 Event를 호출 사이에 공유하므로)
+_pool = {"executor": None, "workers": 0, "stop": None}
+_pool_lock = threading.Lock()
+
+# 워커 프로세스 쪽: 풀을 만들 때 받은 취소 Event
+_POOL_STOP = {}
+
+
+def _init_pool_worker(stop_event):
+    _POOL_STOP["event"] = stop_event
+
+
+def _raise_if_stopped():
+    if _POOL_STOP["event"].is_set():
+        raise _ChunkStopped()
+
+# 워커 프로세스에서 실행: 맡은 청크들을 차례로 처리
+def _pool_task(worker, data, seeds, sizes):
+    data = dict(data, stop=_raise_if_stopped)
+    return [worker(data, seed, size) for seed, size in zip(seeds, sizes)]
+
+# _pool_lock을 잡은 상태에서 호출 (워커 수가 모자라면 더 큰 풀로 교체)
+def _get_pool(n_jobs):
+    if _pool["executor"] is None or _pool["workers"] < n_jobs:
+        _shutdown_pool()
+        context = multiprocessing.get_context("spawn")
+        stop_event = context.Event()
+        executor = ProcessPoolExecutor(
+            max_workers=n_jobs, mp_context=context, initializer=_init_pool_worker, initargs=(stop_event,)
+        )
+        _pool.update(executor=executor, workers=n_jobs, stop=stop_event)
+    return _pool["executor"], _pool["stop"]
+
+
+def _shutdown_pool():
+    if _pool["executor"] is not None:
+        _pool["executor"].shutdown(wait=False, cancel_futures=True)
+    _pool.update(executor=None, workers=0, stop=None)
+
+# 풀 종료 (다음 호출 때 다시 만듦)
+def shutdown_pool():
+    with _pool_lock:
+        _shutdown_pool()
+
+# 다른 호출이 풀을 쓰는 동안 기다리면서도 취소 확인
+def _acquire_pool(cancel):
+    while not _pool_lock.acquire(timeout=CANCEL_POLL_S):
+        if cancel is not None:
+            cancel()
+
+
+def _run_in_pool(worker, data, seeds, sizes, n_jobs, cancel):
+    groups = np.array_split(np.arange(len(sizes)), n_jobs)
+    _acquire_pool(cancel)
+    try:
+        futures = []
+        stop_event = None
+        try:
+            pool, stop_event = _get_pool(n_jobs)
+            stop_event.clear()
+            for group in groups:
+                futures.append(pool.submit(_pool_task, worker, data, [seeds[k] for k in group],
+                                           [sizes[k] for k in group]))
+            pending = futures
+            while pending:
+                if cancel is not None:
+                    cancel()
+                done, pending = wait(pending, timeout=CANCEL_POLL_S, return_when=FIRST_EXCEPTION)
+                for future in done:
+                    future.result()  # 워커 예외는 바로 전파
+        except BaseException as err:
+            if stop_event is not None:
+                stop_event.set()
+            for future in futures:
+                future.cancel()
+            wait(futures)  # 실행 중인 청크가 멈춘 뒤에 풀을 넘겨줌 (다음 호출이 Event를 다시 지우므로)
+            if isinstance(err, BrokenProcessPool):
+                _shutdown_pool()
+            raise
+        return [part for future in futures for part in future.result()]
+    finally:
+        _pool_lock.release()
+
+
+def _data_size(data):
+    return sum(len(value) for value in data.values() if isinstance(value, np.ndarray))
+
+# 재표집을 청크로 나눠 실행
+# n_jobs: 1이면 현재 프로세스, -1 또는 None이면 CPU 코어 수만큼 (계산량이 POOL_MIN_WORK 이상일 때만 풀 사용)
+def _run_chunks(worker, data, n_resamples, seed, n_jobs, cancel=None):
+    sizes = [min(CHUNK_SIZE, n_resamples - start) for start in range(0, n_resamples, CHUNK_SIZE)]
+    seeds = _seed_sequence(seed).spawn(len(sizes))
+
+    if n_jobs is None or n_jobs < 0:
+        n_jobs = os.cpu_count() or 1
+    n_jobs = min(n_jobs, len(sizes))
+
+    if n_jobs <= 1 or n_resamples * _data_size(data) < POOL_MIN_WORK:
+        local = dict(data, stop=cancel)
+        return np.concatenate([worker(local, s, size) for s, size in zip(seeds, sizes)])
+    return np.concatenate(_run_in_pool(worker, data, seeds, sizes, n_jobs, cancel))
+
+# 관측값 이상으로 극단적인 재표집 비율 → p-값 ((count + 1) / (B + 1), 0이 나오지 않도록 보정)
+# 부동소수점 오차로 같은 값이 다르게 비교되지 않도록 상대 허용오차 적용
+def _permutation_p(null, observed, tail):
+    tolerance = 1e-12 * max(abs(observed), 1.0)
+    if tail == "two":
+        extreme = np.abs(null) >= abs(observed) - tolerance
+    elif observed >= 0:
+        extreme = null >= observed - tolerance
+    else:
+        extreme = null <= observed + tolerance
+    return (np.count_nonzero(extreme) + 1) / (len(null) + 1)
+
+
+def _percentile_ci(values, confidence):
+    values = values[np.isfinite(values)]
+    if values.size == 0:
+        return (np.nan, np.nan)
+    lower = (1 - confidence) / 2 * 100
+    low, high = np.percentile(values, [lower, 100 - lower])
+    return (low, high)
+
+# ----------------------------------------------
+# 1. Permutation test
+# ----------------------------------------------
+
+# 대응표본 부호 뒤집기 검정 (Paired t-test 대안)
+# tail: "two"(양측) 또는 그 외(단측, 관측 평균 차이의 부호 방향)
+def permutation_test_paired(before, after, n_resamples=10000, tail="two", seed=None, n_jobs=1, cancel=None):
+    diff = np.asarray(after, dtype=np.float64) - np.asarray(before, dtype=np.float64)
+    observed = diff.sum()
+    null = _run_chunks(_sign_flip_sums, {"diff": diff}, n_resamples, seed, n_jobs, cancel)
+    return {
+        "method": "Sign-flip permutation test",
+        "statistic": observed / len(diff),  # 평균 차이 (after - before)
+        "p": _permutation_p(null, observed, tail),
+        "n_resamples": n_resamples,
+        "tail": tail
+    }
+
+# 독립표본 라벨 섞기 검정 (Independent t-test 대안)
+def permutation_test_independent(group1, group2, n_resamples=10000, tail="two", seed=None, n_jobs=1,
+                                 cancel=None):
+    group1 = np.asarray(group1, dtype=np.float64)
+    group2 = np.asarray(group2, dtype=np.float64)
+    observed = group1.mean() - group2.mean()
+    data = {"pooled": np.concatenate([group1, group2]), "n1": len(group1)}
+    null = _run_chunks(_label_shuffle_diffs, data, n_resamples, seed, n_jobs, cancel)
+    return {
+        "method": "Label-shuffle permutation test",
+        "statistic": observed,  # 평균 차이 (group1 - group2)
+        "p": _permutation_p(null, observed, tail),
+        "n_resamples": n_resamples,
+        "tail": tail
+    }
+
+# ----------------------------------------------
+# 1-1. 정확(exact) 부호 뒤집기 검정 (소표본용)
+# ----------------------------------------------
+
+# 2^(n-1)가지 부호 조합의 차이값 합계를 Gray-code 순서로 생성 (청크 단위)
+# - 이웃한 Gray code는 부호 하나만 다르므로 합계를 ±2·d[bit]만큼만 갱신 (단계당 O(1))
+# - 마지막 부호는 +로 고정: 나머지 절반은 합계의 부호만 반대 (S(~F) = -S(F))
+# - 누적 오차가 쌓이지 않도록 청크 첫 합계는 직접 다시 계산
+def _gray_code_sums(diff):
+    n = len(diff)
+    positions = np.arange(n)
+    n_patterns = 1 << (n - 1)
+    for start in range(0, n_patterns, GRAY_CHUNK):
+        steps = np.arange(start, min(start + GRAY_CHUNK, n_patterns), dtype=np.int64)
+        gray = steps ^ (steps >> 1)
+
+        first_signs = 1 - 2 * ((gray[0] >> positions) & 1)
+        sums = np.empty(len(steps))
+        sums[0] = diff @ first_signs
+        if len(steps) > 1:
+            k = steps[1:]
+            bit = np.frexp((k & -k).astype(np.float64))[1] - 1  # 이번 단계에서 바뀌는 비트 (k의 trailing zero 개수)
+            became_negative = (gray[1:] >> bit) & 1
+            delta = np.where(became_negative == 1, -2.0, 2.0) * diff[bit]
+            sums[1:] = sums[0] + np.cumsum(delta)
+        yield sums
+
+# 모든 부호 조합을 열거하는 정확 검정 (n ≤ EXACT_MAX_N 권장)
+def exact_sign_flip_test(before, after, tail="two", cancel=None):
+    diff = np.asarray(after, dtype=np.float64) - np.asarray(before, dtype=np.float64)
+    n = len(diff)
+    if n == 0:
+        raise ValueError("At least one pair is required.")
+
+    observed = diff.sum()
+    target = abs(observed)
+    tolerance = 1e-10 * max(np.abs(diff).sum(), 1.0)
+    count = 0
+    for sums in _gray_code_sums(diff):
+        if cancel is not None:
+            cancel()
+        if tail == "two":
+            count += np.count_nonzero(np.abs(sums) >= target - tolerance)
+        else:
+            # 나머지 절반(부호 반대)까지 포함해 관측 방향 꼬리 계산
+            signed = sums if observed >= 0 else -sums
+            count += np.count_nonzero(signed >= target - tolerance)
+            count += np.count_nonzero(-signed >= target - tolerance)
+
+    # 양측: |S|가 대칭이므로 절반 열거 결과가 그대로 비율
+    p = count / (1 << (n - 1)) if tail == "two" else count / (1 << n)
+    return {
+        "method": "Exact sign-flip permutation test (Gray-code enumeration)",
+        "statistic": observed / n,  # 평균 차이 (after - before)
+        "p": min(p, 1.0),
+        "n_resamples": 1 << n,
+        "tail": tail,
+        "exact": True
+    }
+
+# 표본 크기에 따라 정확 검정과 Monte Carlo 검정을 자동 선택
+# method: "auto" (n ≤ EXACT_MAX_N이면 exact), "exact", "monte_carlo"
+def sign_flip_test(before, after, tail="two", method="auto", n_resamples=10000, seed=None, n_jobs=1,
+                   cancel=None):
+    n = len(before)
+    if method == "exact" or (method == "auto" and n <= EXACT_MAX_N):
+        return exact_sign_flip_test(before, after, tail, cancel)
+    result = permutation_test_paired(before, after, n_resamples, tail, seed, n_jobs, cancel)
+    result["exact"] = False
+    return result
+
+# ----------------------------------------------
+# 2. Bootstrap 신뢰구간 (평균 차이, Cohen's d)
+# ----------------------------------------------
+
+def bootstrap_ci_paired(before, after, n_resamples=10000, confidence=0.95, seed=None, n_jobs=1, cancel=None):
+    diff = np.asarray(after, dtype=np.float64) - np.asarray(before, dtype=np.float64)
+    boot = _run_chunks(_bootstrap_paired, {"diff": diff}, n_resamples, seed, n_jobs, cancel)
+    return {
+        "method": "Percentile bootstrap",
+        "mean_diff_ci": _percentile_ci(boot[:, 0], confidence),
+        "cohen_d_ci": _percentile_ci(boot[:, 1], confidence),
+        "confidence": confidence,
+        "n_resamples": n_resamples
+    }
+
+
+def bootstrap_ci_independent(group1, group2, n_resamples=10000, confidence=0.95, seed=None, n_jobs=1,
+                             cancel=None):
+    data = {
+        "group1": np.asarray(group1, dtype=np.float64),
+        "group2": np.asarray(group2, dtype=np.float64)
+    }
+    boot = _run_chunks(_bootstrap_independent, data, n_resamples, seed, n_jobs, cancel)
+    return {
+        "method": "Percentile bootstrap",
+        "mean_diff_ci": _percentile_ci(boot[:, 0], confidence),
+        "cohen_d_ci": _percentile_ci(boot[:, 1], confidence),
+        "confidence": confidence,
+        "n_resamples": n_resamples
+    }
+
+# ----------------------------------------------
+# 3. 러너용 묶음 함수 (permutation p-값 + bootstrap 신뢰구간)
+# ----------------------------------------------
+
+# 서로 다른 난수 스트림을 쓰도록 seed에서 하위 seed 생성 (permutation, bootstrap, 부분 표본 추출)
+# (앞의 두 개는 개수와 관계없이 같으므로 부분 표본을 쓰지 않는 결과는 이전과 동일)
+def _split_seed(seed):
+    permutation_seed, bootstrap_seed, subsample_seed = _seed_sequence(seed).spawn(3)
+    return permutation_seed, bootstrap_seed, subsample_seed
+
+# 표본 크기 n에서 계산량 상한(budget)에 맞춘 재표집 수 (budget이 None이면 요청한 그대로)
+def scaled_resamples(n, n_resamples, budget=None):
+    if budget is None:
+        return n_resamples
+    floor = min(n_resamples, MIN_RESAMPLES)
+    return max(floor, min(n_resamples, budget // max(n, 1)))
+
+# n이 max_n보다 크면 max_n개 위치를 비복원 추출 (정렬된 인덱스), 아니면 None
+def _subsample_indices(n, max_n, seed):
+    if max_n is None or n <= max_n:
+        return None
+    rng = np.random.default_rng(seed)
+    return np.sort(rng.choice(n, size=max_n, replace=False))
+
+# 부분 표본 / 재표집 수 축소를 적용했으면 결과에 기록 (보고서 표시용)
+def _bundle(permutation, bootstrap, n_total, n_used, requested):
+    result = {"permutation": permutation, "bootstrap": bootstrap}
+    if n_used < n_total:
+        result["subsample"] = {"n": n_used, "of": n_total}
+    if bootstrap["n_resamples"] < requested:
+        result["reduced_resamples"] = {"n": bootstrap["n_resamples"], "requested": requested}
+    return result
+
+# 기본값은 전체 표본, 요청한 재표집 수 그대로
+# max_n: 부분 표본 상한 (예: RESAMPLE_MAX_N), budget: 재표집 수 × 표본 크기 상한 (예: RESAMPLE_BUDGET)
+# → 지정했고 실제로 적용되었으면 결과의 "subsample" / "reduced_resamples"에 기록
+def resample_paired(before, after, alpha=0.05, tail="two", n_resamples=10000, seed=None, n_jobs=1,
+                    max_n=None, budget=None, cancel=None):
+    permutation_seed, bootstrap_seed, subsample_seed = _split_seed(seed)
+    before = np.asarray(before, dtype=np.float64)
+    after = np.asarray(after, dtype=np.float64)
+    n_total = len(before)
+    index = _subsample_indices(n_total, max_n, subsample_seed)
+    if index is not None:
+        before, after = before[index], after[index]
+    used_resamples = scaled_resamples(len(before), n_resamples, budget)
+    return _bundle(
+        sign_flip_test(before, after, tail, "auto", used_resamples, permutation_seed, n_jobs, cancel),
+        bootstrap_ci_paired(before, after, used_resamples, 1 - alpha, bootstrap_seed, n_jobs, cancel),
+        n_total, len(before), n_resamples
+    )
+
+# 부분 표본은 그룹마다 따로 추출 (그룹 크기 비율 유지)
+def resample_independent(group1, group2, alpha=0.05, tail="two", n_resamples=10000, seed=None, n_jobs=1,
+                         max_n=None, budget=None, cancel=None):
+    permutation_seed, bootstrap_seed, subsample_seed = _split_seed(seed)
+    group1 = np.asarray(group1, dtype=np.float64)
+    group2 = np.asarray(group2, dtype=np.float64)
+    n_total = len(group1) + len(group2)
+    if max_n is not None and n_total > max_n:
+        seed1, seed2 = subsample_seed.spawn(2)
+        n1 = max(2, round(max_n * len(group1) / n_total))
+        group1 = group1[_subsample_indices(len(group1), n1, seed1)] if len(group1) > n1 else group1
+        n2 = max(2, max_n - len(group1))
+        group2 = group2[_subsample_indices(len(group2), n2, seed2)] if len(group2) > n2 else group2
+    n_used = len(group1) + len(group2)
+    used_resamples = scaled_resamples(n_used, n_resamples, budget)
+    return _bundle(
+        permutation_test_independent(group1, group2, used_resamples, tail, permutation_seed, n_jobs, cancel),
+        bootstrap_ci_independent(group1, group2, used_resamples, 1 - alpha, bootstrap_seed, n_jobs, cancel),
+        n_total, n_used, n_resamples
+    )
+
+# 재표집 결과를 결과 카드/보고서용 텍스트로 변환
+def format_resampling(result):
+    perm = result["permutation"]
+    boot = result["bootstrap"]
+    confidence = f"{boot['confidence'] * 100:g}%"
+    count = f"all {perm['n_resamples']} sign flips" if perm.get("exact") else f"{perm['n_resamples']} resamples"
+    subsample = result.get("subsample")
+    reduced = result.get("reduced_resamples")
+    note = (
+        f"Resampled on a random subsample of {subsample['n']:,} of {subsample['of']:,} observations.\n"
+        if subsample else ""
+    )
+    if reduced:
+        note += f"Resample count reduced from {reduced['requested']:,} to {reduced['n']:,} to bound run time.\n"
+    return note + (
+        f"{perm['method']} ({count}, {perm['tail']}-tailed):\n"
+        f"- Mean difference = {perm['statistic']:.3f}\n"
+        f"- p = {perm['p']:.4f}\n"
+        f"{boot['method']} ({boot['n_resamples']} resamples):\n"
+        f"- {confidence} CI of mean difference = [{boot['mean_diff_ci'][0]:.3f}, {boot['mean_diff_ci'][1]:.3f}]\n"
+        f"- {confidence} CI of Cohen's d = [{boot['cohen_d_ci'][0]:.3f}, {boot['cohen_d_ci'][1]:.3f}]"
+    )
@@ -0,0 +1,251 @@
+from time import perf_counter
+
+import numpy as np
+from stats.tools.t_test.instrumentation import record_phase
+from stats.tools.t_test.ttest_resample import format_resampling
+
+# ----------------------------------------------------------------
+# t-검정 결과 객체 (세 러너와 온라인 누산기 공용)
+# - 숫자 값만 __slots__에 보관 → 계산 경로에서는 문자열을 만들지 않음
+# - 보고서 문자열(일반 텍스트 / APA / Markdown)은 뷰가 요청할 때만 생성
+# - 기존 딕셔너리 반환값과 호환: result["p"], result.get("permutation"), "normality" in result
+# - str(result)는 기존 러너가 돌려주던 보고서 문자열과 같음
+# ----------------------------------------------------------------
+
+TEST_TITLES = {
+    "paired": "Paired T-test",
+    "independent": "Independent T-test",
+    "one_sample": "One-sample T-test"
+}
+
+SIGNIFICANT = "Significant"
+NOT_SIGNIFICANT = "Not Significant"
+
+# 성공 결과에 항상 들어 있는 키 (기존 run_paired_ttest 딕셔너리와 같은 순서)
+_CORE_KEYS = (
+    "t_stat", "p", "df", "crit", "direction", "cohen_d", "cohen_d_interp",
+    "sig", "tail", "alpha", "normality", "error"
+)
+# 값이 있을 때만 들어 있는 키
+_OPTIONAL_KEYS = (
+    "normality", "test_used", "levene_p", "mu", "sample_mean", "n", "resampling", "permutation", "timings"
+)
+
+# 참고문헌 블록 (러너가 붙이던 문자열 그대로)
+_REFERENCES = {
+    "independent": (
+        "\nReferences (APA 7th Edition):\n"
+        "Gosset, W. S. (1908). The probable error of a mean.\n"
+        "*Biometrika, 6*(1), 1-25. https://doi.org/10.1093/biomet/6.1.1\n"
+        "Welch, B. L. (1947). The generalization of Student's problem when several different\n"
+        "population variances are involved. *Biometrika, 34*(1-2), 28-35.\n"
+        "https://doi.org/10.1093/biomet/34.1-2.28\n"
+        "Virtanen, P., Gommers, R., Oliphant, T. E., et al. (2020). SciPy 1.0.\n"
+        "*Nature Methods, 17*(3), 261-272. https://doi.org/10.1038/s41592-019-0686-2"
+    ),
+    "default": (
+        "\nReferences (APA 7th Edition):\n"
+        "Gosset, W. S. (1908). The probable error of a mean.\n"
+        "*Biometrika, 6*(1), 1–25. https://doi.org/10.1093/biomet/6.1.1\n"
+        "Virtanen, P., Gommers, R., Oliphant, T. E., et al. (2020). SciPy 1.0.\n"
+        "*Nature Methods, 17*(3), 261–272. https://doi.org/10.1038/s41592-019-0686-2"
+    )
+}
+
+
+# Cohen's d 해석 텍스트 반환 함수
+# 입력값 d의 절댓값 크기에 따라 효과 크기를 텍스트로 반환 (ttest_logic에서도 같은 이름으로 사용)
+def interpret_cohens_d(d):
+    d = abs(d)
+    if d < 0.2:
+        return "negligible"
+    elif d < 0.5:
+        return "small"
+    elif d < 0.8:
+        return "medium"
+    else:
+        return "large"
+
+# APA 형식 p-값 (앞자리 0 생략, .001 미만은 부등호)
+def _apa_p(p):
+    if p < 0.001:
+        return "p < .001"
+    return "p = " + f"{p:.3f}".lstrip("0")
+
+# 자유도 표시 (Welch처럼 정수가 아니면 소수 둘째 자리까지)
+def _format_df(df):
+    return f"{df:.2f}" if float(df) != int(df) else f"{int(df)}"
+
+
+class TTestResult:
+    __slots__ = (
+        "test", "t_stat", "p", "df", "crit", "direction", "d", "tail", "alpha",
+        "normality", "error", "test_used", "levene_p", "mu", "sample_mean",
+        "sd1", "sd2", "n", "resampling", "permutation", "timings"
+    )
+
+    def __init__(self, test, t_stat=np.nan, p=np.nan, df=np.nan, crit=np.nan, direction=None, d=np.nan,
+                 tail="two", alpha=0.05, normality=None, error=None, test_used=None, levene_p=None,
+                 mu=None, sample_mean=None, sd1=None, sd2=None, n=None, resampling=None, permutation=None,
+                 timings=None):
+        self.test = test
+        self.t_stat = t_stat
+        self.p = p
+        self.df = df
+        self.crit = crit
+        self.direction = direction
+        self.d = d
+        self.tail = tail
+        self.alpha = alpha
+        self.normality = normality
+        self.error = error
+        self.test_used = test_used
+        self.levene_p = levene_p
+        self.mu = mu
+        self.sample_mean = sample_mean
+        self.sd1 = sd1
+        self.sd2 = sd2
+        self.n = n
+        self.resampling = resampling
+        self.permutation = permutation
+        self.timings = timings  # 계측 시 단계별 시간 (instrumentation 참고)
+
+    # 오류 결과 생성 (정규성 미충족, NaN, 예외 등)
+    @classmethod
+    def failed(cls, test, error, **fields):
+        return cls(test, error=error, **fields)
+
+    # ----------------------------
+    # 1. 파생 값 (요청 시 계산)
+    # ----------------------------
+
+    @property
+    def cohen_d(self):
+        return round(self.d, 3)
+
+    @property
+    def cohen_d_interp(self):
+        return interpret_cohens_d(self.d)
+
+    @property
+    def sig(self):
+        return SIGNIFICANT if self.p < self.alpha else NOT_SIGNIFICANT
+
+    @property
+    def significant(self):
+        return bool(self.p < self.alpha)
+
+    @property
+    def equal_var(self):
+        return None if self.levene_p is None else self.levene_p > self.alpha
+
+    # ----------------------------
+    # 2. 딕셔너리 호환
+    # ----------------------------
+
+    def keys(self):
+        keys = [key for key in _OPTIONAL_KEYS if getattr(self, key) is not None]
+        if self.error is not None:
+            return ["error"] + keys
+        return list(_CORE_KEYS) + [key for key in keys if key not in _CORE_KEYS]
+
+    def __getitem__(self, key):
+        if key not in self.keys():
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key):
+        return key in self.keys()
+
+    def get(self, key, default=None):
+        return getattr(self, key) if key in self.keys() else default
+
+    def to_dict(self):
+        return {key: getattr(self, key) for key in self.keys()}
+
+    # ----------------------------
+    # 3. 보고서 문자열 (지연 생성)
+    # ----------------------------
+
+    def __str__(self):
+        return self.to_text()
+
+    def __repr__(self):
+        if self.error is not None:
+            return f"TTestResult(test={self.test!r}, error={self.error!r})"
+        return f"TTestResult(test={self.test!r}, t={self.t_stat:.4g}, df={self.df:.4g}, p={self.p:.4g})"
+
+    # 일반 텍스트 보고서 (기존 러너 출력 형식)
+    # 계측 중인 결과면 보고서 생성 시간을 "report" 단계로 기록
+    def to_text(self, references=True):
+        if self.timings is None:
+            return self._text(references)
+        start = perf_counter()
+        text = self._text(references)
+        record_phase(self, "report", perf_counter() - start, len(text))
+        return text
+
+    def _text(self, references):
+        if self.error is not None:
+            text = self.error
+            if self.resampling is not None:
+                text += "\n\n" + format_resampling(self.resampling)
+            return text
+
+        sig = ("✅ " if self.significant else "❌ ") + self.sig
+        output = f"🔍 {TEST_TITLES[self.test]} Result\n"
+        if self.test_used is not None:
+            output += f"- Test Used: {self.test_used}\n"
+        if self.levene_p is not None:
+            output += f"- Variance Equality: {'Passed' if self.equal_var else 'Failed'} (Levene’s p = {self.levene_p:.4f})\n"
+        if self.direction:
+            output += f"- Direction: {self.direction}\n"
+        if self.test == "one_sample":
+            output += f"- Population mean (μ) = {self.mu}\n"
+            output += f"- Sample mean = {self.sample_mean:.3f}\n"
+        df = f"{self.df:.2f}" if self.test == "independent" else _format_df(self.df)
+        output += (
+            f"- t({df}) = {self.t_stat:.3f}\n"
+            f"- p = {self.p:.4f} ({self.tail}-tailed)\n"
+            f"- Critical value = {self.crit:.3f} (α = {self.alpha})\n"
+        )
+        if self.sd1 is not None:
+            labels = ("Group 1", "Group 2") if self.test == "independent" else ("before", "after")
+            output += f"- SD({labels[0]}) = {round(self.sd1, 3)}\n"
+            output += f"- SD({labels[1]}) = {round(self.sd2, 3)}\n"
+        apostrophe = "’" if self.test == "one_sample" else "'"
+        output += (
+            f"- Cohen{apostrophe}s d = {self.cohen_d} ({self.cohen_d_interp})\n"
+            f"- Result: {sig}\n"
+        )
+        if self.resampling is not None:
+            output += "\n" + format_resampling(self.resampling) + "\n"
+
+        if references:
+            output += _REFERENCES.get(self.test, _REFERENCES["default"])
+        return output
+
+    # APA 한 줄 요약 (예: t(19) = 2.41, p = .026, d = 0.54)
+    def to_apa(self):
+        if self.error is not None:
+            return self.error
+        return f"t({_format_df(self.df)}) = {self.t_stat:.2f}, {_apa_p(self.p)}, d = {self.d:.2f}"
+
+    # Markdown 표
+    def to_markdown(self):
+        if self.error is not None:
+            return f"**{TEST_TITLES[self.test]}**: {self.error}"
+        rows = [("Test", self.test_used or TEST_TITLES[self.test])]
+        if self.direction:
+            rows.append(("Direction", self.direction))
+        rows += [
+            ("t", f"{self.t_stat:.3f}"),
+            ("df", _format_df(self.df)),
+            ("p", f"{self.p:.4f} ({self.tail}-tailed)"),
+            ("Critical value", f"{self.crit:.3f} (α = {self.alpha})"),
+            ("Cohen's d", f"{self.cohen_d} ({self.cohen_d_interp})"),
+            ("Result", self.sig)
+        ]
+        lines = ["| Statistic | Value |", "|---|---|"]
+        lines += [f"| {name} | {value} |" for name, value in rows]
+        return "\n".join(lines)
@@ -0,0 +1,140 @@
+import copy
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, NamedTuple, Optional
+from table.logic.model import TableModel
+
+# ----------------------------------------------------------------
+# 백그라운드 Word 내보내기 큐
+# - 내보내기 작업은 전용 작업 스레드 하나에서 제출한 순서대로 실행 → 화면(클릭 핸들러)을 막지 않음
+# - 작업 하나에 테이블 여러 개 (예: 일괄 분석 결과 전부), 제목은 ExportTable(title, table_data)로 지정
+#   · separate=False: 한 문서에 차례로 (제목을 준 테이블은 "Table n" + 제목)
+#   · separate=True: 테이블마다 문서 하나 (filename_1.docx, filename_2.docx, ...)
+#   문서 템플릿과 셀 서식 XML 조각은 작업 안의 모든 테이블/문서가 공유
+# - 테이블은 제출 시점에 복사해 둠 (내보내는 동안 편집을 계속해도 결과가 섞이지 않음)
+# - 진행 상황은 on_progress(완료한 테이블 수, 전체 테이블 수)로 전달
+# - python-docx는 첫 작업을 실행할 때 작업 스레드에서 불러옴
+# ----------------------------------------------------------------
+
+DEFAULT_FILENAME = "exports/table_export_test.docx"  # exporter.DEFAULT_FILENAME과 같음 (python-docx를 미리 불러오지 않기 위해 따로 둠)
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="export")
+        return _executor
+
+# 제목 붙은 테이블 (그냥 튜플은 제목으로 해석하지 않음 → 행 튜플로 된 테이블도 그대로 내보냄)
+class ExportTable(NamedTuple):
+    title: Optional[str]
+    table_data: Any
+
+
+# 제출 시점의 테이블 복사본
+def _snapshot(table_data):
+    if isinstance(table_data, TableModel):
+        return table_data.snapshot()
+    return copy.deepcopy(table_data)
+
+# tables 항목: table_data 또는 ExportTable(제목, table_data)
+def _normalize(tables):
+    normalized = []
+    for item in tables:
+        title, table_data = item if isinstance(item, ExportTable) else (None, item)
+        normalized.append(ExportTable(title, _snapshot(table_data)))
+    return normalized
+
+# separate=True일 때 테이블별 파일 이름
+def _numbered(filename, number):
+    stem, ext = os.path.splitext(filename)
+    return f"{stem}_{number}{ext or '.docx'}"
+
+# ----------------------------
+# 1. 작업 핸들
+# ----------------------------
+
+class ExportJob:
+    def __init__(self, tables, filename, separate, open_when_done, on_progress):
+        self.tables = tables
+        self.filename = filename
+        self.separate = separate
+        self.open_when_done = open_when_done
+        self.on_progress = on_progress
+        self.done_count = 0
+        self.paths = []
+        self.future = None
+
+    @property
+    def total(self):
+        return len(self.tables)
+
+    @property
+    def running(self):
+        return self.future is not None and not self.future.done()
+
+    def result(self, timeout=None):
+        return self.future.result(timeout)
+
+    def _report(self):
+        if self.on_progress is not None:
+            self.on_progress(self.done_count, self.total)
+
+    # 작업 스레드에서 실행: 반환값은 저장한 파일 경로 리스트
+    def run(self):
+        from table.core import exporter
+
+        fragments = exporter.new_fragments()
+        self._report()
+        if self.separate:
+            for number, (title, table_data) in enumerate(self.tables, start=1):
+                doc = exporter.new_document()
+                exporter.add_table(doc, table_data, title, fragments=fragments)
+                path = _numbered(self.filename, number)
+                exporter.save_document(doc, path)
+                self.paths.append(path)
+                self.done_count += 1
+                self._report()
+        else:
+            doc = exporter.new_document()
+            for number, (title, table_data) in enumerate(self.tables, start=1):
+                exporter.add_table(doc, table_data, title, number=number, fragments=fragments)
+                self.done_count += 1
+                self._report()
+            exporter.save_document(doc, self.filename)
+            self.paths.append(self.filename)
+
+        if self.open_when_done:
+            for path in self.paths:
+                exporter.open_file(path)
+        return self.paths
+
+# ----------------------------
+# 2. 작업 제출
+# ----------------------------
+
+# on_progress(done, total) / on_done(paths) / on_error(err)는 작업 스레드에서 호출됨
+def submit_export(tables, filename=DEFAULT_FILENAME, separate=False, open_when_done=True,
+                  on_progress=None, on_done=None, on_error=None):
+    job = ExportJob(_normalize(tables), filename, separate, open_when_done, on_progress)
+
+    def run():
+        try:
+            paths = job.run()
+        except Exception as err:
+            if on_error is None:
+                raise
+            on_error(err)
+            return None
+        if on_done is not None:
+            on_done(paths)
+        return paths
+
+    job.future = _get_executor().submit(run)
+    return job
+
@@ -1,9 +1,43 @@
 import os
+import subprocess
+import sys
+import threading
+from io import BytesIO
+from xml.sax.saxutils import escape
 from docx import Document  # python-docx 모듈을 사용해 Word 문서 구성
-from docx.enum.table import WD_ALIGN_VERTICAL  # python-docx 모듈을 사용해 Word 문서 구성
-from docx.shared import Pt  # python-docx 모듈을 사용해 Word 문서 구성
-from docx.oxml import OxmlElement  # python-docx 모듈을 사용해 Word 문서 구성
-from docx.oxml.ns import qn  # python-docx 모듈을 사용해 Word 문서 구성
+from docx.shared import Emu, Pt  # python-docx 모듈을 사용해 Word 문서 구성
+from docx.oxml import parse_xml  # python-docx 모듈을 사용해 Word 문서 구성
+from docx.oxml.ns import nsdecls  # python-docx 모듈을 사용해 Word 문서 구성
+from table.core.serializers import walk_table
+
+# ----------------------------------------------------------------
+# Word 내보내기
+# - 셀마다 python-docx 객체(table.cell(), 문단/런 서식, 테두리 요소)를 만들지 않고
+#   테이블 전체의 XML(w:tbl)을 문자열로 한 번에 만든 뒤 한 번만 파싱해서 문서에 넣음
+#   → 셀 수가 많아도 파싱 1회 + 문자열 이어 붙이기 (셀 병합도 같은 순회에서 gridSpan으로 처리)
+# - 결과 문서는 예전 방식(add_table → 셀별 서식 → merge)과 같은 XML
+#   · 셀 너비: 본문 폭 / 열 수, 병합 셀은 합친 열 너비의 합
+#   · 문단: 줄 간격 12pt(exact), 단락 뒤 0, 숫자는 가운데 / 나머지는 왼쪽 정렬
+#   · 런: Times New Roman 11pt, 줄바꿈(\n) → w:br, 탭(\t) → w:tab
+#   · 테두리: 위/아래 single, 두께 × 4 (1/8pt 단위), white → FFFFFF, 그 외 → 000000
+# - 테두리가 같은 셀은 테두리 XML을 한 번만 만들고 재사용
+#   여러 테이블을 내보낼 때도 XML 조각 캐시(new_fragments())와 문서 템플릿을 공유
+# - 한 문서에 테이블 여러 개: new_document() → add_table() 반복 → save_document()
+#   (백그라운드 작업 큐는 table.core.export_queue)
+# ----------------------------------------------------------------
+
+DEFAULT_FILENAME = "exports/table_export_test.docx"
+NO_BORDER = ("white", 0)
+
+_TBL_PR = (
+    '<w:tblPr><w:tblW w:type="auto" w:w="0"/><w:tblLayout w:type="autofit"/>'
+    '<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" w:lastRow="0"'
+    ' w:noHBand="0" w:noVBand="1" w:val="04A0"/></w:tblPr>'
+)
+_P_PR = '<w:pPr><w:spacing w:line="240" w:lineRule="exact" w:after="0"/><w:jc w:val="%s"/></w:pPr>'
+_R_PR = '<w:rPr><w:rFonts w:ascii="Times New Roman" w:hAnsi="Times New Roman"/><w:sz w:val="22"/></w:rPr>'
+_P_LEFT = _P_PR % "left"
+_P_CENTER = _P_PR % "center"
 
 # APA 스타일에 맞게 문단 스타일 설정
 def set_apa_paragraph_style(paragraph):
@@ -13,80 +47,165 @@ def set_apa_paragraph_style(paragraph):
     run.font.name = "Times New Roman"
     run.font.size = Pt(11)
 
-# 셀 객체에 사용자 정의 테두리 스타일 적용
-def set_cell_border_from_data(cell, border_top, border_bottom):
-    tc = cell._tc
-    tcPr = tc.get_or_add_tcPr()
-    tcBorders = OxmlElement('w:tcBorders')
-
-    def make_border_element(tag, border):
-        el = OxmlElement(tag)
-        el.set(qn('w:val'), 'single')
-        el.set(qn('w:sz'), str(border.get("thickness", 1) * 4))
-        el.set(qn('w:color'), "FFFFFF" if border.get("color") == "white" else "000000")
-        return el
+# ----------------------------
+# 1. XML 조각
+# ----------------------------
+
+def _border_xml(tag, border):
+    color, thickness = border or NO_BORDER
+    return '<w:%s w:val="single" w:sz="%d" w:color="%s"/>' % (
+        tag, thickness * 4, "FFFFFF" if color == "white" else "000000"
+    )
+
+def _borders_xml(border_top, border_bottom):
+    return "<w:tcBorders>%s%s</w:tcBorders>" % (_border_xml("top", border_top), _border_xml("bottom", border_bottom))
+
+# 셀 텍스트 → 런 내용 (python-docx의 run.text와 같은 규칙)
+def _run_content(text):
+    parts = []
+    chunk = []
+
+    def flush_chunk():
+        if chunk:
+            joined = "".join(chunk)
+            space = ' xml:space="preserve"' if len(joined.strip()) < len(joined) else ""
+            parts.append("<w:t%s>%s</w:t>" % (space, escape(joined)))
+            chunk.clear()
+
+    for char in text:
+        if char == "\t":
+            flush_chunk()
+            parts.append("<w:tab/>")
+        elif char in "\n\r":
+            flush_chunk()
+            parts.append("<w:br/>")
+        else:
+            chunk.append(char)
+    flush_chunk()
+    return "".join(parts)
+
+def _paragraph_xml(text, align):
+    p_pr = _P_CENTER if align == "center" else _P_LEFT
+    if text and "\t" not in text and "\n" not in text and "\r" not in text:
+        space = ' xml:space="preserve"' if len(text.strip()) < len(text) else ""
+        content = "<w:t%s>%s</w:t>" % (space, escape(text))
+    else:
+        content = _run_content(text)
+    return "<w:p>%s<w:r>%s%s</w:r></w:p>" % (p_pr, _R_PR, content)
+
+# ----------------------------
+# 2. 테이블 XML 만들기
+# ----------------------------
+
+# 테이블 사이에 공유하는 XML 조각 캐시
+def new_fragments():
+    return {
+        "tcW": {},      # (열 너비, 병합 열 수) → tcW 요소
+        "borders": {}   # (위 테두리, 아래 테두리) → tcBorders 요소
+    }
+
+# 셀 해석(병합, 정렬, 테두리)은 텍스트 형식과 같은 serializers.walk_table()
+def build_table_xml(table_data, col_width, fragments=None):
+    n_cols = len(table_data[0]) if len(table_data) > 0 else 0
+    width_twips = Emu(col_width).twips
+
+    fragments = fragments if fragments is not None else new_fragments()
+    tc_w = fragments["tcW"]
+    borders = fragments["borders"]
+    parts = ["<w:tbl %s>" % nsdecls("w"), _TBL_PR, "<w:tblGrid>"]
+    parts.append(('<w:gridCol w:w="%d"/>' % width_twips) * n_cols)
+    parts.append("</w:tblGrid>")
+
+    empty_tc = '<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="%d"/></w:tcPr><w:p/></w:tc>' % width_twips
+
+    for cells in walk_table(table_data):
+        parts.append("<w:tr>")
+        for cell in cells:
+            if cell.placeholder:
+                # 앞에 보이는 셀이 없는 숨김 셀 / 모자란 열 → 빈 셀 그대로
+                parts.append(empty_tc)
+                continue
 
-    if border_top:
-        tcBorders.append(make_border_element('w:top', border_top))
-    if border_bottom:
-        tcBorders.append(make_border_element('w:bottom', border_bottom))
+            span = cell.span
+            width = tc_w.get((width_twips, span))
+            if width is None:
+                width = tc_w[width_twips, span] = '<w:tcW w:type="dxa" w:w="%d"/><w:vAlign w:val="center"/>%s' % (
+                    width_twips * span, '<w:gridSpan w:val="%d"/>' % span if span > 1 else ""
+                )
+            border_key = (cell.border_top, cell.border_bottom)
+            border = borders.get(border_key)
+            if border is None:
+                border = borders[border_key] = _borders_xml(*border_key)
+
+            parts.append("<w:tc><w:tcPr>%s%s</w:tcPr>%s</w:tc>" % (width, border, _paragraph_xml(cell.text, cell.align)))
+        parts.append("</w:tr>")
+
+    parts.append("</w:tbl>")
+    return "".join(parts)
+
+# ----------------------------
+# 3. 문서 만들기 / 저장
+# ----------------------------
+
+_template = {"bytes": None}
+_template_lock = threading.Lock()
+
+# 새 문서: 기본 템플릿은 처음 한 번만 읽어서 바이트로 보관하고 이후에는 복제
+def new_document():
+    with _template_lock:
+        if _template["bytes"] is None:
+            buffer = BytesIO()
+            Document().save(buffer)
+            _template["bytes"] = buffer.getvalue()
+        template = _template["bytes"]
+    return Document(BytesIO(template))
+
+# APA 표 제목: "Table n" (굵게) + 제목 (기울임)
+def _add_caption(doc, number, title):
+    label = doc.add_paragraph()
+    label.add_run(f"Table {number}").bold = True
+    set_apa_paragraph_style(label)
+    caption = doc.add_paragraph()
+    caption.add_run(title).italic = True
+    set_apa_paragraph_style(caption)
+
+# 문서 끝에 테이블 추가 (title이 있으면 APA 표 제목도 추가)
+# number: 문서 안에서 몇 번째 테이블인지 (1부터)
+def add_table(doc, table_data, title=None, number=1, fragments=None):
+    if number > 1:
+        doc.add_paragraph()  # 붙어 있는 테이블은 Word가 하나로 합치므로 빈 문단으로 구분
+    if title:
+        _add_caption(doc, number, title)
+
+    n_cols = len(table_data[0]) if len(table_data) > 0 else 0
+    col_width = doc._block_width // n_cols if n_cols else 0
+
+    # 테이블 XML을 한 번에 파싱해서 본문 끝(섹션 설정 앞)에 삽입
+    tbl = parse_xml(build_table_xml(table_data, col_width, fragments))
+    doc.element.body._insert_tbl(tbl)
+
+def save_document(doc, filename):
+    os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
+    doc.save(filename)  # 최종 문서를 docx로 저장
+    print(f"✅ Exported to {filename}")
 
-    tcPr.append(tcBorders)
+# 저장한 파일을 기본 앱으로 열기 (기다리지 않음, 열 수 없으면 무시)
+def open_file(filename):
+    try:
+        if sys.platform == "win32":
+            os.startfile(filename)
+        elif sys.platform == "darwin":
+            subprocess.Popen(["open", filename])
+        else:
+            subprocess.Popen(["xdg-open", filename], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    except OSError as err:
+        print(f"⚠️ Could not open {filename}: {err}")
 
 # Flet 테이블 데이터를 Word 문서로 내보내는 함수 정의
-def export_table_to_word(table_data, filename="exports/table_export_test.docx"):
+def export_table_to_word(table_data, filename=DEFAULT_FILENAME, open_when_done=True):
     print("🟢 Export started...")
-    os.makedirs("exports", exist_ok=True)
-
-    doc = Document()  # 새 Word 문서 객체 생성
-    n_rows = len(table_data)
-    n_cols = len(table_data[0]) if n_rows > 0 else 0
-
-    table = doc.add_table(rows=n_rows, cols=n_cols)  # Word 문서에 테이블 생성, 행렬 크기 고정
-    table.autofit = True
-
-    merge_tracker = [[False]*n_cols for _ in range(n_rows)]
-
-    for i, row in enumerate(table_data):
-        for j, cell in enumerate(row):
-            if not cell.get("visible", True):
-                merge_tracker[i][j] = True
-                continue
-
-            val = str(cell.get("value", ""))
-            doc_cell = table.cell(i, j)
-            doc_cell.text = val
-
-            # 정렬
-            if val.replace(".", "", 1).isdigit():
-                doc_cell.paragraphs[0].alignment = 1  # CENTER
-            else:
-                doc_cell.paragraphs[0].alignment = 0  # LEFT
-
-            doc_cell.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
-            set_apa_paragraph_style(doc_cell.paragraphs[0])
-
-            # 테두리 적용
-            border_top = cell.get("border_top", {"color": "white", "thickness": 0})
-            border_bottom = cell.get("border_bottom", {"color": "white", "thickness": 0})
-            set_cell_border_from_data(doc_cell, border_top, border_bottom)
-
-    # 병합 셀 처리
-    for i, row in enumerate(table_data):
-        for j, cell in enumerate(row):
-            if cell.get("visible", True):
-                span = 1
-                for k in range(j + 1, n_cols):
-                    if not table_data[i][k].get("visible", True):
-                        span += 1
-                    else:
-                        break
-                if span > 1:
-                    merged_cell = table.cell(i, j)
-                    for merge_j in range(1, span):
-                        merged_cell = merged_cell.merge(table.cell(i, j + merge_j))
-                        merge_tracker[i][j + merge_j] = True
-
-    doc.save(filename)  # 최종 문서를 docx로 저장
-    print(f"✅ Exported to {filename}")
-    os.system(f"open '{filename}'")
\ No newline at end of file
+    doc = new_document()  # 새 Word 문서 객체 생성
+    add_table(doc, table_data)
+    save_document(doc, filename)
+    if open_when_done:
+        open_file(filename)
@@ -0,0 +1,330 @@
+import csv
+import io
+import os
+from html import escape as html_escape
+from itertools import chain, islice
+from typing import NamedTuple, Optional, Tuple
+from table.logic.model import TableModel, style_from_dict
+
+# ----------------------------------------------------------------
+# 테이블 직렬화 파이프라인 (LaTeX / HTML / Markdown / CSV)
+# - walk_table(): 테이블 모델을 한 번만 순회하면서 셀을 해석
+#   · 병합: 보이는 셀 오른쪽으로 이어진 visible=False 셀은 그 셀에 합침 (span)
+#     앞에 보이는 셀이 없는 숨김 셀 / 열이 모자란 행은 빈 자리(placeholder)
+#   · 정렬: 숫자는 가운데, 나머지는 왼쪽 (Word 내보내기와 같은 규칙)
+#   · 테두리: border_top / border_bottom을 (색, 두께) 그대로 전달
+#   Word 내보내기(exporter.build_table_xml)도 같은 순회를 사용
+# - serialize(): 순회 결과를 writer에 한 행씩 흘려 보냄 (문자열 전체를 모으지 않고 out에 바로 씀)
+#   · 행 사이 가로선: 위 행의 border_bottom + 아래 행의 border_top (흰색/두께 0은 선 없음)
+#   · 열 정렬: 처음 ALIGN_LOOKAHEAD_ROWS 행에서 열마다 더 많은 쪽 (머리글이 여러 행인 APA 표 대비)
+#     → 그 행 수만큼만 미리 읽어 두고 나머지는 그대로 흘려 보냄
+# - writer는 begin(n_cols, aligns) → row(cells, rules) 반복 → end(rules) 세 메서드만 있으면 됨
+#   새 형식은 register_format()으로 추가
+# - 이 모듈은 python-docx를 불러오지 않음
+# ----------------------------------------------------------------
+
+DEFAULT_DIR = "exports"
+ALIGN_LOOKAHEAD_ROWS = 8
+
+
+class ResolvedCell(NamedTuple):
+    text: str
+    span: int = 1
+    align: str = "left"
+    border_top: Optional[Tuple[str, int]] = None
+    border_bottom: Optional[Tuple[str, int]] = None
+    placeholder: bool = False
+
+
+PLACEHOLDER = ResolvedCell("", placeholder=True)
+
+# ----------------------------
+# 1. 테이블 순회
+# ----------------------------
+
+# 행마다 [(값, CellStyle), ...] — TableModel은 배열을 직접 읽음
+def iter_styled_rows(table_data):
+    if isinstance(table_data, TableModel):
+        styles = table_data.styles
+        for values, style_ids in zip(table_data.values, table_data.style_ids):
+            yield [(value, styles[style_id]) for value, style_id in zip(values, style_ids)]
+    else:
+        for row in table_data:
+            yield [style_from_dict(cell) for cell in row]
+
+
+def is_numeric(text):
+    return text.replace(".", "", 1).isdigit()
+
+# 행마다 ResolvedCell 리스트 (span 합 = 열 수, 열 수는 첫 행 기준)
+def walk_table(table_data):
+    n_cols = None
+    for row in iter_styled_rows(table_data):
+        if n_cols is None:
+            n_cols = len(row)
+        n = min(len(row), n_cols)
+        cells = []
+        j = 0
+        while j < n:
+            value, style = row[j]
+            if style.visible is False:
+                cells.append(PLACEHOLDER)
+                j += 1
+                continue
+
+            span = 1
+            while j + span < n and row[j + span][1].visible is False:
+                span += 1
+
+            text = "" if value is None else str(value)
+            cells.append(ResolvedCell(
+                text, span, "center" if is_numeric(text) else "left", style.border_top, style.border_bottom
+            ))
+            j += span
+        cells.extend([PLACEHOLDER] * (n_cols - n))
+        yield cells
+
+# 흰색이거나 두께 0인 테두리는 선 없음
+def border_thickness(border):
+    if border is None or border[0] == "white":
+        return 0
+    return border[1]
+
+# 두 행 사이 가로선: [(시작 열, 끝 열(미포함), 두께), ...] (같은 두께로 이어진 열끼리 묶음)
+def horizontal_rules(above, below, n_cols):
+    thickness = [0] * n_cols
+    for cells, key in ((above, "border_bottom"), (below, "border_top")):
+        if cells is None:
+            continue
+        start = 0
+        for cell in cells:
+            width = border_thickness(getattr(cell, key))
+            for col in range(start, min(start + cell.span, n_cols)):
+                thickness[col] = max(thickness[col], width)
+            start += cell.span
+
+    rules = []
+    start = 0
+    for col in range(1, n_cols + 1):
+        if col == n_cols or thickness[col] != thickness[start]:
+            if thickness[start]:
+                rules.append((start, col, thickness[start]))
+            start = col
+    return rules
+
+# 열마다 가운데 정렬 셀이 더 많으면 "center", 아니면 "left" (빈 칸 / 병합 셀은 세지 않음)
+def column_aligns(rows, n_cols):
+    center = [0] * n_cols
+    left = [0] * n_cols
+    for cells in rows:
+        col = 0
+        for cell in cells:
+            if cell.span == 1 and cell.text and col < n_cols:
+                counts = center if cell.align == "center" else left
+                counts[col] += 1
+            col += cell.span
+    return ["center" if center[col] > left[col] else "left" for col in range(n_cols)]
+
+# ----------------------------
+# 2. 파이프라인
+# ----------------------------
+
+def serialize(table_data, writer):
+    rows = walk_table(table_data)
+    head = list(islice(rows, ALIGN_LOOKAHEAD_ROWS))
+    n_cols = sum(cell.span for cell in head[0]) if head else 0
+    writer.begin(n_cols, column_aligns(head, n_cols))
+
+    previous = None
+    for cells in chain(head, rows):
+        writer.row(cells, horizontal_rules(previous, cells, n_cols))
+        previous = cells
+    writer.end(horizontal_rules(previous, None, n_cols))
+
+# ----------------------------
+# 3. 형식별 writer
+# ----------------------------
+
+_LATEX_SPECIAL = {
+    "\\": r"\textbackslash{}", "&": r"\&", "%": r"\%", "$": r"\$", "#": r"\#", "_": r"\_",
+    "{": r"\{", "}": r"\}", "~": r"\textasciitilde{}", "^": r"\textasciicircum{}",
+    "<": r"\textless{}", ">": r"\textgreater{}", "\n": " ", "\r": " ", "\t": " "
+}
+_LATEX_ALIGN = {"left": "l", "center": "c", "right": "r"}
+
+
+# LaTeX booktabs (\usepackage{booktabs} 필요)
+# 맨 위/아래 선 → \toprule / \bottomrule, 중간 전체 선 → \midrule, 일부 열만 → \cmidrule(lr){a-b}
+# 두께 2 이상(굵은 선)인 중간 선은 \midrule[\heavyrulewidth] / \cmidrule[\heavyrulewidth]
+class LatexWriter:
+    def __init__(self, out):
+        self.out = out
+        self.n_cols = 0
+        self.aligns = []
+        self.first = True
+
+    def begin(self, n_cols, aligns):
+        self.n_cols = n_cols
+        self.aligns = aligns
+        self.out.write("\\begin{tabular}{%s}\n" % "".join(_LATEX_ALIGN[a] for a in aligns))
+
+    def _rules(self, rules, outer):
+        if not rules:
+            return
+        if len(rules) == 1 and rules[0][:2] == (0, self.n_cols):
+            thickness = rules[0][2]
+            if outer:
+                self.out.write(outer + "\n")
+            elif thickness > 1:
+                self.out.write("\\midrule[\\heavyrulewidth]\n")
+            else:
+                self.out.write("\\midrule\n")
+            return
+        self.out.write(" ".join(
+            "\\cmidrule%s(lr){%d-%d}" % ("[\\heavyrulewidth]" if thickness > 1 else "", start + 1, end)
+            for start, end, thickness in rules
+        ) + "\n")
+
+    def _cell(self, cell, col):
+        text = "".join(_LATEX_SPECIAL.get(char, char) for char in cell.text)
+        align = _LATEX_ALIGN[cell.align]
+        if cell.span > 1 or (cell.text and cell.align != self.aligns[col]):
+            return "\\multicolumn{%d}{%s}{%s}" % (cell.span, align, text)
+        return text
+
+    def row(self, cells, rules):
+        self._rules(rules, "\\toprule" if self.first else None)
+        self.first = False
+        parts = []
+        col = 0
+        for cell in cells:
+            parts.append(self._cell(cell, col))
+            col += cell.span
+        self.out.write(" & ".join(parts) + " \\\\\n")
+
+    def end(self, rules):
+        self._rules(rules, "\\bottomrule")
+        self.out.write("\\end{tabular}\n")
+
+
+# HTML: 첫 행은 <thead>, 테두리는 셀마다 인라인 스타일 (두께 px)
+class HtmlWriter:
+    def __init__(self, out):
+        self.out = out
+        self.first = True
+
+    def begin(self, n_cols, aligns):
+        self.out.write('<table style="border-collapse: collapse;">\n')
+
+    def _cell(self, cell, tag):
+        attrs = ' colspan="%d"' % cell.span if cell.span > 1 else ""
+        styles = ["text-align: %s" % cell.align] if not cell.placeholder else []
+        for side, border in (("top", cell.border_top), ("bottom", cell.border_bottom)):
+            width = border_thickness(border)
+            if width:
+                styles.append("border-%s: %dpx solid #000" % (side, width))
+        if styles:
+            attrs += ' style="%s"' % "; ".join(styles)
+        text = html_escape(cell.text).replace("\r\n", "<br>").replace("\n", "<br>")
+        return "<%s%s>%s</%s>" % (tag, attrs, text, tag)
+
+    def row(self, cells, rules):
+        tag = "th" if self.first else "td"
+        if self.first:
+            self.out.write("<thead>\n")
+        self.out.write("<tr>%s</tr>\n" % "".join(self._cell(cell, tag) for cell in cells))
+        if self.first:
+            self.out.write("</thead>\n<tbody>\n")
+        self.first = False
+
+    def end(self, rules):
+        if not self.first:
+            self.out.write("</tbody>\n")
+        self.out.write("</table>\n")
+
+
+# Markdown (GitHub 표): 첫 행이 머리글, 병합은 표현할 수 없어 뒤 칸을 비움, 테두리는 무시
+class MarkdownWriter:
+    _SEPARATOR = {"left": "---", "center": ":---:", "right": "---:"}
+
+    def __init__(self, out):
+        self.out = out
+        self.aligns = []
+        self.first = True
+
+    def begin(self, n_cols, aligns):
+        self.aligns = aligns
+
+    def row(self, cells, rules):
+        texts = []
+        for cell in cells:
+            text = cell.text.replace("|", "\\|").replace("\r\n", "<br>").replace("\n", "<br>")
+            texts.append(text)
+            texts.extend([""] * (cell.span - 1))
+        self.out.write("| %s |\n" % " | ".join(texts))
+        if self.first:
+            self.out.write("| %s |\n" % " | ".join(self._SEPARATOR[a] for a in self.aligns))
+            self.first = False
+
+    def end(self, rules):
+        pass
+
+
+# CSV: 병합 셀은 첫 칸에 값, 나머지 칸은 빈 값 / 테두리·정렬은 무시
+class CsvWriter:
+    def __init__(self, out):
+        self.writer = csv.writer(out, lineterminator="\n")
+
+    def begin(self, n_cols, aligns):
+        pass
+
+    def row(self, cells, rules):
+        values = []
+        for cell in cells:
+            values.append(cell.text)
+            values.extend([""] * (cell.span - 1))
+        self.writer.writerow(values)
+
+    def end(self, rules):
+        pass
+
+# ----------------------------
+# 4. 형식 등록 / 내보내기
+# ----------------------------
+
+# 형식 이름 → (writer 클래스, 파일 확장자)
+FORMATS = {
+    "latex": (LatexWriter, ".tex"),
+    "html": (HtmlWriter, ".html"),
+    "markdown": (MarkdownWriter, ".md"),
+    "csv": (CsvWriter, ".csv")
+}
+
+
+def register_format(name, writer_cls, extension):
+    FORMATS[name] = (writer_cls, extension)
+
+# out(텍스트 스트림)이 없으면 문자열로 반환
+def serialize_table(table_data, fmt, out=None):
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown table format: {fmt} (available: {', '.join(FORMATS)})")
+    writer_cls, _ = FORMATS[fmt]
+    if out is not None:
+        serialize(table_data, writer_cls(out))
+        return None
+    buffer = io.StringIO()
+    serialize(table_data, writer_cls(buffer))
+    return buffer.getvalue()
+
+# 파일로 저장: 반환값은 파일 경로 (filename이 없으면 exports/table_export.<확장자>)
+def export_table_to_text(table_data, fmt, filename=None):
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown table format: {fmt} (available: {', '.join(FORMATS)})")
+    if filename is None:
+        filename = os.path.join(DEFAULT_DIR, "table_export" + FORMATS[fmt][1])
+    os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
+    newline = "" if fmt == "csv" else None  # csv 모듈이 줄바꿈을 직접 처리
+    with open(filename, "w", encoding="utf-8", newline=newline) as out:
+        serialize_table(table_data, fmt, out)
+    print(f"✅ Exported to {filename}")
+    return filename
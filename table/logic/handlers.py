@@ -1,84 +1,68 @@
-import flet as ft
 from table.views.mode_buttons import build_mode_buttons
-from table.logic.table_renderer import build_table_rows
-from table.logic.template import toggle_border_color
+from table.logic.history import edit_cell, redo, undo
+from table.logic.template import toggle_border_color, update_cell
 from table.logic.state import TEXT_MODE, STRUCTURE_MODE
 
+# 셀 핸들러는 셀마다 만들지 않고 TableRenderer가 모든 셀에 같은 핸들러를 연결
+# 셀 좌표는 이벤트를 보낸 컨트롤의 data=(i, j)에서 읽음 (행/열 추가·삭제 후에도 렌더러가 다시 매김)
+
 def make_on_change(state, ui, page):
-    def wrapper(i, j):
-        def handler(e):
-            from table.logic.template import update_cell
-            update_cell(state.table_data, i, j, e.control.value)
+    def handler(e):
+        i, j = e.control.data
+        value = e.control.value
+        # 같은 셀에 이어서 입력한 글자는 실행 취소 기록 하나로 합침
+        edit_cell(state, i, j, lambda data: update_cell(data, i, j, value), coalesce=True)
+
+        # ⚠️ 렌더링 생략: 텍스트 입력 중 커서 튐 방지
+        # (입력값은 TextField에 이미 표시되어 있고, 구조 모드로 전환할 때 Text에 반영됨)
+    return handler
 
-            # ⚠️ 렌더링 생략: 텍스트 입력 중 커서 튐 방지
-            # ui["table_column"].controls = build_table_rows(
-            #     state,
-            #     ui,
-            #     page,
-            #     handle_border_toggle,
-            #     make_on_change
-            # )
-            # page.update()
-        return handler
-    return wrapper
+# 모드 전환 공통 처리: 모드 버튼 교체 + 모든 셀의 내용 컨트롤 교체 (셀 컨테이너는 그대로 재사용)
+def _switch_mode(state, ui, page, mode):
+    state.editing_mode = mode
+    state.mark_all()
+    ui["mode_buttons"].content = build_mode_buttons(
+        state.editing_mode,
+        enable_text_mode(state, ui, page),
+        enable_structure_mode(state, ui, page)
+    )
+    ui["renderer"].flush(ui["mode_buttons"])
 
 def enable_text_mode(state, ui, page):
     def handler(e):
-        from table.logic.handlers import enable_structure_mode
-        state.editing_mode = TEXT_MODE
-        ui["mode_buttons"].content = build_mode_buttons(
-            state.editing_mode,
-            enable_text_mode(state, ui, page),
-            enable_structure_mode(state, ui, page)
-        )
-        ui["table_column"].controls = build_table_rows(
-            state,
-            ui,
-            page,
-            handle_border_toggle,
-            make_on_change
-        )
-        page.update()
+        _switch_mode(state, ui, page, TEXT_MODE)
     return handler
 
 def enable_structure_mode(state, ui, page):
     def handler(e):
-        from table.logic.handlers import enable_text_mode
-        state.editing_mode = STRUCTURE_MODE
-        ui["mode_buttons"].content = build_mode_buttons(
-            state.editing_mode,
-            enable_text_mode(state, ui, page),
-            enable_structure_mode(state, ui, page)
-        )
-        ui["table_column"].controls = build_table_rows(
-            state,
-            ui,
-            page,
-            handle_border_toggle,
-            make_on_change
-        )
-        page.update()
+        _switch_mode(state, ui, page, STRUCTURE_MODE)
     return handler
 
 def handle_border_toggle(state, ui, page):
-    def wrapper(i, j):
-        def handler(e):
-            print(f"[CLICK] ({i}, {j}) selected in mode: {state.editing_mode}")
-            if state.editing_mode != STRUCTURE_MODE:
-                print("⛔ Ignored: not in structure mode")
-                return
+    def handler(e):
+        i, j = e.control.data
+        print(f"[CLICK] ({i}, {j}) selected in mode: {state.editing_mode}")
+        if state.editing_mode != STRUCTURE_MODE:
+            print("⛔ Ignored: not in structure mode")
+            return
+
+        # 이전 선택 셀과 클릭한 셀만 다시 그림
+        state.select((i, j))
 
-            state.selected_cell = (i, j)
+        edit_cell(state, i, j, lambda data: toggle_border_color(data, i, j, direction="top"))
 
-            toggle_border_color(state.table_data, i, j, direction="top")
+        ui["renderer"].flush()
+    return handler
+
+# ↩️ Undo / 🔄 Reverse Undo 버튼 핸들러 (되돌릴 기록이 없으면 아무것도 하지 않음)
+def handle_undo(state, ui, page):
+    def handler(e):
+        if undo(state):
+            ui["renderer"].flush()
+    return handler
 
-            ui["table_column"].controls = build_table_rows(
-                state,
-                ui,
-                page,
-                handle_border_toggle,
-                make_on_change
-            )
-            page.update()
-        return handler
-    return wrapper
\ No newline at end of file
+def handle_redo(state, ui, page):
+    def handler(e):
+        if redo(state):
+            ui["renderer"].flush()
+    return handler
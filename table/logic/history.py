@@ -0,0 +1,154 @@
+from collections import deque
+
+# ----------------------------------------------------------------
+# 테이블 편집 기록 (실행 취소 / 다시 실행)
+# - 편집마다 전체 테이블 스냅샷을 복사하지 않고, 되돌릴 수 있는 작은 명령(command)만 기록
+#   · ("set_cell", i, j, 이전 상태, 새 상태, 이어쓰기 여부)
+#       셀 상태 = (값, 스타일 번호) → 값 입력, 테두리 색/두께 토글 모두 셀 하나 크기
+#   · ("insert_rows" / "delete_rows", i, values_rows, style_rows)  ← 넣거나 뺀 행마다 하나씩
+#   · ("insert_cols" / "delete_cols", j, values_rows, style_rows)  ← 행마다 넣거나 뺀 열 조각
+#   행/열 명령은 모델에서 빼거나 넣은 리스트/배열 객체를 그대로 보관 (구조 공유, 복사 없음)
+#   여러 행/열을 한 번에 넣고 빼도 명령 하나 (실행 취소도 한 번에)
+#   → 실행 취소/다시 실행 시간과 메모리는 편집 크기에 비례 (테이블 크기와 무관)
+# - 기록은 선형: 실행 취소 후 새 편집을 하면 다시 실행 목록은 비움
+# - 같은 셀에 연속으로 입력한 글자는 명령 하나로 합침 (키 입력마다 기록이 쌓이지 않도록)
+# - 실제 화면 반영은 TableEditorState의 변경 표시(dirty) → TableRenderer.flush()
+# ----------------------------------------------------------------
+
+MAX_HISTORY = 10_000
+
+_INVERSE = {
+    "insert_rows": "delete_rows",
+    "delete_rows": "insert_rows",
+    "insert_cols": "delete_cols",
+    "delete_cols": "insert_cols"
+}
+
+
+class EditHistory:
+    def __init__(self, max_steps=MAX_HISTORY):
+        self.undo_stack = deque(maxlen=max_steps)  # 가장 오래된 기록부터 버림
+        self.redo_stack = []
+
+    def record(self, command):
+        self.undo_stack.append(command)
+        self.redo_stack.clear()
+
+    def can_undo(self):
+        return bool(self.undo_stack)
+
+    def can_redo(self):
+        return bool(self.redo_stack)
+
+    def clear(self):
+        self.undo_stack.clear()
+        self.redo_stack.clear()
+
+# ----------------------------
+# 1. 명령 적용 / 역명령
+# ----------------------------
+
+def _inverse(command):
+    kind = command[0]
+    if kind == "set_cell":
+        _, i, j, before, after, coalesce = command
+        return ("set_cell", i, j, after, before, coalesce)
+    return (_INVERSE[kind],) + command[1:]
+
+# 명령을 모델에 적용하고 바뀐 부분을 state에 표시
+def _apply(state, command):
+    model = state.table_data
+    kind = command[0]
+    if kind == "set_cell":
+        _, i, j, _, after, _ = command
+        model.set_cell_state(i, j, after)
+        state.mark_cell(i, j)
+        return
+
+    _, index, values_rows, style_rows = command
+    if kind == "insert_rows":
+        model.insert_rows_arrays(index, values_rows, style_rows)
+    elif kind == "delete_rows":
+        model.delete_rows(index, len(values_rows))
+    elif kind == "insert_cols":
+        model.insert_columns_arrays(index, values_rows, style_rows)
+    else:
+        model.delete_columns(index, max((len(values) for values in values_rows), default=0))
+    state.mark_structure()
+    state.clamp_selection()
+
+# ----------------------------
+# 2. 편집 함수 (적용 + 기록)
+# ----------------------------
+
+# 셀 하나를 바꾸는 편집: edit(table_data)가 (i, j) 셀만 고친다고 가정하고 전후 상태를 기록
+# 예: edit_cell(state, i, j, lambda data: toggle_border_color(data, i, j, "top"))
+# coalesce=True: 바로 전 기록도 같은 셀의 이어쓰기(coalesce) 편집이면 하나로 합침 (텍스트 입력용)
+# 반환값: 실제로 바뀌었으면 True
+def edit_cell(state, i, j, edit, coalesce=False):
+    model = state.table_data
+    before = model.cell_state(i, j)
+    edit(model)
+    after = model.cell_state(i, j)
+    if after == before:
+        return False
+
+    history = state.history
+    last = history.undo_stack[-1] if history.undo_stack else None
+    if coalesce and not history.redo_stack and last is not None and last[0] == "set_cell" \
+            and last[1:3] == (i, j) and last[5]:
+        history.undo_stack[-1] = ("set_cell", i, j, last[3], after, True)
+    else:
+        history.record(("set_cell", i, j, before, after, coalesce))
+    state.mark_cell(i, j)
+    return True
+
+
+def _execute(state, command):
+    _apply(state, command)
+    state.history.record(command)
+
+# values_rows: 행마다 값 리스트, style_rows: 행마다 스타일 번호 array("I")
+# (모델에 그대로 들어가므로 새로 만든 객체를 넘길 것 — TableModel.repeat_row 참고)
+def insert_rows(state, i, values_rows, style_rows):
+    _execute(state, ("insert_rows", i, values_rows, style_rows))
+
+
+def delete_rows(state, i, count=1):
+    model = state.table_data
+    _execute(state, ("delete_rows", i, model.values[i:i + count], model.style_ids[i:i + count]))
+
+# values_rows / style_rows: 행마다 j 위치에 넣을 값 / 스타일 번호 리스트 (TableModel.repeat_column 참고)
+def insert_columns(state, j, values_rows, style_rows):
+    _execute(state, ("insert_cols", j, values_rows, style_rows))
+
+
+def delete_columns(state, j, count=1):
+    model = state.table_data
+    values_rows = [row[j:j + count] for row in model.values]
+    style_rows = [row[j:j + count].tolist() for row in model.style_ids]
+    _execute(state, ("delete_cols", j, values_rows, style_rows))
+
+# ----------------------------
+# 3. 실행 취소 / 다시 실행
+# ----------------------------
+
+# 반환값: 되돌린 명령이 있으면 True
+def undo(state):
+    history = state.history
+    if not history.undo_stack:
+        return False
+    command = history.undo_stack.pop()
+    _apply(state, _inverse(command))
+    history.redo_stack.append(command)
+    return True
+
+
+def redo(state):
+    history = state.history
+    if not history.redo_stack:
+        return False
+    command = history.redo_stack.pop()
+    _apply(state, command)
+    history.undo_stack.append(command)
+    return True
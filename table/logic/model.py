@@ -0,0 +1,357 @@
+from array import array
+from typing import NamedTuple, Optional, Tuple
+
+# ----------------------------------------------------------------
+# 압축 테이블 모델
+# - 셀마다 딕셔너리(+ 테두리 딕셔너리 2개)를 두지 않고 두 가지 배열로 보관 (struct-of-arrays)
+#   · values[i]: i행 셀 값 리스트 (문자열)
+#   · style_ids[i]: i행 셀 스타일 번호 배열 (array("I"), 셀당 4바이트)
+# - 스타일(정렬, 편집 가능, 표시, 너비, 위/아래 테두리)은 모델마다 한 번씩만 저장하고 번호로 참조 (intern)
+#   → 대부분의 셀이 같은 스타일을 쓰므로 스타일 표는 수십 개 이하
+# - 기존 코드와의 호환: table_data[i][j]["value"], .get(), row.insert(), data.pop() 등
+#   리스트/딕셔너리 방식 접근은 RowView / CellView가 모델 배열을 직접 읽고 쓰는 얇은 창 역할
+#   (CellView에서 꺼낸 테두리 딕셔너리는 복사본 → 바꾸려면 cell["border_top"] = {...}로 다시 대입)
+# - 렌더러 / 내보내기처럼 많이 읽는 코드는 value(i, j), style(i, j)로 바로 조회
+# ----------------------------------------------------------------
+
+# 테두리: (색 이름, 두께)
+Border = Tuple[str, int]
+
+
+# 셀 스타일 (불변, 같은 내용이면 같은 번호를 공유)
+# None은 "키 없음" (딕셔너리 API에서 .get(key, 기본값)의 기본값이 쓰임)
+class CellStyle(NamedTuple):
+    align: Optional[str] = None
+    editable: Optional[bool] = None
+    visible: Optional[bool] = None
+    width: Optional[int] = None
+    border_top: Optional[Border] = None
+    border_bottom: Optional[Border] = None
+
+
+_STYLE_KEYS = ("align", "editable", "visible", "width")
+_BORDER_KEYS = ("border_top", "border_bottom")
+CELL_KEYS = ("value",) + _STYLE_KEYS + _BORDER_KEYS
+
+
+def _border_tuple(border):
+    if border is None:
+        return None
+    return (border.get("color", "white"), border.get("thickness", 1))
+
+
+def _border_dict(border):
+    return {"color": border[0], "thickness": border[1]}
+
+# 셀 딕셔너리 → (값, CellStyle)
+def style_from_dict(cell):
+    get = cell.get
+    style = CellStyle(
+        get("align"), get("editable"), get("visible"), get("width"),
+        _border_tuple(get("border_top")), _border_tuple(get("border_bottom"))
+    )
+    return cell.get("value"), style
+
+# (값, CellStyle) → 셀 딕셔너리 (없는 키는 빼고)
+def style_to_dict(value, style):
+    cell = {} if value is None else {"value": value}
+    for key in _STYLE_KEYS:
+        item = getattr(style, key)
+        if item is not None:
+            cell[key] = item
+    for key in _BORDER_KEYS:
+        border = getattr(style, key)
+        if border is not None:
+            cell[key] = _border_dict(border)
+    return cell
+
+
+class TableModel:
+    def __init__(self):
+        self.values = []     # 행마다 셀 값 리스트
+        self.style_ids = []  # 행마다 스타일 번호 array("I")
+        self.styles = []     # 스타일 번호 → CellStyle
+        self._style_index = {}  # CellStyle → 스타일 번호
+
+    # 셀 딕셔너리 행 리스트(get_default_table 형식)로 모델 생성
+    @classmethod
+    def from_rows(cls, rows):
+        model = cls()
+        for row in rows:
+            model.insert(len(model.values), row)
+        return model
+
+    # ----------------------------
+    # 1. 스타일 표
+    # ----------------------------
+
+    def intern(self, style):
+        style_id = self._style_index.get(style)
+        if style_id is None:
+            style_id = self._style_index[style] = len(self.styles)
+            self.styles.append(style)
+        return style_id
+
+    # 셀 딕셔너리 / CellView → (값, 스타일 번호)
+    def _encode(self, cell):
+        if isinstance(cell, CellView) and cell.model is self:
+            return cell.values[cell.j], cell.style_ids[cell.j]
+        value, style = style_from_dict(cell)
+        return value, self.intern(style)
+
+    # ----------------------------
+    # 2. 빠른 조회 / 수정 (렌더러, 내보내기용)
+    # ----------------------------
+
+    def value(self, i, j):
+        return self.values[i][j]
+
+    def style(self, i, j):
+        return self.styles[self.style_ids[i][j]]
+
+    def set_value(self, i, j, value):
+        self.values[i][j] = value
+
+    def set_style(self, i, j, style):
+        self.style_ids[i][j] = self.intern(style)
+
+    # 스타일 일부만 바꾸기 (예: replace_style(i, j, border_top=("black", 1)))
+    def replace_style(self, i, j, **fields):
+        self.set_style(i, j, self.style(i, j)._replace(**fields))
+
+    @property
+    def n_rows(self):
+        return len(self.values)
+
+    # 메모리 추정용: 셀 수와 스타일 수
+    def stats(self):
+        return {"cells": sum(len(row) for row in self.values), "styles": len(self.styles)}
+
+    # 백그라운드 내보내기용 복사본: 행 리스트/배열만 새로 만들고 값과 스타일(불변)은 공유
+    # → 내보내는 동안 편집기에서 계속 고쳐도 내보내는 내용은 바뀌지 않음
+    def snapshot(self):
+        model = TableModel()
+        model.values = [list(values) for values in self.values]
+        model.style_ids = [array("I", style_ids) for style_ids in self.style_ids]
+        model.styles = list(self.styles)
+        model._style_index = dict(self._style_index)
+        return model
+
+    # 셀 하나의 저장 상태 (값, 스타일 번호) — 실행 취소 기록용
+    def cell_state(self, i, j):
+        return self.values[i][j], self.style_ids[i][j]
+
+    def set_cell_state(self, i, j, cell_state):
+        self.values[i][j], self.style_ids[i][j] = cell_state
+
+    # ----------------------------
+    # 2-1. 배열 단위 행/열 추가·삭제 (셀 딕셔너리를 거치지 않음)
+    # - 새 셀은 템플릿 셀의 스타일 번호를 그대로 씀 → 스타일 기록을 공유하다가
+    #   셀 스타일을 바꿀 때만 새 스타일 번호로 바뀜 (copy-on-write, 다른 셀에는 영향 없음)
+    # - 여러 행/열을 한 번에 넣고 뺌 (슬라이스 대입 한 번)
+    # ----------------------------
+
+    # values: 값 리스트, style_ids: 스타일 번호 array("I") — 그대로 모델에 들어감 (복사하지 않음)
+    def insert_row_arrays(self, i, values, style_ids):
+        self.insert_rows_arrays(i, [values], [style_ids])
+
+    # 반환값: 삭제한 행의 (values, style_ids)
+    def delete_row(self, i):
+        return self.values.pop(i), self.style_ids.pop(i)
+
+    # values_rows / style_rows: 넣을 행마다 값 리스트 / 스타일 번호 array("I")
+    def insert_rows_arrays(self, i, values_rows, style_rows):
+        self.values[i:i] = values_rows
+        self.style_ids[i:i] = style_rows
+
+    # 반환값: 삭제한 행들의 (values_rows, style_rows)
+    def delete_rows(self, i, count):
+        values_rows = self.values[i:i + count]
+        style_rows = self.style_ids[i:i + count]
+        del self.values[i:i + count]
+        del self.style_ids[i:i + count]
+        return values_rows, style_rows
+
+    # values_rows / style_rows: 행마다 j 위치에 넣을 값 리스트 / 스타일 번호 리스트 (열 여러 개를 한 번에)
+    def insert_columns_arrays(self, j, values_rows, style_rows):
+        for row_values, row_style_ids, values, style_ids in zip(self.values, self.style_ids, values_rows, style_rows):
+            row_values[j:j] = values
+            row_style_ids[j:j] = array("I", style_ids)
+
+    # 반환값: 행마다 삭제한 (값 리스트, 스타일 번호 리스트) — 열이 모자란 행은 있는 만큼만
+    def delete_columns(self, j, count):
+        values_rows, style_rows = [], []
+        for row_values, row_style_ids in zip(self.values, self.style_ids):
+            values_rows.append(row_values[j:j + count])
+            style_rows.append(row_style_ids[j:j + count].tolist())
+            del row_values[j:j + count]
+            del row_style_ids[j:j + count]
+        return values_rows, style_rows
+
+    # 템플릿 행을 count번 복제한 행 배열 (값은 행마다 새 리스트, 스타일 번호는 그대로 공유)
+    def repeat_row(self, i, count):
+        values, style_ids = self.values[i], self.style_ids[i]
+        return [list(values) for _ in range(count)], [array("I", style_ids) for _ in range(count)]
+
+    # 템플릿 열을 count번 복제한 열 배열 (열이 없는 행은 default 셀 사용)
+    def repeat_column(self, j, count, default=None):
+        default_value, default_style = self._encode(default or {})
+        values_rows, style_rows = [], []
+        for row_values, row_style_ids in zip(self.values, self.style_ids):
+            if 0 <= j < len(row_values):
+                value, style_id = row_values[j], row_style_ids[j]
+            else:
+                value, style_id = default_value, default_style
+            values_rows.append([value] * count)
+            style_rows.append([style_id] * count)
+        return values_rows, style_rows
+
+    # ----------------------------
+    # 3. 리스트 방식 호환 API (table_data[i], len(), insert(), pop(), 반복)
+    # ----------------------------
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [RowView(self, values, style_ids) for values, style_ids in zip(self.values[i], self.style_ids[i])]
+        return RowView(self, self.values[i], self.style_ids[i])
+
+    def __iter__(self):
+        for values, style_ids in zip(self.values, self.style_ids):
+            yield RowView(self, values, style_ids)
+
+    # row: 셀 딕셔너리 리스트 또는 RowView
+    def insert(self, i, row):
+        encoded = [self._encode(cell) for cell in row]
+        self.insert_row_arrays(
+            i, [value for value, _ in encoded], array("I", (style_id for _, style_id in encoded))
+        )
+
+    def append(self, row):
+        self.insert(len(self.values), row)
+
+    # 반환값: 삭제한 행 (셀 딕셔너리 리스트)
+    def pop(self, i=-1):
+        values, style_ids = self.delete_row(i)
+        return [style_to_dict(value, self.styles[style_id]) for value, style_id in zip(values, style_ids)]
+
+    # 셀 딕셔너리 행 리스트로 변환 (예전 table_data 형식)
+    def to_rows(self):
+        return [row.to_list() for row in self]
+
+
+class RowView:
+    __slots__ = ("model", "values", "style_ids")
+
+    def __init__(self, model, values, style_ids):
+        self.model = model
+        self.values = values
+        self.style_ids = style_ids
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, j):
+        if isinstance(j, slice):
+            return [self[k] for k in range(len(self.values))[j]]
+        if j < 0:
+            j += len(self.values)
+        if not 0 <= j < len(self.values):
+            raise IndexError("cell index out of range")
+        return CellView(self.model, self.values, self.style_ids, j)
+
+    def __iter__(self):
+        for j in range(len(self.values)):
+            yield CellView(self.model, self.values, self.style_ids, j)
+
+    def insert(self, j, cell):
+        value, style_id = self.model._encode(cell)
+        self.values.insert(j, value)
+        self.style_ids.insert(j, style_id)
+
+    def append(self, cell):
+        self.insert(len(self.values), cell)
+
+    def pop(self, j=-1):
+        value = self.values.pop(j)
+        style_id = self.style_ids.pop(j)
+        return style_to_dict(value, self.model.styles[style_id])
+
+    def to_list(self):
+        return [cell.to_dict() for cell in self]
+
+
+class CellView:
+    __slots__ = ("model", "values", "style_ids", "j")
+
+    def __init__(self, model, values, style_ids, j):
+        self.model = model
+        self.values = values
+        self.style_ids = style_ids
+        self.j = j
+
+    @property
+    def style(self):
+        return self.model.styles[self.style_ids[self.j]]
+
+    def _lookup(self, key):
+        if key == "value":
+            return self.values[self.j]
+        if key in _STYLE_KEYS:
+            return getattr(self.style, key)
+        if key in _BORDER_KEYS:
+            border = getattr(self.style, key)
+            return None if border is None else _border_dict(border)
+        raise KeyError(key)
+
+    def __getitem__(self, key):
+        item = self._lookup(key)
+        if item is None:
+            raise KeyError(key)
+        return item
+
+    def get(self, key, default=None):
+        item = self._lookup(key) if key in CELL_KEYS else None
+        return default if item is None else item
+
+    def __contains__(self, key):
+        return key in CELL_KEYS and self._lookup(key) is not None
+
+    def __setitem__(self, key, item):
+        if key == "value":
+            self.values[self.j] = item
+        elif key in _STYLE_KEYS:
+            self._replace_style(**{key: item})
+        elif key in _BORDER_KEYS:
+            self._replace_style(**{key: _border_tuple(item)})
+        else:
+            raise KeyError(key)
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self.get(key)
+
+    def _replace_style(self, **fields):
+        self.style_ids[self.j] = self.model.intern(self.style._replace(**fields))
+
+    def keys(self):
+        return [key for key in CELL_KEYS if self._lookup(key) is not None]
+
+    def items(self):
+        return [(key, self[key]) for key in self.keys()]
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def to_dict(self):
+        return style_to_dict(self.values[self.j], self.style)
+
+    # deepcopy(cell) / copy(cell)은 독립된 셀 딕셔너리를 돌려줌 (다른 행/열에 insert 가능)
+    def __copy__(self):
+        return self.to_dict()
+
+    def __deepcopy__(self, memo):
+        return self.to_dict()
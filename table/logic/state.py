@@ -1,10 +1,73 @@
+from table.logic.history import EditHistory
+from table.logic.model import TableModel
 from table.logic.template import get_default_table
 
 TEXT_MODE = "text"
 STRUCTURE_MODE = "structure"
 
+
 class TableEditorState:
     def __init__(self):
-        self.table_data = get_default_table()
+        # 압축 테이블 모델 (table_data[i][j]["value"] 같은 기존 딕셔너리 방식 접근도 그대로 가능)
+        self.table_data = TableModel.from_rows(get_default_table())
         self.editing_mode = STRUCTURE_MODE
-        self.selected_cell = None
\ No newline at end of file
+        self.selected_cell = None
+        self.history = EditHistory()  # 실행 취소 / 다시 실행 기록 (table.logic.history)
+
+        # 🔸 변경 추적 (TableRenderer.flush()가 읽고 비움)
+        # - dirty_cells: 내용/테두리/선택 표시가 바뀐 셀 좌표 {(i, j), ...}
+        # - dirty_rows: 행 전체를 다시 맞춰야 하는 행 번호 {i, ...}
+        # - structure_changed: 행/열 추가·삭제가 있었음 (렌더러가 창 안의 행을 모두 다시 채움)
+        # - all_dirty: 모드 전환처럼 모든 셀을 다시 맞춰야 하는 경우
+        self.dirty_cells = set()
+        self.dirty_rows = set()
+        self.structure_changed = False
+        self.all_dirty = False
+
+    def mark_cell(self, i, j):
+        self.dirty_cells.add((i, j))
+
+    def mark_row(self, i):
+        self.dirty_rows.add(i)
+
+    def mark_all(self):
+        self.all_dirty = True
+
+    # 행/열 추가·삭제 표시 (몇 개를 넣고 뺐든 O(1))
+    # 렌더러가 창 안의 행을 모두 다시 채우므로 그 전에 쌓인 셀/행 변경은 버림 (좌표를 옮길 필요 없음)
+    def mark_structure(self):
+        self.structure_changed = True
+        self.dirty_cells.clear()
+        self.dirty_rows.clear()
+
+    # 선택 셀 변경 (이전 셀과 새 셀의 선택 표시만 다시 그리면 됨)
+    def select(self, cell):
+        if self.selected_cell is not None:
+            self.mark_cell(*self.selected_cell)
+        self.selected_cell = cell
+        if cell is not None:
+            self.mark_cell(*cell)
+
+    # 행/열 삭제 후 선택 좌표가 다른 셀(다음 행/열)을 가리키게 되면 선택 표시를 다시 맞추고,
+    # 범위를 벗어나면 선택 해제
+    def clamp_selection(self):
+        if self.selected_cell is None:
+            return
+        i, j = self.selected_cell
+        if i < len(self.table_data) and j < len(self.table_data.values[i]):
+            self.mark_cell(i, j)
+        else:
+            self.selected_cell = None
+
+    def has_changes(self):
+        return bool(self.all_dirty or self.dirty_cells or self.dirty_rows or self.structure_changed)
+
+    # 쌓인 변경을 꺼내고 비움
+    # 반환값: (structure_changed, dirty_cells, dirty_rows, all_dirty)
+    def take_changes(self):
+        changes = (self.structure_changed, self.dirty_cells, self.dirty_rows, self.all_dirty)
+        self.structure_changed = False
+        self.dirty_cells = set()
+        self.dirty_rows = set()
+        self.all_dirty = False
+        return changes
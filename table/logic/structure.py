@@ -1,52 +1,51 @@
-from copy import deepcopy
+from table.logic.history import delete_columns, delete_rows, edit_cell, insert_columns, insert_rows
 
-def handle_add_row(table_data, selected_cell, table_column, build_rows_fn, page):
-    if not table_data or selected_cell is None:
-        return
+# 구조 편집 핸들러: 편집 기록(history)을 거쳐 table_data를 고치고 (실행 취소 가능)
+# 바뀐 행/열/셀만 state에 표시한 뒤 renderer.flush()로 반영
+# count: 한 번에 추가할 행/열 수 → 모델에 한 번에 넣고 기록 하나, 화면 반영도 flush() 한 번
+# 새 셀은 선택한 행/열의 값과 스타일 번호를 복사 (스타일 기록은 공유, 셀을 고칠 때만 새 스타일로 바뀜)
 
-    i, _ = selected_cell
-    template_row = table_data[i]
-    new_row = [deepcopy(cell) for cell in template_row]  # ✅ 선택된 행 복사
-    table_data.insert(i + 1, new_row)
-    table_column.controls = build_rows_fn()
-    page.update()
+DEFAULT_CELL = {"value": "", "width": 85, "editable": True, "visible": True}
 
-def handle_delete_row(table_data, selected_cell, table_column, build_rows_fn, page):
-    if selected_cell is None:
+def handle_add_row(state, renderer, count=1):
+    model = state.table_data
+    if not len(model) or state.selected_cell is None or count < 1:
         return
-    i, _ = selected_cell
-    if 0 <= i < len(table_data):
-        table_data.pop(i)
-        table_column.controls = build_rows_fn()
-        page.update()
-
-def handle_add_column(table_data, selected_cell, table_column, build_rows_fn, page):
-    from copy import deepcopy
-    if selected_cell is None:
+
+    i, _ = state.selected_cell
+    insert_rows(state, i + 1, *model.repeat_row(i, count))  # ✅ 선택된 행 복사
+    renderer.flush()
+
+def handle_delete_row(state, renderer):
+    if state.selected_cell is None:
         return
-    _, j = selected_cell
-    for row in table_data:
-        new_cell = deepcopy(row[j]) if 0 <= j < len(row) else {"value": "", "width": 85, "editable": True, "visible": True}
-        row.insert(j + 1, new_cell)
-    table_column.controls = build_rows_fn()
-    page.update()
-
-def handle_delete_column(table_data, selected_cell, table_column, build_rows_fn, page):
-    if selected_cell is None:
+    i, _ = state.selected_cell
+    if 0 <= i < len(state.table_data):
+        delete_rows(state, i)
+        renderer.flush()
+
+def handle_add_column(state, renderer, count=1):
+    if state.selected_cell is None or count < 1:
         return
-    _, j = selected_cell
-    for row in table_data:
-        if 0 <= j < len(row):
-            row.pop(j)
-    table_column.controls = build_rows_fn()
-    page.update()
-
-def handle_toggle_bold(table_data, selected_cell, table_column, build_rows_fn, page):
-    if selected_cell is None:
+    _, j = state.selected_cell
+    insert_columns(state, j + 1, *state.table_data.repeat_column(j, count, DEFAULT_CELL))
+    renderer.flush()
+
+def handle_delete_column(state, renderer):
+    if state.selected_cell is None:
         return
-    i, j = selected_cell
+    _, j = state.selected_cell
+    delete_columns(state, j)
+    renderer.flush()
+
+def toggle_bold(table_data, i, j):
     cell = table_data[i][j]
-    border = cell.setdefault("border_top", {"thickness": 1, "color": "black"})
-    border["thickness"] = 3 if border.get("thickness", 1) == 1 else 1
-    table_column.controls = build_rows_fn()
-    page.update()
\ No newline at end of file
+    border = cell.get("border_top", {"thickness": 1, "color": "black"})
+    cell["border_top"] = {**border, "thickness": 3 if border.get("thickness", 1) == 1 else 1}
+
+def handle_toggle_bold(state, renderer):
+    if state.selected_cell is None:
+        return
+    i, j = state.selected_cell
+    edit_cell(state, i, j, lambda data: toggle_bold(data, i, j))
+    renderer.flush()
@@ -1,65 +1,256 @@
+import threading
+
 import flet as ft
-from table.logic.style import get_border_style, get_text_alignment
+from table.logic.style import get_text_alignment
 from table.logic.state import TEXT_MODE, STRUCTURE_MODE
 
-def render_cell(cell, i, j, state, ui, page, handle_border_toggle, make_on_change):
-    if not cell.get("visible", True):
-        if state.editing_mode == TEXT_MODE and cell.get("editable", False):
-            pass
-        else:
-            return ft.Container(width=0, height=0)
-
-    val = cell.get("value", "")
-    width = cell.get("width", 85)
-    border_top = dict(get_border_style(cell, "top"))
-    border_bottom = dict(get_border_style(cell, "bottom"))
-    align = cell.get("align", "left")
-    editable = cell.get("editable", True)
-
-    border = ft.border.only(
-        top=ft.BorderSide(width=border_top["thickness"], color=getattr(ft.colors, border_top["color"].upper(), ft.colors.TRANSPARENT)),
-        bottom=ft.BorderSide(width=border_bottom["thickness"], color=getattr(ft.colors, border_bottom["color"].upper(), ft.colors.TRANSPARENT))
-    )
-
-    if state.editing_mode == TEXT_MODE and editable:
-        return ft.Container(
-            width=width,
-            height=42,
-            bgcolor=ft.colors.WHITE,
-            border=border,
-            alignment=ft.alignment.center_left,
-            content=ft.TextField(
-                value=val,
-                text_size=12,
-                height=26,
-                text_align=get_text_alignment(align),
-                content_padding=ft.padding.symmetric(vertical=2, horizontal=4),
-                border=ft.InputBorder.NONE,
-                bgcolor=ft.colors.TRANSPARENT,
-                on_change=make_on_change(state, ui, page)(i, j),
-                autofocus=False
-            )
-        )
-    else:
-        is_selected = (state.editing_mode == STRUCTURE_MODE and state.selected_cell == (i, j))
-        return ft.GestureDetector(
-            on_tap=handle_border_toggle(state, ui, page)(i, j),
-            content=ft.Container(
-                width=width,
-                height=42,
-                bgcolor=ft.colors.BLUE_100 if is_selected else ft.colors.WHITE,
-                border=border,
-                alignment=ft.alignment.center_left,
-                content=ft.Text(val, size=12, text_align=get_text_alignment(align))
-            )
+# ----------------------------------------------------------------
+# 테이블 증분 + 가상화(virtualized) 렌더러
+# - 화면에 보이는 행 창(window)과 위아래 여유 행(buffer)만 컨트롤로 만들고,
+#   창 밖의 행은 높이만 차지하는 빈 컨테이너(spacer)로 대신함
+#   → 행이 5,000개여도 만드는 컨트롤 수와 첫 화면 시간은 창 크기만큼으로 일정
+# - 스크롤하면 창 밖으로 나간 행 컨트롤을 반대쪽 끝으로 옮겨 새 행 데이터로 다시 채움 (재활용)
+# - 편집은 TableEditorState에 표시된 변경(dirty)만 반영
+#   · 셀 변경 (테두리 토글, 선택): 창 안에 있으면 해당 셀 컨테이너 속성만 바꾸고 그 컨트롤만 update
+#     (창 밖이면 스크롤로 들어올 때 최신 데이터로 채워지므로 따로 할 일 없음)
+#   · 행/열 추가·삭제, 모드 전환: 창 안의 행만 다시 채움 (Text ↔ TextField는 셀마다 한 번 만든 것을 교체)
+# - 이벤트 핸들러는 셀마다 새로 만들지 않고 하나를 공유, 셀 좌표는 컨트롤의 data=(i, j)에서 읽음
+# ----------------------------------------------------------------
+
+CELL_HEIGHT = 42       # 셀(행) 높이 — 모든 행이 같은 높이라서 스크롤 위치로 행 번호를 바로 계산
+VISIBLE_ROWS = 15      # 테이블 영역에 한 번에 보이는 행 수 (영역 높이 = VISIBLE_ROWS * CELL_HEIGHT)
+BUFFER_ROWS = 10       # 창 위아래로 미리 만들어 두는 여유 행 수 (빠른 스크롤 시 빈 화면 방지)
+SCROLL_INTERVAL_MS = 50
+
+
+def _border_side(border):
+    color, thickness = border or ("white", 0)
+    return ft.BorderSide(width=thickness, color=getattr(ft.colors, color.upper(), ft.colors.TRANSPARENT))
+
+# 셀 스타일(CellStyle)의 위/아래 테두리 → Flet Border
+def cell_border(style):
+    return ft.border.only(top=_border_side(style.border_top), bottom=_border_side(style.border_bottom))
+
+
+# 셀 하나를 이루는 컨트롤 묶음
+class CellControls:
+    __slots__ = ("detector", "box", "label", "field")
+
+    def __init__(self, detector, box, label):
+        self.detector = detector  # 구조 모드 클릭 처리 (GestureDetector)
+        self.box = box            # 테두리/배경/너비 (Container)
+        self.label = label        # 구조 모드 표시용 Text
+        self.field = None         # 텍스트 모드 입력용 TextField (처음 필요할 때 생성)
+
+
+class TableRenderer:
+    # on_tap: 셀 클릭 핸들러 handler(e), on_change: 셀 입력 핸들러 handler(e) — 둘 다 e.control.data로 좌표 확인
+    # table_column: 테이블 영역 Column (렌더러가 높이와 스크롤 설정을 맡음)
+    def __init__(self, state, page, table_column, on_tap, on_change,
+                 visible_rows=VISIBLE_ROWS, buffer_rows=BUFFER_ROWS):
+        self.state = state
+        self.page = page
+        self.on_tap = on_tap
+        self.on_change = on_change
+        self.visible_rows = visible_rows
+        self.buffer_rows = buffer_rows
+        self.window_rows = visible_rows + 2 * buffer_rows
+
+        self.table_column = table_column
+        table_column.scroll = ft.ScrollMode.AUTO
+        table_column.on_scroll = self.on_scroll
+        table_column.on_scroll_interval = SCROLL_INTERVAL_MS
+
+        self.top_spacer = ft.Container(height=0)
+        self.bottom_spacer = ft.Container(height=0)
+        self.window_start = 0  # 창 첫 행의 테이블 행 번호
+        self.slots = []        # 창의 행마다 CellControls 리스트 (slots[k]는 window_start + k 행을 표시)
+        self.rows = []         # 창의 행마다 ft.Row
+        self._lock = threading.Lock()  # 스크롤/클릭 이벤트가 서로 다른 스레드에서 동시에 올 수 있음
+
+    # ----------------------------
+    # 1. 컨트롤 생성 / 속성 반영
+    # ----------------------------
+
+    def _build_cell(self, i, j):
+        label = ft.Text("", size=12)
+        box = ft.Container(height=CELL_HEIGHT, alignment=ft.alignment.center_left, content=label)
+        detector = ft.GestureDetector(on_tap=self.on_tap, content=box)
+        controls = CellControls(detector, box, label)
+        self._apply(controls, i, j)
+        return controls
+
+    def _build_field(self):
+        return ft.TextField(
+            text_size=12,
+            height=26,
+            content_padding=ft.padding.symmetric(vertical=2, horizontal=4),
+            border=ft.InputBorder.NONE,
+            bgcolor=ft.colors.TRANSPARENT,
+            on_change=self.on_change,
+            autofocus=False
         )
 
-def build_table_rows(state, ui, page, handle_border_toggle, make_on_change):
-    rows = []
-    for i, row in enumerate(state.table_data):
-        cells = [
-            render_cell(cell, i, j, state, ui, page, handle_border_toggle, make_on_change)
-            for j, cell in enumerate(row)
-        ]
-        rows.append(ft.Row(controls=cells, spacing=0))
-    return rows
\ No newline at end of file
+    # 셀 데이터와 편집 모드를 컨트롤 속성에 반영 (값이 같은 속성은 Flet이 전송하지 않음)
+    def _apply(self, controls, i, j):
+        state = self.state
+        style = state.table_data.style(i, j)
+        editable = style.editable is not False
+        text_mode = state.editing_mode == TEXT_MODE
+        value = state.table_data.value(i, j) or ""
+        align = get_text_alignment(style.align or "left")
+
+        # 숨김 셀은 텍스트 모드에서 편집 가능한 경우에만 표시
+        controls.detector.visible = style.visible is not False or (text_mode and editable)
+        controls.detector.data = (i, j)
+
+        box = controls.box
+        box.width = 85 if style.width is None else style.width
+        box.border = cell_border(style)
+
+        if text_mode and editable:
+            if controls.field is None:
+                controls.field = self._build_field()
+            controls.field.value = value
+            controls.field.text_align = align
+            controls.field.data = (i, j)
+            box.bgcolor = ft.colors.WHITE
+            box.content = controls.field
+        else:
+            is_selected = (state.editing_mode == STRUCTURE_MODE and state.selected_cell == (i, j))
+            controls.label.value = value
+            controls.label.text_align = align
+            box.bgcolor = ft.colors.BLUE_100 if is_selected else ft.colors.WHITE
+            box.content = controls.label
+
+    # 창의 k번째 행 컨트롤을 테이블 i행으로 다시 채움 (열 수가 다르면 셀 컨트롤을 더하거나 뺌)
+    def _bind_row(self, k, i):
+        row_cells = self.slots[k]
+        row_controls = self.rows[k].controls
+        n_cols = len(self.state.table_data[i])
+        while len(row_cells) > n_cols:
+            row_cells.pop()
+            row_controls.pop()
+        while len(row_cells) < n_cols:
+            controls = self._build_cell(i, len(row_cells))
+            row_cells.append(controls)
+            row_controls.append(controls.detector)
+        for j, controls in enumerate(row_cells):
+            self._apply(controls, i, j)
+
+    def _in_window(self, i):
+        return self.window_start <= i < self.window_start + len(self.slots)
+
+    # 창 밖 행들이 차지할 높이를 spacer에 반영하고 Column 내용 구성
+    # 테이블 영역 높이는 최대 visible_rows 행 (행이 적으면 행 수만큼만 차지)
+    def _layout(self):
+        n_rows = len(self.state.table_data)
+        self.table_column.height = min(n_rows, self.visible_rows) * CELL_HEIGHT
+        self.top_spacer.height = self.window_start * CELL_HEIGHT
+        self.bottom_spacer.height = (n_rows - self.window_start - len(self.slots)) * CELL_HEIGHT
+        self.table_column.controls = [self.top_spacer, *self.rows, self.bottom_spacer]
+
+    # 창 크기를 행 수에 맞추고 (start 위치로) 창 안의 모든 행을 다시 채움
+    def _sync_window(self, start=None):
+        n_rows = len(self.state.table_data)
+        size = min(n_rows, self.window_rows)
+        start = self.window_start if start is None else start
+        self.window_start = max(0, min(start, n_rows - size))
+
+        while len(self.slots) < size:
+            self.slots.append([])
+            self.rows.append(ft.Row(controls=[], spacing=0))
+        del self.slots[size:]
+        del self.rows[size:]
+
+        for k in range(size):
+            self._bind_row(k, self.window_start + k)
+        self._layout()
+
+    # ----------------------------
+    # 2. 전체 렌더링 (처음 한 번)
+    # ----------------------------
+
+    def render_all(self):
+        with self._lock:
+            self.state.take_changes()
+            self._sync_window(0)
+
+    # ----------------------------
+    # 3. 스크롤 (행 컨트롤 재활용)
+    # ----------------------------
+
+    # first_row가 화면 맨 위에 오도록 창을 옮김
+    # 반환값: 창이 바뀌었으면 True
+    def scroll_to_row(self, first_row):
+        n_rows = len(self.state.table_data)
+        size = len(self.slots)
+        start = max(0, min(first_row - self.buffer_rows, n_rows - size))
+        shift = start - self.window_start
+        if shift == 0:
+            return False
+
+        if abs(shift) >= size:
+            # 창이 통째로 넘어가면 그 자리에서 전부 다시 채움
+            self.window_start = start
+            rebind = range(size)
+        elif shift > 0:
+            # 아래로: 위쪽에서 벗어난 행 컨트롤을 아래 끝으로 옮김
+            self.slots = self.slots[shift:] + self.slots[:shift]
+            self.rows = self.rows[shift:] + self.rows[:shift]
+            self.window_start = start
+            rebind = range(size - shift, size)
+        else:
+            # 위로: 아래쪽에서 벗어난 행 컨트롤을 위 끝으로 옮김
+            self.slots = self.slots[shift:] + self.slots[:shift]
+            self.rows = self.rows[shift:] + self.rows[:shift]
+            self.window_start = start
+            rebind = range(-shift)
+
+        for k in rebind:
+            self._bind_row(k, start + k)
+        self._layout()
+        return True
+
+    def on_scroll(self, e):
+        with self._lock:
+            changed = self.scroll_to_row(int(e.pixels // CELL_HEIGHT))
+        if changed:
+            self.page.update(self.table_column)
+
+    # ----------------------------
+    # 4. 변경분 반영 + 최소 update
+    # ----------------------------
+
+    # 쌓인 변경을 창 안의 컨트롤에 반영하고 바뀐 컨트롤만 page.update()로 전송
+    # extra: 같은 update에 함께 보낼 다른 컨트롤 (예: 모드 버튼)
+    # update=False면 컨트롤만 고치고 전송은 호출한 쪽에 맡김
+    # 반환값: update 대상 컨트롤 리스트
+    def flush(self, *extra, update=True):
+        with self._lock:
+            structure_changed, dirty_cells, dirty_rows, all_dirty = self.state.take_changes()
+
+            targets = []
+            if structure_changed or all_dirty:
+                # 행/열 추가·삭제나 모드 전환: 창 안의 행만 다시 채우고 Column을 diff
+                # (바뀌지 않은 속성은 전송되지 않으므로 실제 전송량은 바뀐 셀만큼)
+                self._sync_window()
+                targets.append(self.table_column)
+            else:
+                for i in sorted(dirty_rows):
+                    if self._in_window(i):
+                        k = i - self.window_start
+                        self._bind_row(k, i)
+                        targets.append(self.rows[k])
+                for i, j in sorted(dirty_cells):
+                    if i in dirty_rows or not self._in_window(i):
+                        continue
+                    row_cells = self.slots[i - self.window_start]
+                    if j < len(row_cells):
+                        self._apply(row_cells[j], i, j)
+                        targets.append(row_cells[j].detector)
+
+        targets.extend(extra)
+        if update and targets:
+            self.page.update(*targets)
+        return targets
@@ -1,3 +1,5 @@
+from table.logic.model import TableModel
+
 # 셀 객체 생성 함수
 def cell(val, align="center", editable=True, top=False, bottom=False, width=85, visible=True):
     return {
@@ -90,24 +92,36 @@ def get_text_alignment(align_str):
     from flet import TextAlign
     return getattr(TextAlign, align_str.upper(), TextAlign.LEFT)
 
-# 행 복사 삽입
-def add_row(data, row_index, template_row=None):
-    from copy import deepcopy
+# 셀 복사 (copy-on-write): 테두리 딕셔너리는 원본과 공유
+# 이 모듈의 토글 함수들은 테두리 딕셔너리를 고치지 않고 새로 대입하므로 공유해도 안전
+def copy_cell(cell):
+    return dict(cell)
+
+# 행 복사 삽입 (count개를 한 번에)
+# TableModel이면 값/스타일 번호 배열만 복제 (셀 딕셔너리를 만들지 않음)
+def add_row(data, row_index, template_row=None, count=1):
+    if template_row is None and isinstance(data, TableModel):
+        data.insert_rows_arrays(row_index + 1, *data.repeat_row(row_index, count))
+        return data
     if template_row is None:
         template_row = data[row_index]
-    new_row = [deepcopy(cell) for cell in template_row]
-    data.insert(row_index + 1, new_row)
+    new_rows = [[copy_cell(cell) for cell in template_row] for _ in range(count)]
+    if isinstance(data, TableModel):
+        for offset, new_row in enumerate(new_rows):
+            data.insert(row_index + 1 + offset, new_row)
+    else:
+        data[row_index + 1:row_index + 1] = new_rows
     return data
 
-# 열 복사 삽입
-def add_column(data, col_index, template_column=None):
-    from copy import deepcopy
+# 열 복사 삽입 (count개를 한 번에)
+def add_column(data, col_index, template_column=None, count=1):
+    if template_column is None and isinstance(data, TableModel):
+        data.insert_columns_arrays(col_index + 1, *data.repeat_column(col_index, count))
+        return data
     for i, row in enumerate(data):
-        if template_column is None:
-            new_cell = deepcopy(row[col_index])
-        else:
-            new_cell = deepcopy(template_column[i])
-        row.insert(col_index + 1, new_cell)
+        template_cell = row[col_index] if template_column is None else template_column[i]
+        for offset in range(count):
+            row.insert(col_index + 1 + offset, copy_cell(template_cell))
     return data
 
 # 테두리 두께 토글 (1 <-> 2)
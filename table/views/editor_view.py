@@ -1,10 +1,9 @@
 import flet as ft
-from table.core.exporter import export_table_to_word
 from table.logic.state import TableEditorState
 from table.logic.handlers import (
-    enable_text_mode, enable_structure_mode, handle_border_toggle, make_on_change
+    enable_text_mode, enable_structure_mode, handle_border_toggle, make_on_change, handle_undo, handle_redo
 )
-from table.logic.table_renderer import build_table_rows
+from table.logic.table_renderer import TableRenderer
 from table.views.mode_buttons import build_mode_buttons
 from table.views.footer import footer_section
 from table.logic.structure import (
@@ -22,19 +21,22 @@ def table_editor_view(page: ft.Page):
         "mode_buttons": ft.Container()
     }
 
+    # 테이블 셀 컨트롤은 처음 한 번만 만들고, 이후 편집은 바뀐 셀/행/열만 렌더러가 반영
+    ui["renderer"] = TableRenderer(
+        state,
+        page,
+        ui["table_column"],
+        handle_border_toggle(state, ui, page),
+        make_on_change(state, ui, page)
+    )
+
     def rebuild():
         ui["mode_buttons"].content = build_mode_buttons(
             state.editing_mode,
             enable_text_mode(state, ui, page),
             enable_structure_mode(state, ui, page)
         )
-        ui["table_column"].controls = build_table_rows(
-            state,
-            ui,
-            page,
-            handle_border_toggle,
-            make_on_change
-        )
+        ui["renderer"].render_all()
 
     rebuild()
 
@@ -42,34 +44,40 @@ def table_editor_view(page: ft.Page):
         if state.editing_mode != "structure":
             return []
 
-        def row_action(label, handler_func):
-            return ft.ElevatedButton(
-                label,
-                on_click=lambda e: handler_func(
-                    state.table_data,
-                    state.selected_cell,
-                    ui["table_column"],
-                    lambda: build_table_rows(
-                        state,
-                        ui,
-                        page,
-                        handle_border_toggle,
-                        make_on_change
-                    ),
-                    page
-                ) if state.selected_cell else None
-            )
+        # 한 번에 추가할 행/열 수 (잘못된 값이면 1)
+        count_input = ft.TextField(
+            value="1", label="Count", width=80, height=40, text_size=12,
+            content_padding=ft.padding.symmetric(vertical=2, horizontal=8),
+            keyboard_type=ft.KeyboardType.NUMBER
+        )
+
+        def insert_count():
+            try:
+                return max(1, int(count_input.value))
+            except (TypeError, ValueError):
+                return 1
+
+        def row_action(label, handler_func, with_count=False):
+            def on_click(e):
+                if not state.selected_cell:
+                    return
+                if with_count:
+                    handler_func(state, ui["renderer"], insert_count())
+                else:
+                    handler_func(state, ui["renderer"])
+            return ft.ElevatedButton(label, on_click=on_click)
 
         structure_row = ft.Row([
-            row_action("➕ Add Row", handle_add_row),
+            row_action("➕ Add Row", handle_add_row, with_count=True),
             row_action("➖ Delete Row", handle_delete_row),
-            ft.ElevatedButton("↩️ Undo", on_click=lambda e: None),
+            ft.ElevatedButton("↩️ Undo", on_click=handle_undo(state, ui, page)),
+            count_input,
         ], spacing=10)
 
         column_row = ft.Row([
-            row_action("➕ Add Column", handle_add_column),
+            row_action("➕ Add Column", handle_add_column, with_count=True),
             row_action("➖ Delete Column", handle_delete_column),
-            ft.ElevatedButton("🔄 Reverse Undo", on_click=lambda e: None),
+            ft.ElevatedButton("🔄 Reverse Undo", on_click=handle_redo(state, ui, page)),
             row_action("🔳 Toggle Bold Line", handle_toggle_bold),
         ], spacing=10)
 
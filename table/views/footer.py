@@ -1,5 +1,66 @@
+import threading
 import flet as ft
-from table.core.exporter import export_table_to_word
+from table.core.export_queue import submit_export
+from table.core.serializers import FORMATS, serialize_table
+
+# 🔷 Export 버튼: 내보내기 작업을 백그라운드 큐에 넣고 진행 상황/완료를 버튼 옆에 표시
+# (python-docx는 첫 작업을 실행할 때 작업 스레드에서 불러옴 → 편집기 화면을 빨리 열고, 클릭해도 화면이 멈추지 않음)
+def build_export_controls(page, table_data):
+    status = ft.Text("", size=12, color=ft.colors.GREY_600)
+    progress_bar = ft.ProgressBar(width=120, value=0, color=ft.colors.CYAN_400, visible=False)
+    queued = {"count": 0}
+    lock = threading.Lock()
+
+    def show(text, color=ft.colors.GREY_600, progress=None):
+        status.value = text
+        status.color = color
+        progress_bar.visible = progress is not None
+        if progress is not None:
+            progress_bar.value = progress
+        page.update(status, progress_bar)
+
+    def finish():
+        with lock:
+            queued["count"] -= 1
+            return queued["count"]
+
+    def on_progress(done, total):
+        show(f"Exporting... ({done}/{total})", progress=done / total if total else None)
+
+    def on_done(paths):
+        remaining = finish()
+        suffix = f" · {remaining} more queued" if remaining else ""
+        show(f"✅ Exported to {', '.join(paths)}{suffix}", color=ft.colors.GREEN_600)
+
+    def on_error(err):
+        finish()
+        show(f"❌ Export failed: {err}", color=ft.colors.RED_400)
+
+    def on_click(e):
+        with lock:
+            queued["count"] += 1
+            count = queued["count"]  # 잠금 안에서 읽은 값으로 표시 (다른 작업이 끝나며 바뀔 수 있음)
+        if count > 1:
+            show(f"Queued ({count} exports)")
+        submit_export([table_data], on_progress=on_progress, on_done=on_done, on_error=on_error)
+
+    button = ft.ElevatedButton("📤 Export to Word", on_click=on_click, style=ft.ButtonStyle(bgcolor=ft.colors.CYAN_200))
+    return [status, progress_bar, button]
+
+# 🔷 Copy as 메뉴: LaTeX / HTML / Markdown / CSV 텍스트를 클립보드로 (python-docx 없이 바로 변환)
+def build_copy_menu(page, table_data):
+    labels = {"latex": "LaTeX (booktabs)", "html": "HTML", "markdown": "Markdown", "csv": "CSV"}
+
+    def copy_as(fmt):
+        def handler(e):
+            page.set_clipboard(serialize_table(table_data, fmt))
+        return handler
+
+    return ft.PopupMenuButton(
+        content=ft.Text("📋 Copy as...", size=14),
+        tooltip="Copy the table as text",
+        items=[ft.PopupMenuItem(text=labels.get(fmt, fmt), on_click=copy_as(fmt)) for fmt in FORMATS]
+    )
 
 def footer_section(page, table_data):
     return ft.Column([
@@ -33,6 +94,7 @@ def footer_section(page, table_data):
         ft.Row([
             ft.ElevatedButton("⬅️ Back", on_click=lambda e: page.go("/"), style=ft.ButtonStyle(bgcolor=ft.colors.GREY_200)),
             ft.Container(expand=True),
-            ft.ElevatedButton("📤 Export to Word", on_click=lambda e: export_table_to_word(table_data), style=ft.ButtonStyle(bgcolor=ft.colors.CYAN_200))
-        ])
+            build_copy_menu(page, table_data),
+            *build_export_controls(page, table_data)
+        ], spacing=10)
     ])
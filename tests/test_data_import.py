@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from stats.tools.data_import import list_columns, load_columns
+
+# ----------------------------------------------------------------
+# 대용량 데이터 파일 불러오기 (CSV / TSV / .npy / Parquet)
+# - 열 목록 ↔ 파일 헤더, 선택한 열만 float64 배열로
+# ----------------------------------------------------------------
+
+def test_csv_loads_only_selected_columns(tmp_path):
+    path = tmp_path / "scores.csv"
+    path.write_text("id,before,after\n1,1.5,2\n2,3,4.25\n3,-1,0\n")
+    assert list_columns(str(path)) == ["id", "before", "after"]
+
+    data = load_columns(str(path), ["after", "before"])
+    assert list(data) == ["after", "before"]
+    np.testing.assert_array_equal(data["before"], [1.5, 3.0, -1.0])
+    np.testing.assert_array_equal(data["after"], [2.0, 4.25, 0.0])
+    assert data["after"].dtype == np.float64
+
+
+def test_tsv_uses_tab_separator(tmp_path):
+    path = tmp_path / "scores.tsv"
+    path.write_text("a\tb\n1\t2\n3\t4\n")
+    assert list_columns(str(path)) == ["a", "b"]
+    np.testing.assert_array_equal(load_columns(str(path), ["b"])["b"], [2.0, 4.0])
+
+
+def test_npy_two_dimensional_and_structured(tmp_path):
+    matrix = tmp_path / "matrix.npy"
+    np.save(matrix, np.arange(12, dtype=np.float32).reshape(4, 3))
+    assert list_columns(str(matrix)) == ["0", "1", "2"]
+    column = load_columns(str(matrix), ["2"])["2"]
+    np.testing.assert_array_equal(column, [2.0, 5.0, 8.0, 11.0])
+    assert column.dtype == np.float64
+
+    records = tmp_path / "records.npy"
+    np.save(records, np.array([(1, 2.5), (3, 4.5)], dtype=[("x", "i4"), ("y", "f8")]))
+    assert list_columns(str(records)) == ["x", "y"]
+    np.testing.assert_array_equal(load_columns(str(records), ["x"])["x"], [1.0, 3.0])
+
+
+def test_npy_rejects_three_dimensional(tmp_path):
+    path = tmp_path / "cube.npy"
+    np.save(path, np.zeros((2, 2, 2)))
+    with pytest.raises(ValueError):
+        list_columns(str(path))
+
+
+def test_unsupported_extension(tmp_path):
+    with pytest.raises(ValueError):
+        list_columns(str(tmp_path / "data.xlsx"))
+    with pytest.raises(ValueError):
+        load_columns(str(tmp_path / "data.xlsx"), ["a"])
+
+
+def test_parquet(tmp_path):
+    pytest.importorskip("pyarrow")
+    import pandas as pd
+    path = tmp_path / "scores.parquet"
+    pd.DataFrame({"before": [1.0, 2.0], "after": [3, 5]}).to_parquet(path)
+    assert list_columns(str(path)) == ["before", "after"]
+    np.testing.assert_array_equal(load_columns(str(path), ["after"])["after"], [3.0, 5.0])
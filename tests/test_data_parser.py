@@ -0,0 +1,110 @@
+import numpy as np
+import pytest
+
+from stats.tools.data_parser import MAX_REPORTED_TOKENS, ParseError, guess_decimal, parse_numbers
+
+# ----------------------------------------------------------------
+# 붙여넣은 텍스트 파서
+# - 구분자 / 소수점 쉼표 추정
+# - 잘못된 값의 위치(순번, 줄, 열) ↔ 토큰을 하나씩 훑는 단순 계산
+# ----------------------------------------------------------------
+
+
+def _reference_bad_tokens(text, normalized):
+    # 줄마다 따로 토큰을 찾아 위치를 직접 계산
+    bad = []
+    index = 0
+    offset = 0
+    for line_no, line in enumerate(normalized.split("\n"), start=1):
+        column = 0
+        for part in line.split():
+            column = line.index(part, column)
+            index += 1
+            try:
+                float(part)
+            except ValueError:
+                bad.append((index, line_no, column + 1, text[offset + column:offset + column + len(part)]))
+            column += len(part)
+        offset += len(line) + 1
+    return bad
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("1, 2, 3", [1, 2, 3]),
+    ("1\t2\n3;4", [1, 2, 3, 4]),
+    ("1.5 2.25\n-3e2", [1.5, 2.25, -300]),
+    ("1,5\t2,25\n3,0", [1.5, 2.25, 3.0]),
+])
+def test_parse_numbers(text, expected):
+    np.testing.assert_array_equal(parse_numbers(text), expected)
+
+
+@pytest.mark.parametrize("text, decimal", [
+    ("1,5 2,5", "comma"),
+    ("1,2,3", "dot"),
+    ("1, 2, 3", "dot"),
+    ("1.5,2", "dot"),
+    ("1,5", "dot"),
+    ("1,5;2,5", "comma"),
+])
+def test_guess_decimal(text, decimal):
+    assert guess_decimal(text) == decimal
+
+
+def test_explicit_decimal_comma():
+    np.testing.assert_array_equal(parse_numbers("1,5 2", decimal="comma"), [1.5, 2.0])
+    with pytest.raises(ValueError):
+        parse_numbers("1", decimal="semicolon")
+
+
+def test_empty_input():
+    with pytest.raises(ParseError, match="Before: no numbers found"):
+        parse_numbers(" \n\t", name="Before")
+
+
+def test_error_positions():
+    text = "1, 2, x\n3\n  4 y5, 6\n\nz"
+    with pytest.raises(ParseError) as info:
+        parse_numbers(text, name="After")
+    err = info.value
+    assert err.bad_tokens == [(3, 1, 7, "x"), (6, 3, 5, "y5"), (8, 5, 1, "z")]
+    assert err.bad_count == 3
+    assert str(err) == (
+        "After: 3 invalid value(s): 'x' (value #3, line 1, column 7), "
+        "'y5' (value #6, line 3, column 5), 'z' (value #8, line 5, column 1)"
+    )
+
+
+def test_error_positions_keep_original_text_with_decimal_comma():
+    with pytest.raises(ParseError) as info:
+        parse_numbers("1,5\t2,5\na,5", decimal="comma")
+    assert info.value.bad_tokens == [(3, 2, 1, "a,5")]
+
+
+def test_only_first_tokens_are_located():
+    text = "\n".join(f"{i} bad{i}" for i in range(50))
+    with pytest.raises(ParseError) as info:
+        parse_numbers(text)
+    err = info.value
+    assert err.bad_count == 50
+    assert len(err.bad_tokens) == MAX_REPORTED_TOKENS
+    assert err.bad_tokens == _reference_bad_tokens(text, text)[:MAX_REPORTED_TOKENS]
+    assert str(err).endswith(f", and {50 - MAX_REPORTED_TOKENS} more")
+
+
+def test_error_positions_match_reference_on_random_input():
+    rng = np.random.default_rng(0)
+    pieces = ["1", "2.5", "-3", "x", "1e", "abc", "nan", "4", "--", "7"]
+    separators = [" ", "  ", "\t", "\n", "\n\n", "; "]
+    for _ in range(200):
+        count = rng.integers(1, 30)
+        text = "".join(pieces[rng.integers(len(pieces))] + separators[rng.integers(len(separators))]
+                       for _ in range(count))
+        normalized = text.replace(",", " ").replace(";", " ")
+        expected = _reference_bad_tokens(text, normalized)
+        if not expected:
+            continue
+        with pytest.raises(ParseError) as info:
+            parse_numbers(text, decimal="dot")
+        assert info.value.bad_tokens == expected[:MAX_REPORTED_TOKENS]
+        assert info.value.bad_count == len(expected)
@@ -0,0 +1,94 @@
+import threading
+
+import pytest
+
+from table.core.export_queue import ExportTable, _normalize, _numbered, submit_export
+from table.logic.model import TableModel
+from table.logic.template import get_default_table
+
+# ----------------------------------------------------------------
+# 백그라운드 Word 내보내기 큐
+# - 제목은 ExportTable로만 지정 (그냥 튜플은 테이블로 봄)
+# - 제출 시점의 복사본을 내보냄, 제출한 순서대로 실행
+# ----------------------------------------------------------------
+
+docx = pytest.importorskip("docx")
+
+
+def _tables_in(path):
+    document = docx.Document(str(path))
+    return [[[cell.text for cell in row.cells] for row in table.rows] for table in document.tables]
+
+
+def _paragraphs_in(path):
+    return [paragraph.text for paragraph in docx.Document(str(path)).paragraphs if paragraph.text]
+
+
+def test_normalize_titles_and_plain_tuples():
+    rows = get_default_table()
+    tuple_table = tuple(tuple(row) for row in rows)
+    normalized = _normalize([ExportTable("Scores", rows), tuple_table])
+    assert normalized[0].title == "Scores"
+    assert normalized[1].title is None and len(normalized[1].table_data) == len(rows)
+
+
+def test_submitted_tables_are_snapshots():
+    model = TableModel.from_rows(get_default_table())
+    rows = get_default_table()
+    snapshot_model, snapshot_rows = (item.table_data for item in _normalize([model, rows]))
+    model.set_value(0, 0, "changed")
+    rows[0][0]["value"] = "changed"
+    assert snapshot_model.value(0, 0) != "changed"
+    assert snapshot_rows[0][0].get("value") != "changed"
+
+
+def test_numbered_filenames():
+    assert _numbered("out/report.docx", 2) == "out/report_2.docx"
+    assert _numbered("out/report", 1) == "out/report_1.docx"
+
+
+def test_single_document_with_titles_and_progress(tmp_path):
+    model = TableModel.from_rows(get_default_table())
+    model.set_value(0, 0, "Variable")
+    path = tmp_path / "tables.docx"
+    progress = []
+    job = submit_export(
+        [ExportTable("Descriptive statistics", model), model], filename=str(path), open_when_done=False,
+        on_progress=lambda done, total: progress.append((done, total))
+    )
+    model.set_value(0, 0, "edited after submit")
+
+    assert job.result(timeout=30) == [str(path)]
+    assert progress == [(0, 2), (1, 2), (2, 2)]
+    tables = _tables_in(path)
+    assert len(tables) == 2
+    assert tables[0][0][0] == "Variable"
+    assert _paragraphs_in(path)[:2] == ["Table 1", "Descriptive statistics"]
+
+
+def test_separate_documents(tmp_path):
+    rows = get_default_table()
+    job = submit_export([rows, rows], filename=str(tmp_path / "each.docx"), separate=True, open_when_done=False)
+    paths = job.result(timeout=30)
+    assert paths == [str(tmp_path / "each_1.docx"), str(tmp_path / "each_2.docx")]
+    assert all(len(_tables_in(path)) == 1 for path in paths)
+
+
+def test_jobs_run_in_order_and_errors_go_to_on_error(tmp_path):
+    order = []
+    finished = threading.Event()
+    errors = []
+
+    first = submit_export([get_default_table()], filename=str(tmp_path / "a.docx"), open_when_done=False,
+                          on_done=lambda paths: order.append("a"))
+    (tmp_path / "file").write_text("")  # 파일 아래 경로 → 저장 실패
+    broken = submit_export([get_default_table()], filename=str(tmp_path / "file" / "b.docx"),
+                           open_when_done=False, on_error=lambda err: (errors.append(err), finished.set()))
+    last = submit_export([get_default_table()], filename=str(tmp_path / "c.docx"), open_when_done=False,
+                         on_done=lambda paths: order.append("c"))
+
+    assert last.result(timeout=30) == [str(tmp_path / "c.docx")]
+    assert finished.is_set() and len(errors) == 1
+    assert broken.result() is None
+    assert order == ["a", "c"]
+    assert not first.running
@@ -0,0 +1,131 @@
+import random
+
+from table.logic.history import (
+    EditHistory, delete_columns, delete_rows, edit_cell, insert_columns, insert_rows, redo, undo
+)
+from table.logic.state import TableEditorState
+from table.logic.structure import DEFAULT_CELL, toggle_bold
+from table.logic.template import toggle_border_color, toggle_border_thickness, update_cell
+
+# ----------------------------------------------------------------
+# 편집 기록 (실행 취소 / 다시 실행)
+# - 편집할 때마다 to_rows() 스냅샷을 남겨 두고, 실행 취소/다시 실행 후 같은 스냅샷인지 비교
+# ----------------------------------------------------------------
+
+
+def _rows(state):
+    return state.table_data.to_rows()
+
+
+def _random_edit(state, rng):
+    model = state.table_data
+    n_rows = len(model)
+    n_cols = len(model.values[0]) if n_rows else 0
+    kind = rng.choice(["value", "border", "thickness", "bold", "add_rows", "delete_rows", "add_cols", "delete_cols"])
+    if (kind == "delete_rows" and n_rows <= 1) or (kind == "delete_cols" and n_cols <= 1):
+        kind = "value"
+    i = rng.randrange(n_rows)
+    j = rng.randrange(n_cols)
+    if kind == "value":
+        edit_cell(state, i, j, lambda data: update_cell(data, i, j, str(rng.random())))
+    elif kind == "border":
+        direction = rng.choice(["top", "bottom"])
+        edit_cell(state, i, j, lambda data: toggle_border_color(data, i, j, direction))
+    elif kind == "thickness":
+        edit_cell(state, i, j, lambda data: toggle_border_thickness(data, i, j, "bottom"))
+    elif kind == "bold":
+        edit_cell(state, i, j, lambda data: toggle_bold(data, i, j))
+    elif kind == "add_rows":
+        insert_rows(state, i + 1, *model.repeat_row(i, rng.randint(1, 3)))
+    elif kind == "delete_rows":
+        delete_rows(state, i, rng.randint(1, n_rows - 1 - i) if i < n_rows - 1 else 1)
+    elif kind == "add_cols":
+        insert_columns(state, j + 1, *model.repeat_column(j, rng.randint(1, 3), DEFAULT_CELL))
+    else:
+        delete_columns(state, j, rng.randint(1, n_cols - 1 - j) if j < n_cols - 1 else 1)
+
+
+def test_random_edits_round_trip():
+    rng = random.Random(0)
+    state = TableEditorState()
+    snapshots = [_rows(state)]
+    for _ in range(200):
+        before = len(state.history.undo_stack)
+        _random_edit(state, rng)
+        if len(state.history.undo_stack) != before:
+            snapshots.append(_rows(state))
+
+    # 끝까지 실행 취소 → 각 단계의 스냅샷과 같아야 함
+    for expected in reversed(snapshots[:-1]):
+        assert undo(state)
+        assert _rows(state) == expected
+    assert not undo(state)
+
+    # 끝까지 다시 실행
+    for expected in snapshots[1:]:
+        assert redo(state)
+        assert _rows(state) == expected
+    assert not redo(state)
+
+
+def test_set_cell_records_only_real_changes():
+    state = TableEditorState()
+    value = state.table_data[1][1]["value"]
+    assert not edit_cell(state, 1, 1, lambda data: update_cell(data, 1, 1, value))
+    assert not state.history.can_undo()
+
+
+def test_typing_is_coalesced_into_one_step():
+    state = TableEditorState()
+    original = _rows(state)
+    for text in ("1", "12", "12.", "12.5"):
+        edit_cell(state, 2, 3, lambda data, text=text: update_cell(data, 2, 3, text), coalesce=True)
+    edit_cell(state, 2, 4, lambda data: update_cell(data, 2, 4, "x"), coalesce=True)
+    assert len(state.history.undo_stack) == 2
+
+    undo(state)
+    assert state.table_data[2][3]["value"] == "12.5"
+    undo(state)
+    assert _rows(state) == original
+
+
+def test_new_edit_clears_redo():
+    state = TableEditorState()
+    edit_cell(state, 0, 0, lambda data: update_cell(data, 0, 0, "a"))
+    undo(state)
+    assert state.history.can_redo()
+    edit_cell(state, 0, 0, lambda data: update_cell(data, 0, 0, "b"))
+    assert not state.history.can_redo()
+
+
+def test_multi_row_and_column_edits_are_one_step():
+    state = TableEditorState()
+    original = _rows(state)
+    model = state.table_data
+    insert_rows(state, 2, *model.repeat_row(1, 5))
+    insert_columns(state, 0, *model.repeat_column(0, 4, DEFAULT_CELL))
+    assert len(model) == len(original) + 5
+    assert len(model.values[0]) == len(original[0]) + 4
+
+    delete_rows(state, 0, 3)
+    delete_columns(state, 1, 2)
+    for _ in range(4):
+        undo(state)
+    assert _rows(state) == original
+
+
+def test_structure_undo_clamps_selection():
+    state = TableEditorState()
+    model = state.table_data
+    insert_rows(state, len(model), *model.repeat_row(len(model) - 1, 2))
+    state.select((len(model) - 1, 0))
+    undo(state)
+    assert state.selected_cell is None
+    assert state.structure_changed
+
+
+def test_history_limit_drops_oldest():
+    history = EditHistory(max_steps=3)
+    for step in range(5):
+        history.record(("set_cell", 0, 0, step, step + 1, False))
+    assert [command[3] for command in history.undo_stack] == [2, 3, 4]
@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from stats.tools.t_test.multitest import adjust_p_values, apply_correction, multiple_comparisons
+from stats.tools.t_test.ttest_batch import run_paired_ttest_batch
+
+# ----------------------------------------------------------------
+# 다중 비교 보정 ↔ 정의대로 계산한 참조값 (statsmodels multipletests가 있으면 그것과도 비교)
+# ----------------------------------------------------------------
+
+# 정의 그대로의 O(m^2) 계산
+def _reference(p, method):
+    m = len(p)
+    order = np.argsort(p, kind="stable")
+    ranked = p[order]
+    adjusted = np.empty(m)
+    for i in range(m):
+        if method == "bonferroni":
+            value = ranked[i] * m
+        elif method == "holm":
+            value = max((m - j) * ranked[j] for j in range(i + 1))
+        else:
+            c = np.sum(1.0 / np.arange(1, m + 1)) if method == "by" else 1.0
+            value = min(c * m / (j + 1) * ranked[j] for j in range(i, m))
+        adjusted[i] = min(value, 1.0)
+    result = np.empty(m)
+    result[order] = adjusted
+    return result
+
+
+def _p_values(seed, m=60):
+    rng = np.random.default_rng(seed)
+    p = rng.uniform(size=m) ** 3
+    p[::7] = p[1]  # 동점 포함
+    return p
+
+
+@pytest.mark.parametrize("method", ["bonferroni", "holm", "bh", "by"])
+def test_matches_reference(method):
+    p = _p_values(0)
+    np.testing.assert_allclose(adjust_p_values(p, method), _reference(p, method), rtol=1e-13)
+
+
+@pytest.mark.parametrize("method, name", [
+    ("bonferroni", "bonferroni"), ("holm", "holm"), ("bh", "fdr_bh"), ("by", "fdr_by")
+])
+def test_matches_statsmodels(method, name):
+    multipletests = pytest.importorskip("statsmodels.stats.multitest").multipletests
+    p = _p_values(1)
+    reject, expected, _, _ = multipletests(p, alpha=0.05, method=name)
+    ours_reject, ours = multiple_comparisons(p, 0.05, method)
+    np.testing.assert_allclose(ours, expected, rtol=1e-12)
+    np.testing.assert_array_equal(ours_reject, reject)
+
+
+def test_nan_p_values_are_left_out():
+    p = np.array([[0.01, np.nan], [0.04, 0.03]])
+    adjusted = adjust_p_values(p, "holm")
+    assert adjusted.shape == p.shape
+    assert np.isnan(adjusted[0, 1])
+    np.testing.assert_allclose(adjusted[~np.isnan(p)], _reference(np.array([0.01, 0.04, 0.03]), "holm"))
+    assert np.isnan(adjust_p_values([np.nan], "bh")).all()
+
+
+def test_unknown_method():
+    with pytest.raises(ValueError):
+        adjust_p_values([0.1], "sidak")
+
+
+def test_apply_correction_to_batch_result():
+    rng = np.random.default_rng(2)
+    before = rng.normal(size=(30, 40))
+    after = before + np.r_[np.full(5, 1.0), np.zeros(35)] + rng.normal(0, 1, size=(30, 40))
+    batch = run_paired_ttest_batch(before, after)
+    corrected = apply_correction(batch, "holm")
+
+    assert corrected["correction"] == "Holm"
+    assert "p_adjusted" not in batch  # 원본은 그대로
+    valid = batch["valid"]
+    expected = np.full(valid.shape, np.nan)
+    expected[valid] = _reference(batch["p"][valid], "holm")
+    np.testing.assert_allclose(corrected["p_adjusted"], expected, rtol=1e-13)
+    np.testing.assert_array_equal(corrected["sig"], valid & (np.nan_to_num(expected, nan=1.0) < 0.05))
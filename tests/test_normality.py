@@ -0,0 +1,104 @@
+import numpy as np
+import pytest
+import scipy.stats as stats
+
+from stats.tools.t_test import normality
+from stats.tools.t_test.normality import check_normality_batch, normality_statistics
+from stats.tools.t_test.ttest_logic import run_independent_ttest, run_paired_ttest
+
+# ----------------------------------------------------------------
+# 배치 정규성 엔진 ↔ SciPy 기준값 비교
+# - Shapiro-Wilk 포팅(계수, p-값), KS(정확 분포), Anderson-Darling 통계량과 5% 기준값
+# - 길이가 다른 그룹 묶음, 대용량(청크) 경로, n < 3 (SciPy처럼 Shapiro-Wilk만 NaN)
+# ----------------------------------------------------------------
+
+SIZES = (3, 4, 5, 7, 11, 12, 20, 50, 199, 1000, 4999)
+
+
+def _samples(n, rng):
+    # 정규, 치우친 분포, 동점이 많은 분포
+    return [rng.normal(10, 2, size=n), rng.exponential(size=n), np.round(rng.normal(size=n), 1)]
+
+
+def _scipy_reference(x):
+    z = (x - x.mean()) / x.std(ddof=1)
+    anderson = stats.anderson(x, "norm")
+    return stats.shapiro(x).pvalue, stats.kstest(z, "norm").pvalue, anderson.statistic, anderson.critical_values[2]
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_statistics_match_scipy(n):
+    rng = np.random.default_rng(n)
+    groups = np.array(_samples(n, rng))
+    result = normality_statistics(groups)
+    for idx, group in enumerate(groups):
+        shapiro_p, ks_p, ad_stat, ad_crit = _scipy_reference(group)
+        assert result["shapiro_p"][idx] == pytest.approx(shapiro_p, rel=1e-6, abs=1e-12)
+        assert result["ks_p"][idx] == pytest.approx(ks_p, rel=1e-9, abs=1e-15)
+        assert result["ad_stat"][idx] == pytest.approx(ad_stat, rel=1e-9)
+        assert result["ad_crit"][idx] == pytest.approx(ad_crit)
+
+
+def test_ragged_groups_match_one_at_a_time():
+    rng = np.random.default_rng(1)
+    groups = [rng.normal(size=n) for n in (8, 30, 8, 3, 30, 100)]
+    batch = normality_statistics(groups)
+    for idx, group in enumerate(groups):
+        single = normality_statistics([group])
+        for key in ("shapiro_p", "ks_p", "ad_stat", "ad_crit"):
+            assert batch[key][idx] == single[key][0]
+
+
+def test_large_group_path_matches_in_memory_path(monkeypatch):
+    rng = np.random.default_rng(2)
+    row = rng.normal(size=5000)
+    expected = normality_statistics(row[None, :])
+
+    # 청크 경로를 작은 입력으로 실행 (여러 청크 + 마지막 짧은 청크)
+    monkeypatch.setattr(normality, "LARGE_GROUP_N", 1000)
+    monkeypatch.setattr(normality, "_LARGE_CHUNK", 768)
+    chunked = normality_statistics(row[None, :])
+    for key in ("shapiro_p", "ks_p", "ad_stat", "ad_crit"):
+        assert chunked[key][0] == pytest.approx(expected[key][0], rel=1e-9)
+
+
+def test_constant_group_is_not_normal():
+    result = check_normality_batch(np.ones((1, 10)))
+    assert np.isnan(result["shapiro_p"][0]) or result["shapiro_p"][0] == 1.0
+    assert not result["ks_pass"][0]
+
+
+@pytest.mark.parametrize("group", [[1.0, 2.0], [3.0, 1.0], [4.0, 4.5]])
+def test_two_values_give_nan_shapiro_like_scipy(group):
+    # SciPy: Shapiro-Wilk는 NaN, KS / AD는 계산 → 분석은 계속 진행
+    group = np.array(group)
+    result = check_normality_batch([group])
+    z = (group - group.mean()) / group.std(ddof=1)
+    assert np.isnan(result["shapiro_p"][0]) and not result["shapiro_pass"][0]
+    assert result["ks_p"][0] == pytest.approx(stats.kstest(z, "norm").pvalue, rel=1e-9)
+    assert result["ad_stat"][0] == pytest.approx(stats.anderson(group, "norm").statistic, rel=1e-9)
+    assert result["ad_crit"][0] == pytest.approx(stats.anderson(group, "norm").critical_values[2])
+
+
+def test_two_pairs_still_run_paired_and_independent_tests():
+    paired = run_paired_ttest([1, 2], [3, 5], return_dict=True, cache=False)
+    assert paired["error"] is None
+    assert paired["df"] == 1
+    assert paired["t_stat"] == pytest.approx(stats.ttest_rel([3, 5], [1, 2]).statistic)
+
+    independent = run_independent_ttest([1, 2], [3, 5], cache=False)
+    assert independent.error is None
+    assert independent.t_stat == pytest.approx(stats.ttest_ind([1, 2], [3, 5], equal_var=False).statistic)
+
+
+def test_single_value_and_empty_group():
+    result = normality_statistics([[1.0]])
+    assert np.isnan(result["shapiro_p"][0]) and np.isnan(result["ks_p"][0])
+    with pytest.raises(ValueError):
+        normality_statistics(np.empty((1, 0)))
+
+
+def test_cancel_is_called_per_bucket():
+    calls = []
+    normality_statistics([np.arange(5.0), np.arange(7.0)], cancel=lambda: calls.append(1))
+    assert len(calls) == 2
@@ -0,0 +1,55 @@
+from stats.search_index import SearchIndex, tokenize, trigrams
+from stats.stat_tests import stat_tests
+
+# ----------------------------------------------------------------
+# 통계 도구 검색 인덱스
+# - 접두어 / 오타(3-gram) / 별칭 / 설명 일치, 필드 가중치와 점수 순서
+# ----------------------------------------------------------------
+
+ENTRIES = [
+    {"label": "Paired t-test", "route": "/paired", "aliases": ["Dependent t-test"], "description": "Before / after"},
+    {"label": "Independent t-test", "route": "/independent", "description": "Compare two unrelated groups"},
+    {"label": "One-way ANOVA", "route": "/anova", "aliases": ["Analysis of variance"],
+     "description": "Compare three or more independent groups"},
+]
+
+
+def _routes(index, query, limit=5):
+    return [entry["route"] for entry in index.search(query, limit)]
+
+
+def test_tokenize_and_trigrams():
+    assert tokenize("Paired t-test (Two_tailed)") == ["paired", "t", "test", "two", "tailed"]
+    assert trigrams("ab") == {"  a", " ab", "ab "}
+
+
+def test_prefix_typo_and_alias_matches():
+    index = SearchIndex(ENTRIES)
+    assert _routes(index, "pai")[0] == "/paired"
+    assert _routes(index, "pairde")[0] == "/paired"     # 글자 순서 바뀜
+    assert _routes(index, "dependent")[0] == "/paired"  # 별칭
+    assert _routes(index, "variance") == ["/anova"]
+
+
+def test_label_outranks_description():
+    # "independent"는 Independent t-test의 label, ANOVA에서는 description
+    assert _routes(SearchIndex(ENTRIES), "independent")[:2] == ["/independent", "/anova"]
+
+
+def test_all_query_words_matching_ranks_first():
+    assert _routes(SearchIndex(ENTRIES), "independent groups")[0] == "/independent"
+    assert _routes(SearchIndex(ENTRIES), "one way anova")[0] == "/anova"
+
+
+def test_empty_query_unknown_word_and_limit():
+    index = SearchIndex(ENTRIES)
+    assert index.search("") == []
+    assert index.search("  --  ") == []
+    assert index.search("zzqx") == []
+    assert len(index.search("test", limit=1)) == 1
+
+
+def test_real_tool_list_is_searchable():
+    index = SearchIndex(stat_tests)
+    for query in ("paired", "repeated measures", "pre post", "ttest"):
+        assert _routes(index, query)[0] == "/paired_two"
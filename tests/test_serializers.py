@@ -0,0 +1,163 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from table.core.serializers import (
+    PLACEHOLDER, ResolvedCell, column_aligns, export_table_to_text, horizontal_rules, register_format,
+    serialize_table, walk_table, FORMATS
+)
+from table.logic.model import TableModel
+from table.logic.template import cell
+
+# ----------------------------------------------------------------
+# 텍스트 형식 직렬화 (LaTeX / HTML / Markdown / CSV)
+# - APA 표 한 개(머리글 2줄, 병합 셀, 굵은 부분 선)의 형식별 전체 출력 비교
+# - 순회/가로선/열 정렬 단위 동작
+# ----------------------------------------------------------------
+
+
+def _apa_table():
+    rows = [
+        [cell("", top=True), cell("Score", top=True, bottom=True), cell("", top=True, visible=False)],
+        [cell("Group", bottom=True), cell("Mean", bottom=True), cell("SD", bottom=True)],
+        [cell("A"), cell("1.5"), cell("0.2")],
+        [cell("B & C_1", bottom=True), cell("2", bottom=True), cell("10", bottom=True)]
+    ]
+    rows[0][1]["border_bottom"]["thickness"] = 2
+    return rows
+
+
+EXPECTED = {
+    "latex": (
+        "\\begin{tabular}{lcc}\n"
+        "\\toprule\n"
+        " & \\multicolumn{2}{l}{Score} \\\\\n"
+        "\\cmidrule[\\heavyrulewidth](lr){2-3}\n"
+        "Group & \\multicolumn{1}{l}{Mean} & \\multicolumn{1}{l}{SD} \\\\\n"
+        "\\midrule\n"
+        "A & 1.5 & 0.2 \\\\\n"
+        "B \\& C\\_1 & 2 & 10 \\\\\n"
+        "\\bottomrule\n"
+        "\\end{tabular}\n"
+    ),
+    "html": (
+        '<table style="border-collapse: collapse;">\n'
+        "<thead>\n"
+        '<tr><th style="text-align: left; border-top: 1px solid #000"></th>'
+        '<th colspan="2" style="text-align: left; border-top: 1px solid #000; border-bottom: 2px solid #000">'
+        "Score</th></tr>\n"
+        "</thead>\n"
+        "<tbody>\n"
+        '<tr><td style="text-align: left; border-bottom: 1px solid #000">Group</td>'
+        '<td style="text-align: left; border-bottom: 1px solid #000">Mean</td>'
+        '<td style="text-align: left; border-bottom: 1px solid #000">SD</td></tr>\n'
+        '<tr><td style="text-align: left">A</td><td style="text-align: center">1.5</td>'
+        '<td style="text-align: center">0.2</td></tr>\n'
+        '<tr><td style="text-align: left; border-bottom: 1px solid #000">B &amp; C_1</td>'
+        '<td style="text-align: center; border-bottom: 1px solid #000">2</td>'
+        '<td style="text-align: center; border-bottom: 1px solid #000">10</td></tr>\n'
+        "</tbody>\n"
+        "</table>\n"
+    ),
+    "markdown": (
+        "|  | Score |  |\n"
+        "| --- | :---: | :---: |\n"
+        "| Group | Mean | SD |\n"
+        "| A | 1.5 | 0.2 |\n"
+        "| B & C_1 | 2 | 10 |\n"
+    ),
+    "csv": ",Score,\nGroup,Mean,SD\nA,1.5,0.2\nB & C_1,2,10\n"
+}
+
+
+@pytest.mark.parametrize("fmt", sorted(EXPECTED))
+def test_apa_table_output(fmt):
+    assert serialize_table(_apa_table(), fmt) == EXPECTED[fmt]
+
+
+@pytest.mark.parametrize("fmt", sorted(EXPECTED))
+def test_table_model_gives_same_output(fmt):
+    assert serialize_table(TableModel.from_rows(_apa_table()), fmt) == EXPECTED[fmt]
+
+
+def test_special_characters_are_escaped():
+    rows = [[cell("a|b\nc"), cell('x,"y"'), cell("<50%>")]]
+    assert serialize_table(rows, "markdown").splitlines()[0] == "| a\\|b<br>c | x,\"y\" | <50%> |"
+    assert serialize_table(rows, "csv") == '"a|b\nc","x,""y""",<50%>\n'
+    assert "&lt;50%&gt;" in serialize_table(rows, "html")
+    assert "\\textless{}50\\%\\textgreater{}" in serialize_table(rows, "latex")
+
+# ----------------------------
+# 1. 순회 / 가로선 / 열 정렬
+# ----------------------------
+
+def test_walk_table_merges_and_pads():
+    rows = [
+        [cell("a"), cell("b"), cell("c"), cell("d")],
+        [cell("", visible=False), cell("x"), cell("", visible=False), cell("", visible=False)],
+        [cell("1")]
+    ]
+    walked = list(walk_table(rows))
+    assert [c.span for c in walked[1]] == [1, 3]
+    assert walked[1][0] == PLACEHOLDER
+    assert walked[2][0].align == "center"
+    assert walked[2][1:] == [PLACEHOLDER] * 3
+
+
+def test_horizontal_rules_groups_columns_and_takes_thicker_border():
+    above = [ResolvedCell("a", border_bottom=("black", 1)), ResolvedCell("b", span=2, border_bottom=("black", 1))]
+    below = [ResolvedCell("c"), ResolvedCell("d", border_top=("black", 2)), ResolvedCell("e", border_top=("white", 3))]
+    assert horizontal_rules(above, below, 3) == [(0, 1, 1), (1, 2, 2), (2, 3, 1)]
+    assert horizontal_rules(None, below, 3) == [(1, 2, 2)]
+    assert horizontal_rules(None, None, 3) == []
+
+
+def test_column_aligns_use_majority_and_skip_merged_cells():
+    rows = [
+        [ResolvedCell("Name"), ResolvedCell("N", span=2)],
+        [ResolvedCell("a"), ResolvedCell("1", align="center"), ResolvedCell("x")],
+        [ResolvedCell("b"), ResolvedCell("2", align="center"), ResolvedCell("3", align="center")]
+    ]
+    assert column_aligns(rows, 3) == ["left", "center", "left"]
+
+# ----------------------------
+# 2. 형식 등록 / 파일 저장
+# ----------------------------
+
+def test_unknown_format_raises():
+    with pytest.raises(ValueError, match="Unknown table format"):
+        serialize_table(_apa_table(), "rtf")
+
+
+def test_register_format(monkeypatch):
+    class CountingWriter:
+        def __init__(self, out):
+            self.out = out
+
+        def begin(self, n_cols, aligns):
+            self.out.write(f"{n_cols} cols\n")
+
+        def row(self, cells, rules):
+            self.out.write(f"{len(rules)}\n")
+
+        def end(self, rules):
+            self.out.write(f"end {len(rules)}\n")
+
+    monkeypatch.setitem(FORMATS, "count", None)
+    register_format("count", CountingWriter, ".txt")
+    assert serialize_table(_apa_table(), "count") == "3 cols\n1\n1\n1\n0\nend 1\n"
+
+
+def test_export_table_to_text(tmp_path):
+    path = export_table_to_text(_apa_table(), "csv", str(tmp_path / "out" / "table.csv"))
+    with open(path, encoding="utf-8", newline="") as f:
+        assert f.read() == EXPECTED["csv"]
+
+
+def test_serializers_do_not_import_docx():
+    code = "import sys, table.core.serializers; print('docx' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    assert result.stdout.strip() == "False"
@@ -0,0 +1,104 @@
+from table.logic.history import redo, undo
+from table.logic.state import TableEditorState
+from table.logic.structure import (
+    DEFAULT_CELL, handle_add_column, handle_add_row, handle_delete_column, handle_toggle_bold
+)
+from table.logic.template import update_cell
+
+# ----------------------------------------------------------------
+# 행/열 추가 (copy-on-write, 여러 개 한 번에)
+# - 복제한 행/열은 스타일 번호를 공유하다가 고친 셀만 새 스타일로 바뀜
+# - 여러 개를 넣어도 편집 기록 하나, 화면 반영도 flush() 한 번
+# ----------------------------------------------------------------
+
+class Renderer:
+    def __init__(self):
+        self.flushes = 0
+
+    def flush(self, *extra, update=True):
+        self.flushes += 1
+
+
+def _state(selected=(1, 1)):
+    state = TableEditorState()
+    state.selected_cell = selected
+    return state
+
+
+def test_repeated_rows_share_styles_but_not_value_lists():
+    state = _state()
+    model = state.table_data
+    rows, style_rows = model.repeat_row(1, 3)
+    assert rows[0] == model.values[1] and rows[0] is not rows[1]
+    assert style_rows[0] == model.style_ids[1] and style_rows[0] is not model.style_ids[1]
+
+
+def test_add_rows_in_one_step():
+    state, renderer = _state(), Renderer()
+    model = state.table_data
+    n_rows, n_styles = len(model), len(model.styles)
+    template = model[1].to_list()
+
+    handle_add_row(state, renderer, count=3)
+    assert len(model) == n_rows + 3
+    assert [model[i].to_list() for i in (2, 3, 4)] == [template] * 3
+    assert len(model.styles) == n_styles  # 스타일을 새로 만들지 않음
+    assert renderer.flushes == 1
+    assert len(state.history.undo_stack) == 1
+
+    undo(state)
+    assert len(model) == n_rows
+    redo(state)
+    assert len(model) == n_rows + 3
+
+
+def test_editing_a_copy_leaves_template_and_siblings_alone():
+    state, renderer = _state(), Renderer()
+    model = state.table_data
+    template = model[1].to_list()
+    handle_add_row(state, renderer, count=2)
+
+    update_cell(model, 2, 1, "edited")
+    state.selected_cell = (3, 1)
+    handle_toggle_bold(state, renderer)
+    assert model[1].to_list() == template
+    assert model.value(2, 1) == "edited" and model.value(3, 1) == template[1]["value"]
+    assert model.style(3, 1) != model.style(2, 1) == model.style(1, 1)
+
+
+def test_add_columns_in_one_step():
+    state, renderer = _state(), Renderer()
+    model = state.table_data
+    widths = [len(row) for row in model.values]
+    column = [model.value(i, 1) for i in range(len(model))]
+
+    handle_add_column(state, renderer, count=2)
+    assert [len(row) for row in model.values] == [width + 2 for width in widths]
+    assert [model.value(i, 2) for i in range(len(model))] == column
+    assert [model.value(i, 3) for i in range(len(model))] == column
+    assert renderer.flushes == 1
+
+    undo(state)
+    assert [len(row) for row in model.values] == widths
+
+
+def test_short_rows_get_the_default_cell():
+    state = _state()
+    model = state.table_data
+    del model.values[0][1:]
+    del model.style_ids[0][1:]
+    values_rows, style_rows = model.repeat_column(1, 2, DEFAULT_CELL)
+    assert values_rows[0] == ["", ""]
+    assert model.styles[style_rows[0][0]].width == DEFAULT_CELL["width"]
+
+
+def test_nothing_selected_or_bad_count_does_nothing():
+    state, renderer = _state(selected=None), Renderer()
+    n_rows = len(state.table_data)
+    handle_add_row(state, renderer)
+    handle_add_column(state, renderer)
+    handle_delete_column(state, renderer)
+    state.selected_cell = (0, 0)
+    handle_add_row(state, renderer, count=0)
+    assert len(state.table_data) == n_rows
+    assert renderer.flushes == 0
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+import scipy.stats as stats
+
+from stats.tools.t_test.t_dist import (
+    clear_critical_cache, critical_cache_info, critical_value, critical_values, p_values
+)
+
+# ----------------------------------------------------------------
+# t-분포 공용 커널 ↔ scipy.stats.t.sf / ppf, 임계값 LRU 캐시
+# ----------------------------------------------------------------
+
+@pytest.mark.parametrize("df", [1, 4.5, 30, 1e6])
+def test_p_values_match_scipy_sf(df):
+    t = np.array([-40.0, -2.1, 0.0, 0.7, 3.3, 60.0])
+    np.testing.assert_allclose(p_values(t, df), 2 * stats.t.sf(np.abs(t), df), rtol=1e-14)
+    np.testing.assert_allclose(p_values(t, df, "one"), stats.t.sf(np.abs(t), df), rtol=1e-14)
+
+
+def test_extreme_tail_keeps_precision():
+    # 1 - cdf는 0이 되지만 sf는 아주 작은 양수
+    p = p_values(40.0, 200)
+    assert 0 < p < 1e-90
+    assert p == pytest.approx(2 * stats.t.sf(40.0, 200), rel=1e-12)
+
+
+@pytest.mark.parametrize("alpha", [0.01, 0.05])
+def test_critical_value_matches_scipy_ppf(alpha):
+    assert critical_value(alpha, 12) == pytest.approx(stats.t.ppf(1 - alpha / 2, 12), rel=1e-14)
+    assert critical_value(alpha, 12, "one") == pytest.approx(stats.t.ppf(1 - alpha, 12), rel=1e-14)
+
+
+def test_critical_values_for_df_array():
+    df = np.array([[3, 10], [3, 27.5]])
+    np.testing.assert_allclose(critical_values(0.05, df), stats.t.ppf(0.975, df), rtol=1e-14)
+
+
+def test_critical_value_cache():
+    clear_critical_cache()
+    critical_value(0.05, 19)
+    critical_value(0.05, 19.0)  # int/float 자유도는 같은 항목
+    critical_values(0.05, [19, 19, 19])  # 고유한 df마다 한 번만 조회
+    info = critical_cache_info()
+    assert (info.misses, info.hits, info.currsize) == (1, 2, 1)
+    clear_critical_cache()
+    assert critical_cache_info().currsize == 0
@@ -0,0 +1,88 @@
+import copy
+
+import pytest
+
+from table.logic.model import CellStyle, TableModel
+from table.logic.template import get_default_table
+
+# ----------------------------------------------------------------
+# 압축 테이블 모델
+# - 셀 딕셔너리 행 리스트 ↔ 모델 왕복, 스타일 공유(intern)
+# - 기존 딕셔너리/리스트 방식 접근 (RowView / CellView)
+# ----------------------------------------------------------------
+
+ROWS = [
+    [
+        {"value": "Variable", "align": "left", "editable": True, "width": 120,
+         "border_top": {"color": "black", "thickness": 2}},
+        {"value": "M", "align": "center", "editable": True, "width": 85},
+    ],
+    [
+        {"value": "Age", "align": "left", "editable": True, "width": 120,
+         "border_top": {"color": "black", "thickness": 2}},
+        {"value": "31.2", "align": "center", "editable": True, "width": 85,
+         "border_bottom": {"color": "white", "thickness": 1}},
+    ],
+]
+
+
+def test_round_trip_and_default_table():
+    assert TableModel.from_rows(ROWS).to_rows() == ROWS
+    default = get_default_table()
+    assert TableModel.from_rows(default).to_rows() == default
+
+
+def test_same_styles_are_interned_once():
+    model = TableModel.from_rows(ROWS)
+    assert model.style_ids[0][0] == model.style_ids[1][0]
+    assert model.stats() == {"cells": 4, "styles": 3}
+    assert model.intern(CellStyle("left", True, None, 120, ("black", 2))) == model.style_ids[0][0]
+
+
+def test_dict_style_access():
+    model = TableModel.from_rows(ROWS)
+    cell = model[1][1]
+    assert cell["value"] == "31.2"
+    assert cell.get("visible", "missing") == "missing"
+    assert "visible" not in cell and "border_bottom" in cell
+    with pytest.raises(KeyError):
+        cell["visible"]
+    assert model[-1][-1].to_dict() == ROWS[1][1]
+    assert len(model) == 2 and len(model[0]) == 2
+
+
+def test_setting_a_style_does_not_touch_cells_sharing_it():
+    model = TableModel.from_rows(ROWS)
+    model[0][0]["align"] = "right"
+    assert model[0][0]["align"] == "right"
+    assert model[1][0]["align"] == "left"
+
+    # 테두리 딕셔너리는 복사본 → 다시 대입해야 바뀜
+    border = model[1][0]["border_top"]
+    border["thickness"] = 5
+    assert model[1][0]["border_top"]["thickness"] == 2
+    model[1][0]["border_top"] = border
+    assert model.style(1, 0).border_top == ("black", 5)
+
+
+def test_list_api_insert_pop_and_copies():
+    model = TableModel.from_rows(ROWS)
+    model.insert(1, model[0])  # RowView 그대로 넣기
+    assert model.to_rows()[1] == ROWS[0]
+    assert model.pop(1) == ROWS[0]
+
+    cell = copy.deepcopy(model[0][1])
+    assert cell == ROWS[0][1]
+    model[1].append(cell)
+    assert model[1][2].to_dict() == ROWS[0][1]
+    assert model[1].pop() == ROWS[0][1]
+    assert model.to_rows() == ROWS
+
+
+def test_snapshot_is_independent():
+    model = TableModel.from_rows(ROWS)
+    snapshot = model.snapshot()
+    model.set_value(0, 0, "changed")
+    model.replace_style(0, 1, align="right")
+    model.append(ROWS[0])
+    assert snapshot.to_rows() == ROWS
@@ -0,0 +1,157 @@
+import flet as ft
+import pytest
+
+from table.logic.history import insert_rows
+from table.logic.state import TEXT_MODE, TableEditorState
+from table.logic.table_renderer import CELL_HEIGHT, TableRenderer
+
+# ----------------------------------------------------------------
+# 증분 렌더러
+# - flush()는 표시된 변경(dirty)만 반영하고 바뀐 컨트롤만 page.update()로 보냄
+# ----------------------------------------------------------------
+
+# ft.colors 사용에 대한 Flet 경고 (앱 전체가 ft.colors를 씀)
+pytestmark = pytest.mark.filterwarnings("ignore::DeprecationWarning")
+
+
+class Page:
+    def __init__(self):
+        self.updates = []
+
+    def update(self, *controls):
+        self.updates.append(controls)
+
+
+def _renderer(state=None):
+    state = state or TableEditorState()
+    page = Page()
+    renderer = TableRenderer(state, page, ft.Column(), on_tap=None, on_change=None)
+    renderer.render_all()
+    return state, page, renderer
+
+
+def test_render_all_builds_every_cell_of_a_small_table():
+    state, page, renderer = _renderer()
+    model = state.table_data
+    assert len(renderer.rows) == len(model)
+    assert [len(row) for row in renderer.slots] == [len(values) for values in model.values]
+    assert renderer.slots[0][0].label.value == (model.value(0, 0) or "")
+    assert page.updates == []
+
+
+def test_cell_change_updates_only_that_cell():
+    state, page, renderer = _renderer()
+    state.table_data.set_value(1, 1, "12.5")
+    state.mark_cell(1, 1)
+    cell = renderer.slots[1][1]
+
+    assert renderer.flush() == [cell.detector]
+    assert page.updates == [(cell.detector,)]
+    assert cell.label.value == "12.5"
+    assert not state.has_changes()
+
+
+def test_selection_updates_old_and_new_cell():
+    state, page, renderer = _renderer()
+    state.select((0, 0))
+    renderer.flush()
+    state.select((1, 0))
+    targets = renderer.flush()
+    assert targets == [renderer.slots[0][0].detector, renderer.slots[1][0].detector]
+    assert renderer.slots[1][0].box.bgcolor == ft.colors.BLUE_100
+    assert renderer.slots[0][0].box.bgcolor == ft.colors.WHITE
+
+
+def test_row_change_and_extra_controls():
+    state, page, renderer = _renderer()
+    button = ft.Text("mode")
+    state.mark_row(0)
+    state.mark_cell(0, 1)  # 같은 행의 셀은 행 갱신에 포함
+    assert renderer.flush(button) == [renderer.rows[0], button]
+    assert renderer.flush(update=False) == []
+    assert len(page.updates) == 1
+
+
+def test_structure_change_and_mode_switch_refresh_the_column():
+    state, page, renderer = _renderer()
+    n_rows = len(state.table_data)
+    insert_rows(state, 1, *state.table_data.repeat_row(0, 2))
+    assert renderer.flush() == [renderer.table_column]
+    assert len(renderer.rows) == n_rows + 2
+
+    state.editing_mode = TEXT_MODE
+    state.mark_all()
+    renderer.flush()
+    fields = [cell.field for row in renderer.slots for cell in row if cell.field is not None]
+    assert fields and all(cell.box.content is cell.field for row in renderer.slots for cell in row if cell.field)
+
+# ----------------------------------------------------------------
+# 가상화(virtualized) 창
+# - 창(보이는 행 + 위아래 여유 행)만 컨트롤로 만들고 나머지는 spacer 높이로 대신함
+# - 스크롤하면 행 컨트롤을 재활용해서 새 행 데이터로 다시 채움
+# ----------------------------------------------------------------
+
+def _large_state(n_rows=1000):
+    state = TableEditorState()
+    model = state.table_data
+    model.insert_rows_arrays(len(model), *model.repeat_row(len(model) - 1, n_rows - len(model)))
+    for i in range(n_rows):
+        model.set_value(i, 0, f"row {i}")
+    return state
+
+
+def _shown_rows(renderer):
+    return [row[0].label.value for row in renderer.slots]
+
+
+def test_only_the_window_is_built():
+    state, page, renderer = _renderer(_large_state())
+    assert len(renderer.rows) == renderer.window_rows
+    assert renderer.top_spacer.height == 0
+    assert renderer.bottom_spacer.height == (1000 - renderer.window_rows) * CELL_HEIGHT
+    assert renderer.table_column.height == renderer.visible_rows * CELL_HEIGHT
+    assert _shown_rows(renderer)[0] == "row 0"
+
+
+def test_scrolling_recycles_row_controls():
+    state, page, renderer = _renderer(_large_state())
+    rows = set(map(id, renderer.rows))
+
+    # 조금 내림: 위쪽 행 컨트롤을 아래로 옮김
+    assert renderer.scroll_to_row(renderer.buffer_rows + 3)
+    assert renderer.window_start == 3
+    assert _shown_rows(renderer) == [f"row {i}" for i in range(3, 3 + renderer.window_rows)]
+    assert set(map(id, renderer.rows)) == rows
+
+    # 멀리 이동: 창 전체를 다시 채움, 끝에서는 마지막 창에 고정
+    renderer.scroll_to_row(10_000)
+    assert renderer.window_start == 1000 - renderer.window_rows
+    assert _shown_rows(renderer)[-1] == "row 999"
+    assert renderer.bottom_spacer.height == 0
+    assert set(map(id, renderer.rows)) == rows
+
+    # 위로
+    renderer.scroll_to_row(500)
+    assert _shown_rows(renderer)[0] == f"row {500 - renderer.buffer_rows}"
+    assert not renderer.scroll_to_row(500)
+
+
+def test_changes_outside_the_window_are_skipped():
+    state, page, renderer = _renderer(_large_state())
+    state.table_data.set_value(900, 0, "far away")
+    state.mark_cell(900, 0)
+    assert renderer.flush() == []
+    renderer.scroll_to_row(900)
+    assert "far away" in _shown_rows(renderer)
+
+
+def test_on_scroll_sends_the_column_only_when_the_window_moves():
+    class Scroll:
+        pixels = 0.0
+
+    state, page, renderer = _renderer(_large_state())
+    renderer.on_scroll(Scroll())
+    assert page.updates == []
+    Scroll.pixels = 300.0 * CELL_HEIGHT
+    renderer.on_scroll(Scroll())
+    assert page.updates == [(renderer.table_column,)]
@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+import scipy.stats as stats
+
+from stats.tools.t_test.ttest_batch import run_paired_ttest_batch
+from stats.tools.t_test.ttest_logic import run_paired_ttest
+
+# ----------------------------------------------------------------
+# 일괄 대응표본 t-검정 ↔ scipy.stats.ttest_rel / 단일 호출 경로 비교
+# ----------------------------------------------------------------
+
+def _data(n, width, seed=0):
+    rng = np.random.default_rng(seed)
+    before = rng.normal(size=(n, width))
+    after = before + rng.normal(0.3, 1, size=(n, width))
+    return before, after
+
+
+@pytest.mark.parametrize("tail", ["two", "one"])
+@pytest.mark.parametrize("n", [3, 10, 200])
+def test_matches_scipy_ttest_rel(n, tail):
+    before, after = _data(n, 25, seed=n)
+    result = run_paired_ttest_batch(before, after, tail=tail)
+    reference = stats.ttest_rel(after, before, axis=0)
+    np.testing.assert_allclose(result["t_stat"], reference.statistic, rtol=1e-12)
+    if tail == "two":
+        expected_p = reference.pvalue
+    else:
+        # 단측: 관측된 t의 부호 방향
+        greater = stats.ttest_rel(after, before, axis=0, alternative="greater").pvalue
+        less = stats.ttest_rel(after, before, axis=0, alternative="less").pvalue
+        expected_p = np.where(reference.statistic > 0, greater, less)
+    np.testing.assert_allclose(result["p"], expected_p, rtol=1e-9)
+    assert (result["df"] == n - 1).all()
+
+    diff = after - before
+    np.testing.assert_array_equal(result["cohen_d"], np.round(diff.mean(axis=0) / diff.std(ddof=1, axis=0), 3))
+
+
+def test_matches_single_call_path():
+    before, after = _data(30, 6, seed=3)
+    batch = run_paired_ttest_batch(before, after)
+    for j in range(before.shape[1]):
+        single = run_paired_ttest(before[:, j], after[:, j], return_dict=True, cache=False)
+        assert batch["t_stat"][j] == pytest.approx(single["t_stat"], rel=1e-12)
+        assert batch["p"][j] == pytest.approx(single["p"], rel=1e-9)
+
+
+def test_dedupe_gives_same_result():
+    before, after = _data(20, 4, seed=4)
+    before = np.hstack([before, before[:, :2]])
+    after = np.hstack([after, after[:, :2]])
+    deduped = run_paired_ttest_batch(before, after, dedupe=True)
+    plain = run_paired_ttest_batch(before, after, dedupe=False)
+    for key in ("t_stat", "p", "cohen_d", "sig"):
+        np.testing.assert_array_equal(deduped[key], plain[key])
+    np.testing.assert_array_equal(deduped["t_stat"][4:], deduped["t_stat"][:2])
+
+
+def test_shape_mismatch_raises():
+    with pytest.raises(ValueError):
+        run_paired_ttest_batch(np.zeros((5, 2)), np.zeros((5, 3)))
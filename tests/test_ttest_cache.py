@@ -0,0 +1,110 @@
+import numpy as np
+import pytest
+
+from stats.tools.t_test import ttest_cache
+from stats.tools.t_test.ttest_cache import ResultCache, array_key, clear_cache, result_cache
+from stats.tools.t_test.ttest_logic import run_independent_ttest, run_paired_ttest
+
+# ----------------------------------------------------------------
+# 내용 기반 결과 캐시
+# - 키: 같은 값이면 같은 키, 큰 입력은 None (캐시 건너뜀)
+# - 적중/미스/LRU 제거 (항목 수, 바이트 상한)
+# - 꺼낸 결과를 고쳐도 캐시와 다음 조회는 그대로
+# ----------------------------------------------------------------
+
+def test_array_key_depends_on_values_not_objects():
+    assert array_key([1, 2, 3]) == array_key(np.array([1.0, 2.0, 3.0]))
+    assert array_key([1, 2, 3]) != array_key([1, 2, 4])
+    assert array_key([1, 2], [3]) != array_key([1], [2, 3])
+    matrix = np.arange(6.0).reshape(2, 3)
+    assert array_key(matrix[:, 1]) == array_key([1.0, 4.0])  # 열 슬라이스(비연속)
+
+
+def test_array_key_skips_large_input(monkeypatch):
+    monkeypatch.setattr(ttest_cache, "CACHE_MAX_N", 100)
+    monkeypatch.setattr(ttest_cache, "COPY_MAX_N", 10)
+    assert array_key(np.zeros(100)) is not None
+    assert array_key(np.zeros(101)) is None
+    assert array_key(np.zeros(11, dtype=np.int64)) is None  # 복사가 필요한 큰 입력
+    assert array_key(np.zeros(10, dtype=np.int64)) is not None
+
+# ----------------------------
+# 1. 적중 / 미스 / 제거
+# ----------------------------
+
+def test_hits_misses_and_lru_eviction_by_entries():
+    cache = ResultCache(max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # a가 최근 사용 → b가 먼저 제거됨
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    info = cache.info()
+    assert (info["hits"], info["misses"], info["evictions"], info["entries"]) == (2, 1, 1, 2)
+
+
+def test_eviction_by_bytes_and_oversized_values():
+    cache = ResultCache(max_bytes=3000)
+    cache.put("x", np.zeros(200))
+    cache.put("y", np.zeros(200))
+    assert cache.get("x") is None and cache.get("y") is not None
+    assert cache.nbytes <= 3000
+
+    cache.put("big", np.zeros(1000))  # 상한보다 큰 값은 저장하지 않음
+    assert "big" not in cache._entries
+    assert cache.get("y") is not None
+
+
+def test_get_or_compute_calls_compute_once():
+    cache = ResultCache()
+    calls = []
+    compute = lambda: calls.append(1) or {"value": 1}
+    assert cache.get_or_compute("k", compute) == {"value": 1}
+    assert cache.get_or_compute("k", compute) == {"value": 1}
+    assert len(calls) == 1
+
+# ----------------------------
+# 2. 복사본 반환
+# ----------------------------
+
+def test_cached_values_are_not_shared():
+    cache = ResultCache()
+    value = {"p": np.array([0.1, 0.2])}
+    cache.put("k", value)
+    value["p"][0] = 9.0
+    hit = cache.get("k")
+    hit["p"][1] = 9.0
+    np.testing.assert_array_equal(cache.get("k")["p"], [0.1, 0.2])
+
+
+@pytest.fixture
+def fresh_cache():
+    clear_cache()
+    yield
+    clear_cache()
+
+
+def test_runner_results_from_cache_are_copies(fresh_cache):
+    before = [1.0, 2.0, 4.0, 3.0, 6.0, 5.5]
+    after = [2.0, 3.0, 5.0, 5.0, 8.0, 6.0]
+    first = run_paired_ttest(before, after)
+    expected_p = first.p
+    first.p = 99.0
+    first.normality["shapiro_p"] = -1.0
+
+    second = run_paired_ttest(list(before), list(after))
+    assert second is not first
+    assert second.p == expected_p
+    assert second.normality["shapiro_p"] != -1.0
+    assert result_cache.info()["hits"] >= 1
+
+
+def test_alpha_change_reuses_intermediate_values(fresh_cache):
+    group1, group2 = [1.0, 2.0, 3.0, 4.0, 5.0], [2.5, 3.5, 4.5, 6.0, 7.5]
+    strict = run_independent_ttest(group1, group2, alpha=0.01)
+    misses = result_cache.info()["misses"]
+    loose = run_independent_ttest(group1, group2, alpha=0.10)
+    assert loose.p == strict.p and loose.alpha == 0.10
+    # 최종 결과 키만 새로 만들어지고 중간 값은 적중
+    assert result_cache.info()["misses"] == misses + 1
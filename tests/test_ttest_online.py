@@ -0,0 +1,99 @@
+import numpy as np
+import pytest
+import scipy.stats as stats
+
+from stats.tools.t_test.ttest_online import (
+    OnlineIndependentTTest, OnlineMoments, OnlineOneSampleTTest, OnlinePairedTTest
+)
+
+# ----------------------------------------------------------------
+# 온라인(스트리밍) 누산기
+# - 묶음 단위 update / 누산기 merge ↔ 전체 자료의 np.mean / np.var
+# - 스트리밍 t-검정 ↔ scipy.stats.ttest_1samp / ttest_rel / ttest_ind
+# ----------------------------------------------------------------
+
+def _batches(data, sizes):
+    edges = np.cumsum(sizes)[:-1]
+    return np.split(data, edges)
+
+
+def test_update_in_batches_matches_numpy():
+    rng = np.random.default_rng(0)
+    data = rng.normal(1e6, 3, size=1000)  # 큰 평균 → 단순 합계식이면 자릿수 손실
+    moments = OnlineMoments()
+    for batch in _batches(data, [1, 7, 250, 0, 742]):
+        moments.update(batch)
+    assert moments.count == 1000
+    assert moments.mean == pytest.approx(np.mean(data), rel=1e-15)
+    assert moments.variance == pytest.approx(np.var(data, ddof=1), rel=1e-10)
+
+
+def test_merge_matches_numpy():
+    rng = np.random.default_rng(1)
+    parts = [rng.normal(i, 1 + i, size=n) for i, n in enumerate([5, 300, 1, 64])]
+    merged = OnlineMoments()
+    for part in parts:
+        merged.merge(OnlineMoments().update(part))
+    merged.merge(OnlineMoments())  # 빈 누산기 병합은 변화 없음
+    data = np.concatenate(parts)
+    assert merged.count == data.size
+    assert merged.mean == pytest.approx(np.mean(data), rel=1e-14)
+    assert merged.variance == pytest.approx(np.var(data, ddof=1), rel=1e-12)
+
+
+def test_variance_needs_two_values():
+    moments = OnlineMoments().update([3.0])
+    assert np.isnan(moments.variance)
+    assert moments.mean == 3.0
+
+# ----------------------------
+# 1. 스트리밍 t-검정 ↔ SciPy
+# ----------------------------
+
+def test_one_sample_matches_scipy():
+    rng = np.random.default_rng(2)
+    data = rng.normal(0.4, 1, size=120)
+    online = OnlineOneSampleTTest(mu=0.0)
+    for batch in _batches(data, [40, 40, 40]):
+        online.update(batch)
+    result = online.result()
+    reference = stats.ttest_1samp(data, 0.0)
+    assert result.t_stat == pytest.approx(reference.statistic, rel=1e-10)
+    assert result.p == pytest.approx(reference.pvalue, rel=1e-9)
+    assert result.df == 119
+
+
+@pytest.mark.parametrize("tail", ["two", "one"])
+def test_paired_matches_scipy(tail):
+    rng = np.random.default_rng(3)
+    before = rng.normal(size=90)
+    after = before + rng.normal(0.2, 1, size=90)
+    first, second = OnlinePairedTTest(), OnlinePairedTTest()
+    first.update(before[:30], after[:30])
+    second.update(before[30:], after[30:])
+    result = first.merge(second).result(tail=tail)
+
+    reference = stats.ttest_rel(after, before)
+    expected_p = reference.pvalue if tail == "two" else reference.pvalue / 2
+    assert result.t_stat == pytest.approx(reference.statistic, rel=1e-10)
+    assert result.p == pytest.approx(expected_p, rel=1e-9)
+
+
+@pytest.mark.parametrize("equal_var", [True, False])
+def test_independent_matches_scipy(equal_var):
+    rng = np.random.default_rng(4)
+    group1, group2 = rng.normal(size=70), rng.normal(0.5, 2, size=45)
+    online = OnlineIndependentTTest(equal_var=equal_var)
+    online.update(group1=group1[:20])
+    online.update(group1=group1[20:], group2=group2)
+    result = online.result()
+
+    reference = stats.ttest_ind(group1, group2, equal_var=equal_var)
+    assert result.t_stat == pytest.approx(reference.statistic, rel=1e-10)
+    assert result.p == pytest.approx(reference.pvalue, rel=1e-9)
+
+
+def test_not_enough_data_and_mismatched_batches():
+    assert OnlinePairedTTest().update([1.0], [2.0]).result().error is not None
+    with pytest.raises(ValueError):
+        OnlinePairedTTest().update([1.0, 2.0], [1.0])
@@ -0,0 +1,211 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from stats.tools.t_test import ttest_resample
+from stats.tools.t_test.ttest_resample import (
+    bootstrap_ci_independent, bootstrap_ci_paired, exact_sign_flip_test, format_resampling,
+    permutation_test_independent, permutation_test_paired, resample_independent, resample_paired, scaled_resamples
+)
+
+# ----------------------------------------------------------------
+# 재표집 엔진
+# - Gray-code 정확 부호 뒤집기 검정 ↔ 2^n가지 부호 조합 전수 계산
+# - 같은 seed면 n_jobs(프로세스 수)와 관계없이 같은 결과
+# - 프로세스 풀 재사용, 요청한 재표집 수 유지 / 지정한 경우의 부분 표본·재표집 수 축소, 청크 단위 취소
+# ----------------------------------------------------------------
+
+
+def _brute_force_p(diff, tail):
+    signs = np.array(list(itertools.product((1.0, -1.0), repeat=len(diff))))
+    sums = signs @ diff
+    observed = diff.sum()
+    tolerance = 1e-10 * max(np.abs(diff).sum(), 1.0)
+    if tail == "two":
+        extreme = np.abs(sums) >= abs(observed) - tolerance
+    elif observed >= 0:
+        extreme = sums >= observed - tolerance
+    else:
+        extreme = sums <= observed + tolerance
+    return np.count_nonzero(extreme) / len(sums)
+
+
+@pytest.mark.parametrize("tail", ["two", "one"])
+@pytest.mark.parametrize("n", [1, 2, 5, 9, 12])
+def test_exact_sign_flip_matches_brute_force(n, tail, monkeypatch):
+    # 작은 청크로 청크 경계(첫 합계 재계산)도 지나가게 함
+    monkeypatch.setattr(ttest_resample, "GRAY_CHUNK", 64)
+    rng = np.random.default_rng(n)
+    before = rng.normal(size=n)
+    after = before + rng.normal(0.4, 1, size=n)
+    result = exact_sign_flip_test(before, after, tail)
+    assert result["p"] == pytest.approx(_brute_force_p(after - before, tail), abs=1e-15)
+    assert result["n_resamples"] == 2 ** n
+
+
+def test_exact_sign_flip_with_ties():
+    # 같은 크기의 차이값 → 관측값과 같은 합계가 많음 (허용오차로 모두 포함)
+    before = np.zeros(10)
+    after = np.array([0.1, -0.1, 0.1, 0.2, -0.2, 0.1, 0.3, -0.1, 0.2, 0.1])
+    for tail in ("two", "one"):
+        assert exact_sign_flip_test(before, after, tail)["p"] == pytest.approx(_brute_force_p(after, tail))
+
+
+def test_exact_sign_flip_rejects_empty():
+    with pytest.raises(ValueError):
+        exact_sign_flip_test([], [])
+
+# ----------------------------
+# 1. seed 재현성 / 프로세스 풀
+# ----------------------------
+
+N_RESAMPLES = 3 * ttest_resample.CHUNK_SIZE + 17  # 청크 여러 개 + 짧은 마지막 청크
+
+
+@pytest.fixture(scope="module", autouse=True)
+def stop_pool():
+    yield
+    ttest_resample.shutdown_pool()
+
+
+@pytest.fixture
+def force_pool(monkeypatch):
+    # 작은 입력도 프로세스 풀로 보냄
+    monkeypatch.setattr(ttest_resample, "POOL_MIN_WORK", 0)
+
+
+@pytest.fixture(scope="module")
+def paired_data():
+    rng = np.random.default_rng(7)
+    before = rng.normal(size=60)
+    return before, before + rng.normal(0.2, 1, size=60)
+
+
+@pytest.fixture(scope="module")
+def independent_data():
+    rng = np.random.default_rng(8)
+    return rng.normal(size=40), rng.normal(0.3, 2, size=55)
+
+
+def test_paired_results_do_not_depend_on_n_jobs(paired_data, force_pool):
+    before, after = paired_data
+    serial = permutation_test_paired(before, after, N_RESAMPLES, seed=123, n_jobs=1)
+    pooled = permutation_test_paired(before, after, N_RESAMPLES, seed=123, n_jobs=2)
+    assert serial["p"] == pooled["p"]
+
+    serial = bootstrap_ci_paired(before, after, N_RESAMPLES, seed=123, n_jobs=1)
+    pooled = bootstrap_ci_paired(before, after, N_RESAMPLES, seed=123, n_jobs=2)
+    assert serial["mean_diff_ci"] == pooled["mean_diff_ci"]
+    assert serial["cohen_d_ci"] == pooled["cohen_d_ci"]
+
+
+def test_independent_results_do_not_depend_on_n_jobs(independent_data, force_pool):
+    group1, group2 = independent_data
+    serial = permutation_test_independent(group1, group2, N_RESAMPLES, seed=5, n_jobs=1)
+    pooled = permutation_test_independent(group1, group2, N_RESAMPLES, seed=5, n_jobs=2)
+    assert serial["p"] == pooled["p"]
+
+    serial = bootstrap_ci_independent(group1, group2, N_RESAMPLES, seed=5, n_jobs=1)
+    pooled = bootstrap_ci_independent(group1, group2, N_RESAMPLES, seed=5, n_jobs=2)
+    assert serial["mean_diff_ci"] == pooled["mean_diff_ci"]
+    assert serial["cohen_d_ci"] == pooled["cohen_d_ci"]
+
+
+def test_pool_is_reused_with_spawn_context(paired_data, force_pool):
+    before, after = paired_data
+    permutation_test_paired(before, after, N_RESAMPLES, seed=1, n_jobs=2)
+    executor = ttest_resample._pool["executor"]
+    permutation_test_paired(before, after, N_RESAMPLES, seed=2, n_jobs=2)
+    assert ttest_resample._pool["executor"] is executor
+    assert executor._mp_context.get_start_method() == "spawn"
+
+
+def test_small_work_runs_in_process(paired_data):
+    before, after = paired_data
+    ttest_resample.shutdown_pool()
+    permutation_test_paired(before, after, N_RESAMPLES, seed=1, n_jobs=2)
+    assert ttest_resample._pool["executor"] is None
+
+
+def test_same_seed_same_result_and_different_seed_differs(paired_data):
+    before, after = paired_data
+    first = bootstrap_ci_paired(before, after, 2000, seed=1)
+    assert bootstrap_ci_paired(before, after, 2000, seed=1) == first
+    assert bootstrap_ci_paired(before, after, 2000, seed=2)["mean_diff_ci"] != first["mean_diff_ci"]
+
+# ----------------------------
+# 2. 대용량 입력 제한 (지정할 때만)
+# ----------------------------
+
+def test_scaled_resamples():
+    budget = ttest_resample.RESAMPLE_BUDGET
+    assert scaled_resamples(10 ** 9, 10000) == 10000
+    assert scaled_resamples(100, 10000, budget) == 10000
+    assert scaled_resamples(budget // 2000, 10000, budget) == 2000
+    assert scaled_resamples(10 ** 9, 10000, budget) == ttest_resample.MIN_RESAMPLES
+    assert scaled_resamples(10 ** 9, 500, budget) == 500
+
+
+def test_resampling_honours_request_by_default():
+    rng = np.random.default_rng(11)
+    before = rng.normal(size=5000)
+    after = before + rng.normal(0.1, 1, size=5000)
+    result = resample_paired(before, after, n_resamples=20000, seed=3)
+    assert result["permutation"]["n_resamples"] == 20000
+    assert result["bootstrap"]["n_resamples"] == 20000
+    assert "subsample" not in result and "reduced_resamples" not in result
+
+
+def test_reduced_resamples_are_reported():
+    rng = np.random.default_rng(12)
+    before = rng.normal(size=4000)
+    after = before + rng.normal(0.1, 1, size=4000)
+    result = resample_paired(before, after, n_resamples=5000, seed=3, budget=4000 * 2000)
+    assert result["reduced_resamples"] == {"n": 2000, "requested": 5000}
+    assert result["bootstrap"]["n_resamples"] == 2000
+    assert "Resample count reduced from 5,000 to 2,000" in format_resampling(result)
+
+
+def test_resample_paired_subsamples_large_input():
+    rng = np.random.default_rng(9)
+    before = rng.normal(size=5000)
+    after = before + rng.normal(0.1, 1, size=5000)
+    result = resample_paired(before, after, n_resamples=1000, seed=3, max_n=800)
+    assert result["subsample"] == {"n": 800, "of": 5000}
+    assert resample_paired(before, after, n_resamples=1000, seed=3, max_n=800) == result
+    assert "random subsample of 800 of 5,000" in format_resampling(result)
+    assert "subsample" not in resample_paired(before[:50], after[:50], n_resamples=1000, seed=3, max_n=800)
+
+
+def test_resample_independent_keeps_group_proportions():
+    rng = np.random.default_rng(10)
+    result = resample_independent(rng.normal(size=3000), rng.normal(size=1000), n_resamples=1000, seed=4, max_n=400)
+    assert result["subsample"] == {"n": 400, "of": 4000}
+
+# ----------------------------
+# 3. 취소
+# ----------------------------
+
+class Cancelled(Exception):
+    pass
+
+
+def _cancel():
+    raise Cancelled
+
+
+def test_cancel_stops_in_process_resampling(paired_data):
+    before, after = paired_data
+    with pytest.raises(Cancelled):
+        permutation_test_paired(before, after, N_RESAMPLES, seed=1, n_jobs=1, cancel=_cancel)
+
+
+def test_cancel_stops_pool_and_pool_stays_usable(paired_data, force_pool):
+    before, after = paired_data
+    with pytest.raises(Cancelled):
+        permutation_test_paired(before, after, N_RESAMPLES, seed=1, n_jobs=2, cancel=_cancel)
+    assert not ttest_resample._pool_lock.locked()
+
+    expected = permutation_test_paired(before, after, N_RESAMPLES, seed=1, n_jobs=1)
+    assert permutation_test_paired(before, after, N_RESAMPLES, seed=1, n_jobs=2)["p"] == expected["p"]
@@ -0,0 +1,46 @@
+from collections import OrderedDict
+
+# ----------------------------------------------------------------
+# 경로별 화면(ft.View) 캐시
+# - 한 번 만든 View 트리를 경로 이름으로 보관했다가 다시 이동할 때 그대로 재사용
+#   → 입력한 값, 테이블 편집 상태(TableEditorState) 등이 유지되고 컨트롤을 다시 만들지 않음
+# - 최대 개수를 넘으면 가장 오래 쓰지 않은 화면부터 제거 (LRU)
+# - 화면을 새로 만들어야 할 때는 invalidate(route) 호출 → 다음 이동 때 다시 생성
+# - View는 만든 page에 묶여 있으므로 캐시는 세션(page)마다 하나씩 (main(page)에서 생성)
+#   → 웹 모드나 창 여러 개에서 다른 세션의 화면을 재사용하지 않음
+# ----------------------------------------------------------------
+
+MAX_CACHED_VIEWS = 8
+
+
+class ViewCache:
+    def __init__(self, max_views=MAX_CACHED_VIEWS):
+        self.max_views = max_views
+        self._views = OrderedDict()  # 경로 → ft.View
+
+    # 캐시에 있으면 반환, 없으면 build()로 만들어서 저장
+    def get_or_build(self, route, build):
+        view = self._views.get(route)
+        if view is not None:
+            self._views.move_to_end(route)
+            return view
+
+        view = build()
+        self._views[route] = view
+        while len(self._views) > self.max_views:
+            self._views.popitem(last=False)
+        return view
+
+    # route=None이면 전체 제거
+    def invalidate(self, route=None):
+        if route is None:
+            self._views.clear()
+        else:
+            self._views.pop(route, None)
+
+    def __contains__(self, route):
+        return route in self._views
+
+    def __len__(self):
+        return len(self._views)
+